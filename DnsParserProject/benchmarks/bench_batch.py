@@ -0,0 +1,42 @@
+"""Замер пакетного разбора страницы.
+
+Сравнивает построчный вызов data_dict_creator с DataParser.parse_batch,
+который применяет каждый шаблон один раз ко всему столбцу названий.
+
+Запуск из корня проекта: python -m benchmarks.bench_batch
+"""
+import time
+
+from benchmarks.bench_parsers import SAMPLES
+
+
+def row_by_row(parser, names, prices, hrefs):
+    return [result for result in (parser.data_dict_creator([name, price, href])
+                                  for name, price, href in zip(names, prices, hrefs)) if result]
+
+
+def batch(parser, names, prices, hrefs):
+    return parser.parse_batch(names, prices, hrefs).to_dict('records')
+
+
+def measure(func, parser, columns, repeats):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        func(parser, *columns)
+    return (time.perf_counter() - started) / repeats
+
+
+def main(rows=5000, repeats=5):
+    print(f"{'Парсер':<26}{'построчно, мс':>15}{'пакетно, мс':>14}{'ускорение':>11}")
+    for parser, text in SAMPLES.items():
+        # Названия различаются, чтобы не измерять выигрыш от повторяющихся строк
+        title_end = text.index('[')
+        names = [f"{text[:title_end]}v{i} {text[title_end:]}" for i in range(rows)]
+        columns = (names, [str(1000 + i) for i in range(rows)], [f"/product/{i}/" for i in range(rows)])
+        legacy = measure(row_by_row, parser, columns, repeats)
+        vectorized = measure(batch, parser, columns, repeats)
+        print(f"{parser.__name__:<26}{legacy * 1e3:>15.1f}{vectorized * 1e3:>14.1f}{legacy / vectorized:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
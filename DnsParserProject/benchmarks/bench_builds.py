@@ -0,0 +1,73 @@
+"""Замер поиска сборок в пределах бюджета.
+
+Строит синтетические каталоги размером с полный обход DNS и измеряет
+BuildOptimizer.best_builds для нескольких бюджетов и top_k.
+
+Запуск из корня проекта: python -m benchmarks.bench_builds
+"""
+import random
+import time
+
+from src.core.build_optimizer import BuildOptimizer
+
+PLATFORMS = [('LGA 1700', 'Intel B760', 'DDR4'), ('LGA 1700', 'Intel Z790', 'DDR5'),
+             ('N/A', 'AMD B550', 'DDR4'), ('N/A', 'AMD B650', 'DDR5'), ('LGA 1200', 'Intel H510', 'DDR4')]
+
+
+def make_catalogs(rng, cpus=400, boards=1500, rams=2500, gpus=1500, coolers=800, liquid=400):
+    price = lambda low, high: str(rng.randint(low, high) * 100)
+    cpu = [{'Название': f'CPU {i}', 'Цена': price(50, 600), 'Ссылка': f'/cpu/{i}/',
+            'Сокет': rng.choice(['LGA 1700', 'LGA 1200', 'AM4', 'AM5']),
+            'Количество ядер': rng.choice([4, 6, 8, 12, 16]), 'Частота (ГГц)': rng.choice([2.5, 3.5, 4.2]),
+            'Кэш L2 (МБ)': rng.choice([1.0, 3.0, 7.5]), 'Кэш L3 (МБ)': rng.choice([8.0, 32.0]),
+            'Количество каналов памяти': 2, 'Графика': rng.choice(['Нет', 'Intel UHD Graphics 730']),
+            'TDP (Вт)': rng.choice([65, 105, 125, 170])} for i in range(cpus)]
+    motherboard = []
+    for i in range(boards):
+        socket, chipset, ddr = rng.choice(PLATFORMS)
+        motherboard.append({'Название': f'Board {i}', 'Цена': price(60, 400), 'Ссылка': f'/mb/{i}/',
+                            'Сокет': socket, 'Чипсет': chipset, 'Количество слотов памяти': rng.choice([2, 4]),
+                            'Тип слотов памяти': ddr, 'Частота слотов памяти': rng.choice(['3200 МГц', '6400 МГц']),
+                            'Форм-фактор': rng.choice(['ATX', 'Micro-ATX', 'Mini-ITX']),
+                            'Количество слотов PCI-E': rng.choice([1, 2, 3]), 'Версия слотов PCI-E': 'x16'})
+    ram = [{'Название': f'RAM {i}', 'Цена': price(20, 300), 'Ссылка': f'/ram/{i}/',
+            'Общий объем (ГБ)': rng.choice([8.0, 16.0, 32.0]), 'Тип памяти': rng.choice(['DDR4', 'DDR5']),
+            'Размер модуля (ГБ)': 8.0, 'Количество модулей': rng.choice([1, 2]),
+            'Частота (МГц)': rng.choice([3200, 3600, 6000]), 'Тайминги': '16-18-18-36',
+            'Латентность (CL)': rng.choice(['16', '30'])} for i in range(rams)]
+    gpu = [{'Название': f'GPU {i}', 'Цена': price(100, 2000), 'Ссылка': f'/gpu/{i}/',
+            'Объем памяти (ГБ)': rng.choice([4.0, 8.0, 12.0, 16.0]), 'Тип памяти': rng.choice(['GDDR6', 'GDDR6X']),
+            'Шина памяти (бит)': rng.choice([128, 192, 256]), 'Частота GPU (МГц)': rng.randint(1200, 2600),
+            'Версия PCIe': rng.choice(['3.0', '4.0']), 'Разъемы': 'HDMI, DisplayPort'} for i in range(gpus)]
+    cpu_cooler = [{'Название': f'Cooler {i}', 'Цена': price(10, 150), 'Ссылка': f'/cooler/{i}/',
+                   'Материал основания': 'Медь', 'Скорость вращения': f'{rng.randint(1200, 2500)} об/мин',
+                   'Уровень шума': f'{rng.randint(20, 40)} дБ', 'Разъем питания': '4 pin',
+                   'Макс. TDP': rng.choice(['95 Вт', '150 Вт', '220 Вт']), 'Размер вентилятора': '120 мм'}
+                  for i in range(coolers)]
+    cooling_system = [{'Название': f'AIO {i}', 'Цена': price(30, 400), 'Ссылка': f'/aio/{i}/',
+                       'Размер вентилятора(ов)': '120 мм', 'Количество секций': rng.choice(['1', '2', '3']),
+                       'Количество вентиляторов': rng.choice(['1', '2', '3']), 'Питание': 'PWM',
+                       'TDP': rng.choice(['250 Вт', '300 Вт'])} for i in range(liquid)]
+    return {'cpu': cpu, 'motherboard': motherboard, 'ram': ram, 'gpu': gpu,
+            'cpu_cooler': cpu_cooler, 'cooling_system': cooling_system}
+
+
+def main():
+    catalogs = make_catalogs(random.Random(1))
+    started = time.perf_counter()
+    optimizer = BuildOptimizer(catalogs)
+    print(f"Подготовка каталогов: {(time.perf_counter() - started) * 1e3:.0f} мс, "
+          f"{sum(len(items) for items in catalogs.values())} товаров")
+
+    print(f"{'Бюджет':>10}{'top_k':>7}{'время, мс':>11}{'оценка':>9}{'цена':>10}")
+    for budget in (60000, 120000, 250000):
+        for top_k in (1, 5, 20):
+            started = time.perf_counter()
+            builds = optimizer.best_builds(budget, top_k)
+            elapsed = time.perf_counter() - started
+            best = builds[0] if builds else {'total_score': 0, 'total_price': 0}
+            print(f"{budget:>10}{top_k:>7}{elapsed * 1e3:>11.1f}{best['total_score']:>9}{best['total_price']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Отсев повторов товаров (dedup.py): точное множество и фильтр Блума.
+
+Обход 200 000 товаров страницами по 20, каждая пятая страница повторяет предыдущую
+(пересечение диапазонов p= и «Показать ещё»). Замеряются скорость filter_page, число
+отброшенных товаров, размер фильтра Блума на диске и доля ложных срабатываний
+на новых ключах после повторного обхода.
+
+Запуск из корня проекта: python -m benchmarks.bench_dedup
+"""
+import os
+import tempfile
+import time
+
+from src.core.dedup import BloomFilter, Deduplicator
+
+
+def make_pages(products=200000, page_size=20):
+    pages = []
+    for start in range(0, products, page_size):
+        hrefs = [f"https://www.dns-shop.ru/product/{i:08x}abcd/tovar-{i}/" for i in range(start, start + page_size)]
+        page = [[f"Товар {i}" for i in range(start, start + page_size)], ['1 000'] * page_size, hrefs]
+        pages.append(page)
+        if len(pages) % 5 == 0:
+            pages.append(page)
+    return pages
+
+
+def run(deduplicator, pages):
+    started = time.perf_counter()
+    kept = sum(len(deduplicator.filter_page('ram', page)[2]) for page in pages)
+    return kept, time.perf_counter() - started
+
+
+def main():
+    pages = make_pages()
+    total = sum(len(page[2]) for page in pages)
+    print(f"Страниц: {len(pages)}, товаров со страниц: {total}")
+
+    kept, elapsed = run(Deduplicator(), pages)
+    print(f"Точное множество: осталось {kept}, {total / elapsed:,.0f} товаров/с")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'seen.bloom')
+        first = Deduplicator(bloom_path=path, expected_items=1000000, error_rate=0.001)
+        kept, elapsed = run(first, pages)
+        first.save()
+        print(f"С фильтром Блума: осталось {kept}, {total / elapsed:,.0f} товаров/с, "
+              f"файл {os.path.getsize(path) / 2 ** 20:.2f} МБ")
+
+        second = Deduplicator(bloom_path=path)
+        kept, _ = run(second, pages)
+        print(f"Повторный обход: осталось {kept}, отброшено как известные {second.stats()['dropped_known']}")
+
+        bloom = BloomFilter.load(path)
+        probes = 100000
+        false_hits = sum(f"ram:{i:08x}ffff" in bloom for i in range(probes))
+        print(f"Ложные срабатывания на новых ключах: {false_hits / probes:.3%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Замер выгрузки каталога: ExcelDataSaver против ParquetDataSaver.
+
+Печатает время записи, пик памяти (tracemalloc), размер файла и время чтения обратно.
+
+Запуск из корня проекта: python -m benchmarks.bench_parquet
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.bench_sql_saver import make_rows
+from src.storage.saver import ExcelDataSaver, ParquetDataSaver
+
+
+def measure(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def main(count=50000):
+    rows = make_rows(count, random.Random(1))
+    with tempfile.TemporaryDirectory() as directory:
+        excel_name = os.path.join(directory, 'ram')
+        parquet_directory = os.path.join(directory, 'catalog')
+
+        _, excel_time, excel_peak = measure(lambda: ExcelDataSaver.save_data(rows, excel_name))
+        _, parquet_time, parquet_peak = measure(lambda: ParquetDataSaver.save_data(rows, 'ram', parquet_directory))
+
+        started = time.perf_counter()
+        pd.read_excel(f"{excel_name}.xlsx")
+        excel_read = time.perf_counter() - started
+        started = time.perf_counter()
+        ParquetDataSaver.load('ram', parquet_directory)
+        parquet_read = time.perf_counter() - started
+
+        print(f"{'Формат':<9}{'запись, с':>11}{'пик, МБ':>10}{'файл, МБ':>10}{'чтение, с':>11}")
+        print(f"{'xlsx':<9}{excel_time:>11.2f}{excel_peak / 2 ** 20:>10.1f}"
+              f"{os.path.getsize(f'{excel_name}.xlsx') / 2 ** 20:>10.2f}{excel_read:>11.2f}")
+        print(f"{'parquet':<9}{parquet_time:>11.2f}{parquet_peak / 2 ** 20:>10.1f}"
+              f"{directory_size(parquet_directory) / 2 ** 20:>10.2f}{parquet_read:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Разбор страниц в потоках браузеров против стадии разбора в пуле процессов (parse_stage.py).
+
+Несколько потоков-«браузеров» отдают страницы по 20 товаров с неповторяющимися названиями:
+в первом случае каждый поток разбирает свою страницу сам, во втором только передает ее
+в ParseStage. Замеряется число страниц в секунду и сверяются результаты.
+Выигрыш растет с числом ядер: при одном ядре процессы только добавляют передачу данных.
+
+Запуск из корня проекта: python -m benchmarks.bench_parse_stage
+"""
+import os
+import threading
+import time
+
+from benchmarks.bench_parsers import SAMPLES
+from src.core.parse_cache import ParseCache
+from src.core.parse_stage import ParseStage
+from src.core.parser import ParserFactory
+
+COMPONENTS = ('ram', 'motherboard', 'cpu_cooler', 'cooling_system', 'cpu', 'gpu')
+
+
+def make_pages(pages_per_component=150, page_size=20):
+    pages = []
+    for component in COMPONENTS:
+        text = SAMPLES[ParserFactory.get_parser(component)]
+        title_end = text.index('[')
+        for page in range(pages_per_component):
+            ids = range(page * page_size, (page + 1) * page_size)
+            pages.append((component, f"{component}?p={page + 1}", [
+                [f"{text[:title_end]}v{i} {text[title_end:]}" for i in ids],
+                [f"{1000 + i} ₽" for i in ids],
+                [f"/product/{i:08x}/" for i in ids],
+            ]))
+    return pages
+
+
+def run_threads(pages, browsers, handle):
+    """browsers потоков обрабатывают страницы из общего списка функцией handle"""
+    iterator = iter(pages)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                item = next(iterator, None)
+            if item is None:
+                return
+            handle(*item)
+
+    threads = [threading.Thread(target=worker) for _ in range(browsers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def main(browsers=3):
+    pages = make_pages()
+    print(f"Страниц: {len(pages)}, потоков браузеров: {browsers}, ядер: {os.cpu_count()}")
+
+    inline, lock = {}, threading.Lock()
+    cache = ParseCache()
+
+    def parse_inline(component, url, data):
+        products = [product for product in cache.parse_page(component, data) if product]
+        with lock:
+            inline[url] = products
+
+    elapsed = run_threads(pages, browsers, parse_inline)
+    print(f"{'в потоках браузеров':<28}{len(pages) / elapsed:>8.0f} стр/с")
+
+    for processes in sorted({1, 2, os.cpu_count() or 1}):
+        staged = {}
+        stage = ParseStage(processes=processes, chunk_size=200)
+        stage.start(on_page=lambda component, url, products: staged.__setitem__(url, products))
+        # Первый пакет запускает процессы: прогрев не входит в замер
+        stage.submit(*pages[0])
+        stage.join()
+
+        started = time.perf_counter()
+        run_threads(pages, browsers, stage.submit)
+        stage.join()
+        elapsed = time.perf_counter() - started
+        stage.close()
+        same = all(staged[url] == inline[url] for _, url, _ in pages)
+        print(f"{f'пул процессов ({processes})':<28}{len(pages) / elapsed:>8.0f} стр/с  "
+              f"совпадает: {same}  {stage.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Замер скорости извлечения характеристик.
+
+Сравнивает заранее скомпилированные поля SpecExtractor с прежним подходом,
+когда каждый вызов data_dict_creator передавал в re.search строку шаблона.
+
+Запуск из корня проекта: python -m benchmarks.bench_parsers
+"""
+import re
+import time
+
+from src.core.models import (
+    RamDataParser, MotherboardDataParser, CpuCoolerDataParser,
+    CoolingSystemDataParser, CpuDataParser, GpuDataParser
+)
+
+SAMPLES = {
+    RamDataParser: 'Оперативная память Kingston FURY Beast Black [KF432C16BBK2/16] 16 ГБ '
+                   '[DDR4, 8 ГБx2 шт, 3200 МГц, 16(CL)-18-18-36]',
+    MotherboardDataParser: 'Материнская плата MSI PRO B760M-E DDR4 [LGA 1700, Intel B760, 2xDDR4-3200 МГц, '
+                           '1xPCI-Ex16, 1xM.2, Micro-ATX]',
+    CpuCoolerDataParser: 'Кулер для процессора DEEPCOOL AG400 [R-AG400-BKNNMN-G-1] [основание - медь, '
+                         '2000 об/мин, 29.4 дБ, 4 pin, 220 Вт, 120 мм]',
+    CoolingSystemDataParser: 'Система охлаждения DEEPCOOL LE360 [R-LE360-BKAMMN-G-1] [120 мм, 3 вентилятор, '
+                             '3 pin, радиатор - алюминий, TDP 300 Вт]',
+    CpuDataParser: 'Процессор AMD Ryzen 5 5600 OEM [AM4, 6 x 3.5 ГГц, L2 - 3 МБ, L3 - 32 МБ, '
+                   '2 х DDR4-3200 МГц, TDP 65 Вт]',
+    GpuDataParser: 'Видеокарта MSI GeForce RTX 4060 VENTUS 2X BLACK OC [RTX 4060 VENTUS 2X BLACK 8G OC] '
+                   '[PCIe 4.0 8 ГБ GDDR6, 128 бит, 3 x DisplayPort, HDMI, GPU 1830 МГц]',
+}
+CONNECTOR_PATTERNS = {
+    "DVI": r"DVI[- ]?[ID]?",
+    "HDMI": r"HDMI",
+    "VGA": r"VGA|D-Sub",
+    "DisplayPort": r"DisplayPort|DP"
+}
+
+
+def legacy_extract(parser, text):
+    """Прежний порядок работы: все поля через re.search со строкой шаблона"""
+    for alternatives in parser.FIELDS.patterns.values():
+        for pattern in alternatives:
+            if re.search(pattern.pattern, text, pattern.flags):
+                break
+    re.match(r'^(.*?)(?:\s*\[|$)', text)
+    if parser is GpuDataParser:
+        for pattern in CONNECTOR_PATTERNS.values():
+            re.search(pattern, text, re.IGNORECASE)
+
+
+def engine_extract(parser, text):
+    parser.FIELDS.extract(text)
+    parser._title(text)
+    if parser is GpuDataParser:
+        parser.extract_connectors(text)
+
+
+def measure(func, parser, text, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(parser, text)
+    return time.perf_counter() - started
+
+
+def main(iterations=20000):
+    print(f"{'Парсер':<26}{'прежний, мкс':>14}{'движок, мкс':>14}{'ускорение':>11}")
+    for parser, text in SAMPLES.items():
+        legacy = measure(legacy_extract, parser, text, iterations)
+        engine = measure(engine_extract, parser, text, iterations)
+        print(f"{parser.__name__:<26}{legacy / iterations * 1e6:>14.2f}{engine / iterations * 1e6:>14.2f}"
+              f"{legacy / engine:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Замер памяти: словари парсера против типизированных записей (records.py).
+
+Для каждого парсера разбирается 100 000 различающихся названий, затем измеряется
+память списка словарей и списка записей (tracemalloc, только сами контейнеры).
+
+Запуск из корня проекта: python -m benchmarks.bench_records
+"""
+import gc
+import tracemalloc
+
+from benchmarks.bench_parsers import SAMPLES
+
+
+def footprint(build):
+    """Объем памяти, занятый результатом build()"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main(rows=100000):
+    print(f"{'Парсер':<26}{'словари, МБ':>13}{'записи, МБ':>12}{'экономия':>10}")
+    for parser, text in SAMPLES.items():
+        title_end = text.index('[')
+        names = [f"{text[:title_end]}v{i} {text[title_end:]}" for i in range(rows)]
+        prices = [f"{1000 + i % 50000} ₽" for i in range(rows)]
+        hrefs = [f"/product/{i:08x}/" for i in range(rows)]
+
+        # Как после обхода: словари и записи строятся из одной и той же разобранной таблицы
+        frame = parser.parse_batch(names, prices, hrefs)
+        dicts, dict_size = footprint(lambda: frame.to_dict('records'))
+        records, record_size = footprint(lambda: parser.RECORD.from_dicts(dicts))
+        print(f"{parser.__name__:<26}{dict_size / 2 ** 20:>13.1f}{record_size / 2 ** 20:>12.1f}"
+              f"{1 - record_size / dict_size:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Замер оценки целого каталога.
+
+Сравнивает построчные ComponentScorer.score_cpu / score_gpu с ComponentScorer.score_frame
+и проверяет, что оценки совпадают.
+
+Запуск из корня проекта: python -m benchmarks.bench_scoring
+"""
+import random
+import time
+
+import pandas as pd
+
+from src.core.models import ComponentScorer
+
+GENERATORS = {
+    'cpu': lambda: {
+        'Количество ядер': random.randint(1, 32),
+        'Частота (ГГц)': round(random.uniform(1.5, 6), 1),
+        'Кэш L2 (МБ)': random.choice([1.0, 3.0, 7.5, 12.0]),
+        'Кэш L3 (МБ)': random.choice([8.0, 32.0, 96.0]),
+        'Количество каналов памяти': random.choice([1, 2, 4]),
+        'Графика': random.choice(['Нет', 'AMD Radeon Graphics']),
+        'TDP (Вт)': random.randint(35, 300),
+    },
+    'gpu': lambda: {
+        'Объем памяти (ГБ)': random.choice([4.0, 8.0, 12.0, 16.0, 24.0]),
+        'Тип памяти': random.choice(['GDDR5', 'GDDR6', 'GDDR6X']),
+        'Шина памяти (бит)': random.choice([64, 128, 192, 256, 384]),
+        'Частота GPU (МГц)': random.randint(1200, 2700),
+        'Версия PCIe': random.choice(['3.0', '4.0', '5.0']),
+        'Разъемы': random.choice(['HDMI', 'HDMI, DisplayPort', 'DVI, HDMI, DisplayPort']),
+    },
+}
+
+
+def main(rows=50000):
+    scorer = ComponentScorer()
+    print(f"{'Компонент':<12}{'построчно, мс':>15}{'по столбцам, мс':>17}{'ускорение':>11}")
+    for component, generate in GENERATORS.items():
+        specs = [generate() for _ in range(rows)]
+        frame = pd.DataFrame(specs)
+        score_one = getattr(scorer, f"score_{component}")
+
+        started = time.perf_counter()
+        expected = [score_one(item) for item in specs]
+        scalar = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scores = scorer.score_frame(component, frame)
+        vectorized = time.perf_counter() - started
+
+        assert expected == scores.tolist(), f"Оценки {component} расходятся"
+        print(f"{component:<12}{scalar * 1e3:>15.1f}{vectorized * 1e3:>17.1f}{scalar / vectorized:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Замер записи каталога в SQLite.
+
+Сравнивает прежнюю построчную вставку (отдельный INSERT и execute на каждую строку,
+все столбцы TEXT) с SQLDataSaver.save_data: executemany в одной транзакции, WAL.
+Для режима upsert замеряется первая запись и повторный запуск по неизменному каталогу.
+
+Запуск из корня проекта: python -m benchmarks.bench_sql_saver
+"""
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from src.storage.saver import SQLDataSaver
+
+
+def make_rows(count, rng):
+    return [{
+        "Название": f"Оперативная память Model {i}",
+        "Цена": str(rng.randint(1000, 30000)),
+        "Ссылка": f"/product/{i:08x}/",
+        "Общий объем (ГБ)": rng.choice([8.0, 16.0, 32.0]),
+        "Тип памяти": rng.choice(["DDR4", "DDR5"]),
+        "Размер модуля (ГБ)": rng.choice([8.0, 16.0]),
+        "Количество модулей": rng.choice([1, 2, "N/A"]),
+        "Частота (МГц)": rng.choice([3200, 3600, 6000]),
+        "Тайминги": "16-18-18-36",
+        "Латентность (CL)": rng.choice(["16", "30", "N/A"]),
+    } for i in range(count)]
+
+
+def legacy_save(rows, table_name, db_path):
+    """Прежний порядок работы SQLDataSaver.save_data"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    cursor.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({", ".join(f"{chr(34)}{c}{chr(34)} TEXT" for c in columns)})')
+    for d in rows:
+        placeholders = ', '.join(['?'] * len(columns))
+        values = [str(d.get(col, '')) for col in columns]
+        insert_query = f"""
+            INSERT INTO "{table_name}" ({', '.join(f'"{col}"' for col in columns)})
+            VALUES ({placeholders})
+        """
+        cursor.execute(insert_query, values)
+    conn.commit()
+    conn.close()
+
+
+def main(count=100000):
+    rows = make_rows(count, random.Random(1))
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        upsert_path = os.path.join(directory, "upsert.sqlite3")
+        cases = (
+            ('построчно', legacy_save),
+            ('пакетно', lambda r, t, p: SQLDataSaver.save_data(r, t, p)),
+            ('upsert', lambda r, t, p: SQLDataSaver.upsert_data(r, t, upsert_path)),
+            ('upsert 2', lambda r, t, p: SQLDataSaver.upsert_data(r, t, upsert_path)),
+        )
+        for name, save in cases:
+            db_path = os.path.join(directory, f"{name}.sqlite3")
+            started = time.perf_counter()
+            save(rows, 'ram', db_path)
+            results[name] = time.perf_counter() - started
+
+    print(f"{'Способ':<12}{'время, с':>10}{'строк/с':>12}")
+    for name, elapsed in results.items():
+        print(f"{name:<12}{elapsed:>10.2f}{count / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
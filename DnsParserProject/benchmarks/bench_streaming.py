@@ -0,0 +1,85 @@
+"""Замер потоковой записи страниц.
+
+Сравнивает прежний порядок (все товары копятся в памяти, запись в SQLite после обхода)
+с StreamingWriter: страницы пишутся пакетами по мере готовности. Несколько потоков
+имитируют парсинг страниц; печатаются время, пик памяти (tracemalloc) и время,
+которое парсеры провели в ожидании места в очереди.
+
+Запуск из корня проекта: python -m benchmarks.bench_streaming
+"""
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from benchmarks.bench_sql_saver import make_rows
+from src.storage.saver import SQLDataSaver
+from src.storage.sink import SQLiteSink, StreamingWriter
+
+PAGE_SIZE = 18
+
+
+def make_pages(count, rng):
+    rows = make_rows(count * PAGE_SIZE, rng)
+    return [rows[i:i + PAGE_SIZE] for i in range(0, len(rows), PAGE_SIZE)]
+
+
+def crawl(pages, workers, handle):
+    """Потоки разбирают страницы и передают товары в handle"""
+    lock = threading.Lock()
+    remaining = iter(range(len(pages)))
+
+    def worker():
+        while True:
+            with lock:
+                index = next(remaining, None)
+            if index is None:
+                return
+            # Товары создаются заново, как после разбора страницы
+            handle([dict(row) for row in pages[index]])
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_in_memory(pages, db_path):
+    collected = []
+    lock = threading.Lock()
+
+    def handle(products):
+        with lock:
+            collected.extend(products)
+
+    crawl(pages, 4, handle)
+    SQLDataSaver.save_data(collected, 'ram', db_path)
+    return {}
+
+
+def run_streaming(pages, db_path):
+    writer = StreamingWriter(SQLiteSink(db_path), max_queue=32, batch_rows=2000).start()
+    crawl(pages, 4, lambda products: writer.put('ram', products))
+    writer.close()
+    return writer.stats()
+
+
+def main(page_count=5000):
+    pages = make_pages(page_count, random.Random(1))
+    # Исходные страницы не входят в замер памяти
+    for name, run in (('в памяти', run_in_memory), ('потоково', run_streaming)):
+        with tempfile.TemporaryDirectory() as directory:
+            tracemalloc.start()
+            started = time.perf_counter()
+            stats = run(pages, os.path.join(directory, 'bench.sqlite3'))
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(f"{name:<10} {elapsed:6.2f} с, пик памяти {peak / 2 ** 20:7.1f} МБ {stats}")
+
+
+if __name__ == "__main__":
+    main()
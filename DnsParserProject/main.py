@@ -5,7 +5,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.core.thread_manager import AdvancedThreadedScraper
-from src.utils.config import Config
+from src.utils.config import Config, ScraperConfig
 
 
 def main():
@@ -13,7 +13,8 @@ def main():
     print("🤖 Тестирование умного парсера DNS-Shop")
 
     try:
-        scraper = AdvancedThreadedScraper(max_workers=2)
+        # Ограничитель, кэши, журнал, стадия разбора и потоковая запись - по config/settings.yaml
+        scraper = AdvancedThreadedScraper.from_config(ScraperConfig.from_settings())
 
         # Тестируем только один компонент для начала
         test_urls = {
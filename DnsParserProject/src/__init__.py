@@ -1,20 +1,46 @@
-from .core.parser import DNSScraper, ParserFactory, BrowserManager
+from .core.parser import DNSScraper, ParserFactory, BrowserManager, BrowserPool
 from .core.thread_manager import AdvancedThreadedScraper
-from .core.scout import PageScout, TaskDistributor
+from .core.async_manager import AsyncScraper
+from .core.scout import PageScout, TaskDistributor, PageTask, PageTaskQueue, PageCountCache, PageFrontier
+from .core.proxy_pool import ProxyPool
+from .core.waits import WaitStrategy, WaitStats, HumanizationBudget
+from .core.rate_limiter import RateLimiter, TokenBucket
+from .core.fetchers import FetchBackend, SeleniumFetchBackend, HttpFetchBackend
+from .core.extraction import SpecExtractor
+from .core.parse_cache import ParseCache
+from .core.journal import CrawlJournal
+from .core.dedup import Deduplicator, BloomFilter
+from .core.parse_stage import ParseStage
+from .core.distributed import CrawlCoordinator, CrawlWorker, SQLiteTaskBackend, TaskBackend
+from .core.compatibility import CompatibilityIndex
+from .core.build_optimizer import BuildOptimizer
+from .core.records import (
+    ProductRecord, RamRecord, MotherboardRecord, CpuCoolerRecord, CoolingSystemRecord, CpuRecord, GpuRecord,
+    to_records, to_dicts
+)
 from .core.models import (
     DataParser, RamDataParser, MotherboardDataParser, CpuCoolerDataParser,
     CoolingSystemDataParser, CpuDataParser, GpuDataParser, ComponentScorer
 )
-from .storage.saver import ExcelDataSaver, SQLDataSaver
+from .storage.saver import ExcelDataSaver, SQLDataSaver, ParquetDataSaver, ParquetChunkWriter
+from .storage.sink import DataSink, SQLiteSink, CSVSink, ParquetSink, StreamingWriter
 from .utils.config import Config, ScraperConfig
 from .utils.logger import setup_logger
 
 __version__ = "2.0.0"
 __all__ = [
-    'DNSScraper', 'ParserFactory', 'BrowserManager',
-    'AdvancedThreadedScraper', 'PageScout', 'TaskDistributor',
+    'DNSScraper', 'ParserFactory', 'BrowserManager', 'BrowserPool',
+    'AdvancedThreadedScraper', 'AsyncScraper', 'PageScout', 'TaskDistributor', 'PageCountCache', 'PageFrontier',
+    'PageTask', 'PageTaskQueue',
+    'FetchBackend', 'SeleniumFetchBackend', 'HttpFetchBackend', 'RateLimiter', 'TokenBucket', 'ProxyPool',
+    'WaitStrategy', 'WaitStats', 'HumanizationBudget',
     'DataParser', 'RamDataParser', 'MotherboardDataParser', 'CpuCoolerDataParser',
-    'CoolingSystemDataParser', 'CpuDataParser', 'GpuDataParser', 'ComponentScorer',
-    'ExcelDataSaver', 'SQLDataSaver',
+    'CoolingSystemDataParser', 'CpuDataParser', 'GpuDataParser', 'ComponentScorer', 'SpecExtractor', 'ParseCache',
+    'CrawlJournal', 'Deduplicator', 'BloomFilter', 'ParseStage',
+    'CrawlCoordinator', 'CrawlWorker', 'TaskBackend', 'SQLiteTaskBackend', 'CompatibilityIndex', 'BuildOptimizer',
+    'ProductRecord', 'RamRecord', 'MotherboardRecord', 'CpuCoolerRecord', 'CoolingSystemRecord', 'CpuRecord',
+    'GpuRecord', 'to_records', 'to_dicts',
+    'ExcelDataSaver', 'SQLDataSaver', 'ParquetDataSaver', 'ParquetChunkWriter',
+    'DataSink', 'SQLiteSink', 'CSVSink', 'ParquetSink', 'StreamingWriter',
     'Config', 'ScraperConfig', 'setup_logger'
 ]
\ No newline at end of file
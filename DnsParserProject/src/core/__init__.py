@@ -1,14 +1,38 @@
-from .parser import DNSScraper, ParserFactory, BrowserManager
+from .parser import DNSScraper, ParserFactory, BrowserManager, BrowserPool
 from .thread_manager import AdvancedThreadedScraper
-from .scout import PageScout, TaskDistributor
+from .async_manager import AsyncScraper
+from .scout import PageScout, TaskDistributor, PageTask, PageTaskQueue, PageCountCache, PageFrontier
+from .proxy_pool import ProxyPool
+from .waits import WaitStrategy, WaitStats, HumanizationBudget
+from .rate_limiter import RateLimiter, TokenBucket
+from .fetchers import FetchBackend, SeleniumFetchBackend, HttpFetchBackend
+from .extraction import SpecExtractor
+from .parse_cache import ParseCache
+from .journal import CrawlJournal
+from .dedup import Deduplicator, BloomFilter
+from .parse_stage import ParseStage
+from .distributed import CrawlCoordinator, CrawlWorker, SQLiteTaskBackend, TaskBackend
+from .compatibility import CompatibilityIndex
+from .build_optimizer import BuildOptimizer
+from .records import (
+    ProductRecord, RamRecord, MotherboardRecord, CpuCoolerRecord, CoolingSystemRecord, CpuRecord, GpuRecord,
+    to_records, to_dicts
+)
 from .models import (
     DataParser, RamDataParser, MotherboardDataParser, CpuCoolerDataParser,
     CoolingSystemDataParser, CpuDataParser, GpuDataParser, ComponentScorer
 )
 
 __all__ = [
-    'DNSScraper', 'ParserFactory', 'BrowserManager',
-    'AdvancedThreadedScraper', 'PageScout', 'TaskDistributor',
+    'DNSScraper', 'ParserFactory', 'BrowserManager', 'BrowserPool',
+    'AdvancedThreadedScraper', 'AsyncScraper', 'PageScout', 'TaskDistributor', 'PageCountCache', 'PageFrontier',
+    'PageTask', 'PageTaskQueue',
+    'FetchBackend', 'SeleniumFetchBackend', 'HttpFetchBackend', 'RateLimiter', 'TokenBucket', 'ProxyPool',
+    'WaitStrategy', 'WaitStats', 'HumanizationBudget',
     'DataParser', 'RamDataParser', 'MotherboardDataParser', 'CpuCoolerDataParser',
-    'CoolingSystemDataParser', 'CpuDataParser', 'GpuDataParser', 'ComponentScorer'
+    'CoolingSystemDataParser', 'CpuDataParser', 'GpuDataParser', 'ComponentScorer', 'SpecExtractor', 'ParseCache',
+    'CrawlJournal', 'Deduplicator', 'BloomFilter', 'ParseStage',
+    'CrawlCoordinator', 'CrawlWorker', 'TaskBackend', 'SQLiteTaskBackend', 'CompatibilityIndex', 'BuildOptimizer',
+    'ProductRecord', 'RamRecord', 'MotherboardRecord', 'CpuCoolerRecord', 'CoolingSystemRecord', 'CpuRecord',
+    'GpuRecord', 'to_records', 'to_dicts'
 ]
\ No newline at end of file
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .compatibility import CompatibilityIndex
+from .thread_manager import AdvancedThreadedScraper
+
+
+class AsyncScraper(AdvancedThreadedScraper):
+    """Асинхронный оркестратор: задачи страниц в asyncio, блокирующие вызовы в ограниченном пуле потоков"""
+
+    def __init__(self, max_workers=3, requests_per_minute=30, max_concurrency=8, **kwargs):
+        # Страницы разбираются в задачах страниц (process_page); стадия разбора не запускалась бы
+        if kwargs.get('parse_stage') is not None:
+            raise ValueError("Стадия разбора в процессах не поддерживается асинхронным парсером")
+        super().__init__(max_workers=max_workers, requests_per_minute=requests_per_minute, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = None
+        self._semaphore = None
+
+    @classmethod
+    def from_config(cls, config, **overrides) -> 'AsyncScraper':
+        """Создает асинхронный скрапер по настройкам ScraperConfig с лимитом max_concurrency"""
+        overrides.setdefault('max_concurrency', config.max_concurrency)
+        return super().from_config(config, **overrides)
+
+    async def scrape_all(self, components_urls: Dict[str, str], proxies=None) -> Dict[str, List[Dict]]:
+        """Асинхронный парсинг всех компонентов, каждая страница - отдельная задача"""
+        print(f"🚀 Запуск асинхронного парсера для {len(components_urls)} компонентов")
+
+        # Единый лимит на браузеры, HTTP-запросы и разбор данных
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            await self._run_blocking(self._start_session, components_urls, proxies)
+            # Пауза по хосту выдерживается в цикле событий (_throttle), а не в потоках пула
+            for fetcher in (self.fetcher, getattr(self.fetcher, 'fallback', None)):
+                if fetcher is not None:
+                    fetcher.host_throttled = True
+
+            tasks = [
+                self.scrape_component_async(component, url)
+                for component, url in components_urls.items()
+            ]
+            for result in await asyncio.gather(*tasks):
+                self.results[result['component_type']] = result['data']
+                status = "✓" if result['success'] else "✗"
+                print(f"{status} {result['component_type']} завершен")
+        finally:
+            await self._run_blocking(self._stop_session)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self.compatibility = CompatibilityIndex.build(self.results)
+
+        total_products = sum(len(data) for data in self.results.values() if data)
+        print(f"🎉 Парсинг завершен! Собрано {total_products} товаров")
+        print(f"⏱️  Ожидание страниц: {self.wait_stats.summary()}")
+
+        return self.results
+
+    async def scrape_component_async(self, component: str, base_url: str) -> Dict:
+        """Разведка компонента и параллельный парсинг его страниц (кроме завершенных по журналу)"""
+        try:
+            total_pages = await self._run_blocking(self.discover_pages, component, base_url)
+            page_urls = await self._run_blocking(self.pending_pages, component, base_url, total_pages)
+            pages = await asyncio.gather(*(self.scrape_page_async(component, url) for url in page_urls))
+            self.finish_component(component, base_url)
+
+            previous = await self._run_blocking(self.resumed_results, component)
+            all_component_data = previous + [product for page in pages for product in page]
+            print(f"✅ Завершен парсинг {component}, собрано {len(all_component_data)} товаров")
+            return {
+                'component_type': component,
+                'data': all_component_data,
+                'success': True
+            }
+
+        except Exception as e:
+            print(f"❌ Критическая ошибка для {component}: {e}")
+            return {
+                'component_type': component,
+                'data': [],
+                'success': False,
+                'error': str(e)
+            }
+
+    async def scrape_page_async(self, component: str, page_url: str) -> List[Dict]:
+        """Загрузка и разбор страницы с повторами при ошибках. В ленивом обходе следующие
+        страницы каталога загружаются в том же цикле, пока каталог не закончится"""
+        products = []
+        while page_url is not None:
+            page_products, page_url = await self._scrape_single_page(component, page_url)
+            products.extend(page_products)
+        return products
+
+    async def _scrape_single_page(self, component: str, page_url: str) -> Tuple[List[Dict], Optional[str]]:
+        """Товары одной страницы и URL следующей страницы ленивого обхода (или None)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Пауза по прокси - в движке загрузки: прокси запроса известен только ему
+                await self._throttle(page_url)
+                print(f"Парсинг страницы: {page_url}")
+                data = await self._run_blocking(self.fetcher.fetch_page, page_url)
+                products = await self._run_blocking(self.process_page, component, data, page_url)
+                return products, self.page_loaded(component, page_url, data)
+            except Exception as e:
+                print(f"Ошибка при парсинге {page_url} (попытка {attempt + 1}): {e}")
+                self.record_failure(component, page_url, e)
+
+        return [], None
+
+    async def _throttle(self, url: str):
+        """Ожидание ограничителя по хосту без занятого слота общего лимита и потока пула"""
+        wait = self.rate_limiter.reserve(url) if self.rate_limiter is not None else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _run_blocking(self, func, *args):
+        """Выполняет блокирующий вызов в пуле потоков под общим лимитом"""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
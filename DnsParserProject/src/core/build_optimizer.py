@@ -0,0 +1,244 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .compatibility import CompatibilityIndex
+from .models import ComponentScorer
+
+# Компоненты сборки и оценщик для каждого каталога парсера
+BUILD_COMPONENTS = ('cpu', 'motherboard', 'ram', 'gpu', 'cooler')
+COOLER_CATALOGS = {'cpu_cooler': 'air_cooler', 'cooling_system': 'water_cooling'}
+
+LEADING_NUMBER = re.compile(r'(\d+(?:[.,]\d+)?)')
+# Размер блока для предварительного отсечения доминируемых сочетаний
+FRONTIER_BLOCK = 256
+
+
+def leading_number(value) -> float:
+    """Число из значения вида '220 Вт' или 65; NaN, если числа нет"""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        return float(value)
+    match = LEADING_NUMBER.search(value) if isinstance(value, str) else None
+    return float(match.group(1).replace(',', '.')) if match else np.nan
+
+
+def parse_price(value) -> float:
+    """Цена из текста карточки ('12 999 ₽', '12999'); NaN, если цифр нет"""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+        return float(value)
+    digits = re.sub(r'[^\d]', '', str(value))
+    return float(digits) if digits else np.nan
+
+
+@dataclass
+class Candidates:
+    """Набор частичных сборок: цена, сумма оценок и номера товаров по компонентам"""
+    price: np.ndarray
+    score: np.ndarray
+    items: Dict[str, np.ndarray]
+
+    def __len__(self):
+        return len(self.price)
+
+    def take(self, index: np.ndarray) -> 'Candidates':
+        return Candidates(self.price[index], self.score[index],
+                          {component: items[index] for component, items in self.items.items()})
+
+    @classmethod
+    def concat(cls, parts: List['Candidates']) -> Optional['Candidates']:
+        parts = [part for part in parts if part is not None and len(part)]
+        if not parts:
+            return None
+        return cls(np.concatenate([part.price for part in parts]),
+                   np.concatenate([part.score for part in parts]),
+                   {component: np.concatenate([part.items[component] for part in parts])
+                    for component in parts[0].items})
+
+
+class BuildOptimizer:
+    """Поиск лучших сборок ПК в пределах бюджета по собранным каталогам.
+
+    Товары каждого компонента делятся на классы совместимости (сокет и тип памяти - по
+    CompatibilityIndex, для кулеров - по TDP процессора),
+    внутри класса остаются только недоминируемые по (цена, оценка) варианты - k слоев
+    Парето-фронта для top-k. Классы объединяются попарно, и после каждого шага
+    сочетания снова прореживаются фронтом и ограничиваются бюджетом"""
+
+    def __init__(self, catalogs: Dict[str, object], scorer: Optional[ComponentScorer] = None,
+                 index: Optional[CompatibilityIndex] = None):
+        """index - готовый индекс, построенный по тем же каталогам (например, после обхода)"""
+        self.scorer = scorer or ComponentScorer()
+        self.index = index or CompatibilityIndex.build(catalogs)
+        self.skipped: Dict[str, int] = {}
+        self.frames: Dict[str, pd.DataFrame] = {}
+        self.columns: Dict[str, List[str]] = {}
+
+        for component in ('cpu', 'motherboard', 'ram', 'gpu'):
+            self.frames[component] = self._prepare(component, catalogs.get(component))
+
+        # Воздушные кулеры и СЖО выбираются из общего списка, каждый со своей оценкой
+        coolers = [self._prepare(catalog, catalogs.get(catalog)) for catalog in COOLER_CATALOGS]
+        self.frames['cooler'] = pd.concat(coolers, ignore_index=True)
+
+    def best_builds(self, budget: float, top_k: int = 5) -> List[Dict]:
+        """Top-k сборок по общей оценке (как в evaluate_system) с ценой не выше бюджета"""
+        frames = self.frames
+        if any(frames[component].empty for component in BUILD_COMPONENTS):
+            return []
+
+        # Остаток бюджета для части сборки: бюджет минус самые дешевые недостающие компоненты
+        cheapest = {component: frames[component]['_price'].min() for component in BUILD_COMPONENTS}
+
+        def limit(*have):
+            return budget - sum(price for component, price in cheapest.items() if component not in have)
+
+        gpus = self._frontier(self._single('gpu', frames['gpu'].index.to_numpy(), limit('gpu')), top_k)
+
+        index = self.index
+        rams = {ddr: self._single('ram', self._positions('ram', index.ids('ram', ddr=ddr)), limit('ram'))
+                for ddr in index.values('ddr', 'ram')}
+
+        # Процессор и кулер: кулер должен отводить TDP процессора
+        cores = {}
+        cooler_tdp = frames['cooler']['_tdp'].to_numpy(dtype=float)
+        for socket in index.values('socket', 'cpu'):
+            cpus = self._positions('cpu', index.ids('cpu', socket=socket))
+            cpu_tdp = frames['cpu']['_tdp'].to_numpy(dtype=float)[cpus]
+            pairs = [self._combine(self._single('cpu', cpus[cpu_tdp == tdp], limit('cpu')),
+                                   self._single('cooler', np.flatnonzero(cooler_tdp >= tdp), limit('cooler')),
+                                   limit('cpu', 'cooler'), top_k)
+                     for tdp in np.unique(cpu_tdp)]
+            cores[socket] = self._frontier(Candidates.concat(pairs), top_k)
+
+        builds = []
+        for socket, core in cores.items():
+            for ddr, ram in rams.items():
+                boards = self._positions('motherboard', index.ids('motherboard', socket=socket, ddr=ddr))
+                platform = self._combine(self._single('motherboard', boards, limit('motherboard')),
+                                         ram, limit('motherboard', 'ram'), top_k)
+                builds.append(self._combine(platform, core, limit('motherboard', 'ram', 'cpu', 'cooler'), top_k))
+
+        builds = self._combine(self._frontier(Candidates.concat(builds), top_k), gpus, budget, top_k)
+        if builds is None:
+            return []
+
+        order = np.lexsort((builds.price, -builds.score))[:top_k]
+        return [self._describe(builds, position) for position in order]
+
+    def _describe(self, builds: Candidates, position: int) -> Dict:
+        components = {}
+        scores = {}
+        for component in BUILD_COMPONENTS:
+            row = self.frames[component].loc[builds.items[component][position]]
+            components[component] = {key: value.item() if isinstance(value, np.generic) else value
+                                     for key, value in row.items() if key in self.columns[row['_catalog']]}
+            scores[row['_scorer'] if component == 'cooler' else component] = float(row['_score'])
+
+        total_score = float(builds.score[position]) / len(BUILD_COMPONENTS)
+        return {
+            'total_price': float(builds.price[position]),
+            'total_score': round(total_score, 2),
+            'rating': self.scorer._get_rating(total_score),
+            'component_scores': scores,
+            'components': components,
+        }
+
+    def _prepare(self, catalog: str, items) -> pd.DataFrame:
+        """Таблица каталога с ценой, оценкой и нормализованными признаками совместимости"""
+        frame = items.copy() if isinstance(items, pd.DataFrame) else pd.DataFrame(list(items or []))
+        self.columns[catalog] = list(frame.columns)
+        ids = self.index.ids(catalog)
+        if len(ids) != len(frame):
+            raise ValueError(f"Индекс совместимости построен не по этим каталогам: {catalog}")
+        if frame.empty:
+            return frame.assign(_id=[], _price=[], _score=[], _scorer=[], _catalog=[], _tdp=[])
+        frame['_id'] = ids
+
+        if catalog == 'ram' and 'Латентность (CL)' in frame:
+            # Парсер отдает CL строкой, а оценка ожидает число
+            frame['Латентность (CL)'] = pd.to_numeric(frame['Латентность (CL)'], errors='coerce')
+        if catalog == 'motherboard' and 'Поддержка CPU' not in frame:
+            frame['Поддержка CPU'] = [('AMD' if socket.startswith('AM') else 'Intel') if socket else ''
+                                      for socket in self.index.attribute_column(ids, 'socket')]
+        if catalog == 'cpu':
+            # Неизвестный TDP не ограничивает выбор кулера
+            frame['_tdp'] = frame['TDP (Вт)'].map(leading_number).fillna(0)
+        if catalog in COOLER_CATALOGS:
+            column = 'Макс. TDP' if catalog == 'cpu_cooler' else 'TDP'
+            frame['_tdp'] = frame[column].map(leading_number).fillna(np.inf)
+
+        scorer_name = COOLER_CATALOGS.get(catalog, catalog)
+        frame['_price'] = frame['Цена'].map(parse_price)
+        frame['_score'] = self.scorer.score_frame(scorer_name, frame)
+        frame['_scorer'] = scorer_name
+        frame['_catalog'] = catalog
+
+        valid = frame[['_price', '_score']].notna().all(axis=1)
+        self.skipped[catalog] = int((~valid).sum())
+        return frame[valid].reset_index(drop=True)
+
+    def _positions(self, component: str, product_ids: np.ndarray) -> np.ndarray:
+        """Строки таблицы компонента для номеров товаров из индекса"""
+        return np.flatnonzero(np.isin(self.frames[component]['_id'].to_numpy(), product_ids))
+
+    def _single(self, component: str, index: np.ndarray, limit: float) -> Optional[Candidates]:
+        frame = self.frames[component]
+        price = frame['_price'].to_numpy(dtype=float)[index]
+        within = price <= limit
+        index = index[within]
+        return Candidates(price[within], frame['_score'].to_numpy(dtype=float)[index], {component: index})
+
+    @classmethod
+    def _combine(cls, left: Optional[Candidates], right: Optional[Candidates], limit: float,
+                 top_k: int) -> Optional[Candidates]:
+        """Все сочетания двух наборов в пределах limit, прореженные до k слоев Парето-фронта"""
+        if left is None or right is None or not len(left) or not len(right):
+            return None
+        left, right = cls._frontier(left, top_k), cls._frontier(right, top_k)
+
+        price = (left.price[:, None] + right.price[None, :]).ravel()
+        within = np.flatnonzero(price <= limit)
+        if not within.size:
+            return None
+        left_index, right_index = np.divmod(within, len(right))
+        score = left.score[left_index] + right.score[right_index]
+
+        items = {component: values[left_index] for component, values in left.items.items()}
+        items.update({component: values[right_index] for component, values in right.items.items()})
+        return cls._frontier(Candidates(price[within], score, items), top_k)
+
+    @staticmethod
+    def _dominated_filter(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Быстрое отсечение перед построением слоев (scores упорядочены по цене).
+        В каждом блоке берется top_k-я по величине оценка; если среди более дешевых блоков
+        есть блок, где она выше оценки товара, товар строго доминируют не меньше top_k вариантов"""
+        blocks = -(-scores.size // FRONTIER_BLOCK)
+        padded = np.full(blocks * FRONTIER_BLOCK, -np.inf)
+        padded[:scores.size] = scores
+        kth = -np.partition(-padded.reshape(blocks, FRONTIER_BLOCK), top_k - 1, axis=1)[:, top_k - 1]
+        bound = np.maximum.accumulate(np.concatenate(([-np.inf], kth[:-1])))
+        return scores >= np.repeat(bound, FRONTIER_BLOCK)[:scores.size]
+
+    @staticmethod
+    def _frontier(candidates: Optional[Candidates], top_k: int) -> Optional[Candidates]:
+        """Первые top_k слоев Парето-фронта по (цена меньше, оценка больше).
+        Вариант, который доминируют не меньше top_k других, не может попасть в top_k сборок"""
+        if candidates is None or not len(candidates):
+            return candidates
+
+        remaining = np.lexsort((-candidates.score, candidates.price))
+        if 1 < top_k <= FRONTIER_BLOCK < remaining.size // 2:
+            remaining = remaining[BuildOptimizer._dominated_filter(candidates.score[remaining], top_k)]
+        layers = []
+        for _ in range(top_k):
+            if not remaining.size:
+                break
+            scores = candidates.score[remaining]
+            best_before = np.maximum.accumulate(np.concatenate(([-np.inf], scores[:-1])))
+            on_front = scores > best_before
+            layers.append(remaining[on_front])
+            remaining = remaining[~on_front]
+        return candidates.take(np.concatenate(layers))
@@ -0,0 +1,210 @@
+import re
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Сокет платы AMD по чипсету: парсер платы распознает только сокеты Intel
+AMD_CHIPSET_SOCKETS = {
+    'A320': 'AM4', 'B350': 'AM4', 'X370': 'AM4', 'B450': 'AM4', 'X470': 'AM4',
+    'A520': 'AM4', 'B550': 'AM4', 'X570': 'AM4',
+    'A620': 'AM5', 'B650': 'AM5', 'B650E': 'AM5', 'X670': 'AM5', 'X670E': 'AM5',
+    'B840': 'AM5', 'B850': 'AM5', 'X870': 'AM5', 'X870E': 'AM5',
+}
+FORM_FACTORS = {
+    'E-ATX': 'E-ATX', 'EATX': 'E-ATX', 'XL-ATX': 'XL-ATX', 'ATX': 'ATX',
+    'MICRO-ATX': 'Micro-ATX', 'MICROATX': 'Micro-ATX', 'MATX': 'Micro-ATX', 'M-ATX': 'Micro-ATX',
+    'MINI-ITX': 'Mini-ITX', 'THINMINI-ITX': 'Mini-ITX', 'MINI-DTX': 'Mini-DTX',
+}
+CHIPSET_PATTERN = re.compile(r'\b([ABHQWXZ]\d{3}E?)\b', re.IGNORECASE)
+DDR_PATTERN = re.compile(r'DDR(\d)', re.IGNORECASE)
+PCIE_VERSION_PATTERN = re.compile(r'(\d)(?:\.(\d))?')
+PCIE_LANES_PATTERN = re.compile(r'x\s*(\d+)', re.IGNORECASE)
+
+
+def normalize_socket(value) -> Optional[str]:
+    """'LGA 1700' -> 'LGA1700', 'Socket AM4' -> 'AM4'; None, если сокет неизвестен"""
+    if not isinstance(value, str) or value.strip() in ('', 'N/A'):
+        return None
+    socket = re.sub(r'\s+', '', value.upper())
+    if socket.startswith('SOCKET') and not socket[6:].isdigit():
+        socket = socket[6:]
+    return socket or None
+
+
+def socket_from_chipset(chipset) -> Optional[str]:
+    """Сокет платы AMD по названию чипсета ('AMD B550' -> 'AM4')"""
+    match = CHIPSET_PATTERN.search(chipset) if isinstance(chipset, str) else None
+    return AMD_CHIPSET_SOCKETS.get(match.group(1).upper()) if match else None
+
+
+def normalize_ddr(value) -> Optional[str]:
+    """'DDR4', 'ddr4l', 'DDR4-3200' -> 'DDR4'; None, если тип памяти неизвестен"""
+    match = DDR_PATTERN.search(value) if isinstance(value, str) else None
+    return f"DDR{match.group(1)}" if match else None
+
+
+def normalize_form_factor(value) -> Optional[str]:
+    """'micro-ATX', 'mATX' -> 'Micro-ATX'; None для нестандартных и неизвестных"""
+    if not isinstance(value, str):
+        return None
+    return FORM_FACTORS.get(re.sub(r'\s+', '', value.upper()))
+
+
+def normalize_pcie(value) -> Optional[str]:
+    """Версия PCIe: 'PCIe 4.0', '4', 4.0 -> '4.0'"""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool) and not pd.isna(value):
+        value = str(value)
+    match = PCIE_VERSION_PATTERN.search(value) if isinstance(value, str) else None
+    return f"{match.group(1)}.{match.group(2) or 0}" if match else None
+
+
+def normalize_pcie_slot(value) -> Optional[str]:
+    """Ширина слота PCI-E платы: 'x16', 'X 16' -> 'x16'"""
+    match = PCIE_LANES_PATTERN.search(value) if isinstance(value, str) else None
+    return f"x{match.group(1)}" if match else None
+
+
+def _motherboard_socket(record) -> Optional[str]:
+    return normalize_socket(record.get('Сокет')) or socket_from_chipset(record.get('Чипсет'))
+
+
+# Какие признаки совместимости извлекаются из записи каждого каталога
+ATTRIBUTES: Dict[str, Dict[str, Callable[[dict], Optional[str]]]] = {
+    'cpu': {
+        'socket': lambda record: normalize_socket(record.get('Сокет')),
+    },
+    'motherboard': {
+        'socket': _motherboard_socket,
+        'ddr': lambda record: normalize_ddr(record.get('Тип слотов памяти')),
+        'form_factor': lambda record: normalize_form_factor(record.get('Форм-фактор')),
+        'pcie_slot': lambda record: normalize_pcie_slot(record.get('Версия слотов PCI-E')),
+    },
+    'ram': {
+        'ddr': lambda record: normalize_ddr(record.get('Тип памяти')),
+    },
+    'gpu': {
+        'pcie': lambda record: normalize_pcie(record.get('Версия PCIe')),
+    },
+}
+
+# Пары компонентов и признаки, которые у них должны совпадать
+RULES = {
+    ('cpu', 'motherboard'): ('socket',),
+    ('motherboard', 'ram'): ('ddr',),
+}
+
+NORMALIZERS = {
+    'socket': normalize_socket,
+    'ddr': normalize_ddr,
+    'form_factor': normalize_form_factor,
+    'pcie': normalize_pcie,
+    'pcie_slot': normalize_pcie_slot,
+}
+
+
+class CompatibilityIndex:
+    """Инвертированный индекс совместимости, строится после обхода.
+
+    Каждый товар получает целочисленный номер; для каждого нормализованного значения признака
+    (сокет, поколение DDR, форм-фактор, версия PCIe) хранится отсортированный массив номеров,
+    поэтому запрос «какие платы подходят к процессору» - это пересечение массивов, а не перебор"""
+
+    def __init__(self):
+        self.components: List[str] = []
+        self.records: List[dict] = []
+        self._attributes: List[Dict[str, str]] = []
+        self._pending: Dict[tuple, List[int]] = defaultdict(list)
+        self._postings: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def build(cls, catalogs: Dict[str, object]) -> 'CompatibilityIndex':
+        """Индекс по результатам обхода {компонент: список записей или DataFrame}"""
+        index = cls()
+        for component, items in catalogs.items():
+            index.add(component, items)
+        return index
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, component: str, items) -> np.ndarray:
+        """Добавляет записи каталога и возвращает присвоенные им номера"""
+        records = items.to_dict('records') if isinstance(items, pd.DataFrame) else list(items or [])
+        extractors = ATTRIBUTES.get(component, {})
+        first = len(self.records)
+
+        self._pending[('component', component)].extend(range(first, first + len(records)))
+        for product_id, record in enumerate(records, start=first):
+            attributes = {}
+            for attribute, extract in extractors.items():
+                value = extract(record)
+                if value is not None:
+                    attributes[attribute] = value
+                    self._pending[(attribute, value)].append(product_id)
+            self.components.append(component)
+            self.records.append(record)
+            self._attributes.append(attributes)
+        return np.arange(first, first + len(records), dtype=np.int32)
+
+    def ids(self, component: Optional[str] = None, **criteria) -> np.ndarray:
+        """Номера товаров, подходящих под все условия. Значение условия - строка
+        в любом написании или список допустимых значений: ids('motherboard', socket='LGA 1700', ddr='DDR5')"""
+        postings = []
+        if component is not None:
+            postings.append(self._posting('component', component))
+        for attribute, value in criteria.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            normalize = NORMALIZERS.get(attribute, lambda item: item)
+            parts = [self._posting(attribute, normalize(item)) for item in values]
+            postings.append(parts[0] if len(parts) == 1 else np.unique(np.concatenate(parts)))
+
+        if not postings:
+            return np.arange(len(self.records), dtype=np.int32)
+        postings.sort(key=len)
+        result = postings[0]
+        for posting in postings[1:]:
+            if not result.size:
+                break
+            result = np.intersect1d(result, posting, assume_unique=True)
+        return result
+
+    def values(self, attribute: str, component: Optional[str] = None) -> List[str]:
+        """Все встреченные значения признака (для компонента, если он задан)"""
+        self._flush()
+        found = sorted(value for key, value in self._postings if key == attribute)
+        if component is None:
+            return found
+        return [value for value in found if self.ids(component, **{attribute: value}).size]
+
+    def attributes(self, product_id: int) -> Dict[str, str]:
+        return dict(self._attributes[product_id])
+
+    def attribute_column(self, product_ids: Iterable[int], attribute: str) -> List[Optional[str]]:
+        """Значение признака для каждого номера (None, если признак неизвестен)"""
+        return [self._attributes[product_id].get(attribute) for product_id in product_ids]
+
+    def compatible(self, product_id: int, component: str) -> np.ndarray:
+        """Товары компонента, совместимые с товаром product_id по правилам RULES"""
+        source = self.components[product_id]
+        shared = RULES.get((source, component)) or RULES.get((component, source))
+        if shared is None:
+            return self.ids(component)
+
+        attributes = self._attributes[product_id]
+        if any(attribute not in attributes for attribute in shared):
+            return np.empty(0, dtype=np.int32)
+        return self.ids(component, **{attribute: attributes[attribute] for attribute in shared})
+
+    def _posting(self, attribute: str, value) -> np.ndarray:
+        self._flush()
+        return self._postings.get((attribute, value), np.empty(0, dtype=np.int32))
+
+    def _flush(self):
+        # Номера добавляются по возрастанию, поэтому массивы сразу отсортированы
+        for key, product_ids in self._pending.items():
+            added = np.asarray(product_ids, dtype=np.int32)
+            existing = self._postings.get(key)
+            self._postings[key] = added if existing is None else np.concatenate([existing, added])
+        self._pending.clear()
@@ -0,0 +1,191 @@
+import hashlib
+import math
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Идентификатор товара в ссылке вида https://www.dns-shop.ru/product/<id>/<название>/
+PRODUCT_ID = re.compile(r'/product/([0-9a-f]{8,})', re.IGNORECASE)
+
+
+def product_key(href) -> Optional[str]:
+    """Ключ товара: идентификатор из ссылки или ссылка без схемы, параметров и якоря"""
+    if not href:
+        return None
+    href = str(href).strip()
+    match = PRODUCT_ID.search(href)
+    if match:
+        return match.group(1).lower()
+    parts = urlsplit(href)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}" or None
+
+
+class BloomFilter:
+    """Фильтр Блума в массиве байтов: «точно не встречался» или «вероятно встречался».
+    Позиции битов - двойное хеширование по двум половинам blake2b"""
+
+    MAGIC = b'DNSBLOOM'
+    HEADER = struct.Struct('<8sQI')
+
+    def __init__(self, expected_items: int = 1000000, error_rate: float = 0.001,
+                 size_bits: Optional[int] = None, hashes: Optional[int] = None):
+        self.size_bits = size_bits or max(8, int(-expected_items * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = hashes or max(1, round(self.size_bits / expected_items * math.log(2)))
+        self.bits = bytearray((self.size_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size_bits for i in range(self.hashes)]
+
+    def add(self, key: str) -> bool:
+        """Добавляет ключ; True, если он уже (вероятно) был в фильтре"""
+        bits = self.bits
+        present = True
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return present
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(path.suffix + '.tmp')
+        with open(temp, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.size_bits, self.hashes))
+            f.write(self.bits)
+        temp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'BloomFilter':
+        with open(path, 'rb') as f:
+            magic, size_bits, hashes = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"Файл {path} не является фильтром Блума")
+            bloom = cls(size_bits=size_bits, hashes=hashes)
+            bloom.bits = bytearray(f.read())
+        if len(bloom.bits) != (size_bits + 7) // 8:
+            raise ValueError(f"Файл фильтра Блума {path} поврежден")
+        return bloom
+
+
+class Deduplicator:
+    """Отсев повторов товаров до разбора и записи.
+
+    В пределах обхода повторы определяются точно - множеством ключей на компонент.
+    С bloom_path ключи сохраняются в фильтр Блума на диске, и товары, встреченные в прошлых
+    обходах, тоже отбрасываются (с долей ложных срабатываний error_rate): так обход отдает
+    только новые товары.
+
+    Отсев идет в два шага: check_page резервирует ключи новых товаров страницы, а commit
+    после записи страницы переносит их во встреченные и в фильтр Блума. Если страница
+    не записалась, release снимает резерв, и при повторе ее товары не считаются повторами"""
+
+    def __init__(self, bloom_path: Optional[str] = None, expected_items: int = 1000000,
+                 error_rate: float = 0.001):
+        self.bloom_path = Path(bloom_path) if bloom_path else None
+        self.bloom = None
+        self._seen: Dict[str, set] = {}
+        self._reserved: Dict[str, set] = {}
+        self._stats = {'seen': 0, 'dropped': 0, 'dropped_known': 0}
+        self._lock = threading.Lock()
+
+        if self.bloom_path is not None:
+            try:
+                self.bloom = BloomFilter.load(self.bloom_path) if self.bloom_path.exists() else None
+            except (OSError, ValueError, struct.error) as e:
+                print(f"⚠️  Не удалось прочитать фильтр Блума {self.bloom_path}: {e}")
+            if self.bloom is None:
+                self.bloom = BloomFilter(expected_items, error_rate)
+
+    @classmethod
+    def from_config(cls, config) -> 'Deduplicator':
+        """Создает отсев по настройкам ScraperConfig"""
+        return cls(bloom_path=config.dedup_bloom_path, expected_items=config.dedup_expected_items,
+                   error_rate=config.dedup_error_rate)
+
+    def check_page(self, component: str, data) -> Tuple[list, List[str]]:
+        """Страница [names, prices, hrefs] без товаров, уже встреченных в обходе (или в прошлых обходах)
+        или зарезервированных другой страницей в работе, и ключи оставленных товаров, зарезервированные
+        до commit / release. Списки разной длины сопоставить по позиции нельзя - они возвращаются как есть"""
+        names, prices, hrefs = data
+        if not (len(names) == len(prices) == len(hrefs)):
+            return data, []
+
+        keep, keys = [], []
+        with self._lock:
+            seen = self._seen.setdefault(component, set())
+            reserved = self._reserved.setdefault(component, set())
+            for i, href in enumerate(hrefs):
+                key = product_key(href)
+                if key is None:
+                    keep.append(i)
+                    continue
+                self._stats['seen'] += 1
+                if key in seen or key in reserved:
+                    self._stats['dropped'] += 1
+                    continue
+                if self.bloom is not None and f"{component}:{key}" in self.bloom:
+                    self._stats['dropped_known'] += 1
+                    continue
+                reserved.add(key)
+                keep.append(i)
+                keys.append(key)
+
+        if len(keep) == len(hrefs):
+            return data, keys
+        return [[names[i] for i in keep], [prices[i] for i in keep], [hrefs[i] for i in keep]], keys
+
+    def commit(self, component: str, keys: Iterable[str]):
+        """Отмечает товары записанной страницы как встреченные (и в фильтре Блума)"""
+        with self._lock:
+            seen = self._seen.setdefault(component, set())
+            reserved = self._reserved.setdefault(component, set())
+            for key in keys:
+                reserved.discard(key)
+                seen.add(key)
+                if self.bloom is not None:
+                    self.bloom.add(f"{component}:{key}")
+
+    def release(self, component: str, keys: Iterable[str]):
+        """Снимает резерв с товаров страницы, которую не удалось разобрать или записать"""
+        with self._lock:
+            self._reserved.setdefault(component, set()).difference_update(keys)
+
+    def filter_page(self, component: str, data):
+        """check_page и commit за один шаг - для страниц, запись которых не отслеживается"""
+        data, keys = self.check_page(component, data)
+        self.commit(component, keys)
+        return data
+
+    def seed(self, component: str, hrefs: Iterable[str]):
+        """Отмечает товары как уже встреченные в обходе (например, со страниц из журнала)"""
+        keys = {key for key in map(product_key, hrefs) if key is not None}
+        with self._lock:
+            self._seen.setdefault(component, set()).update(keys)
+
+    def reset(self, components: Optional[List[str]] = None):
+        """Забывает товары текущего обхода; фильтр Блума прошлых обходов сохраняется"""
+        with self._lock:
+            if components is None:
+                self._seen.clear()
+                self._reserved.clear()
+            for component in components or ():
+                self._seen.pop(component, None)
+                self._reserved.pop(component, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def save(self):
+        if self.bloom is not None:
+            with self._lock:
+                self.bloom.save(self.bloom_path)
@@ -0,0 +1,493 @@
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .compatibility import CompatibilityIndex
+from .dedup import product_key
+from .scout import PageFrontier, TaskDistributor
+
+
+@dataclass
+class LeasedTask:
+    """Страница, выданная работнику до истечения аренды"""
+    task_id: int
+    component: str
+    url: str
+    attempts: int
+    worker: str
+
+
+class TaskBackend:
+    """Очередь страниц распределенного обхода: координатор публикует страницы, работники
+    берут их в аренду и возвращают товары. Страница, аренда которой истекла (работник упал
+    или завис), выдается снова, пока не исчерпаны попытки"""
+
+    @abstractmethod
+    def publish(self, component: str, base_url: str, urls: List[str], lazy: bool = False):
+        pass
+
+    @abstractmethod
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[LeasedTask]:
+        pass
+
+    @abstractmethod
+    def complete(self, task: LeasedTask, products: List[Dict], first_key: Optional[str]):
+        pass
+
+    @abstractmethod
+    def fail(self, task: LeasedTask, error):
+        pass
+
+    @abstractmethod
+    def progress(self) -> Dict[str, Dict[str, int]]:
+        pass
+
+    @abstractmethod
+    def results(self, component: str) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def found_pages(self, component: str) -> int:
+        pass
+
+    @abstractmethod
+    def expire_leases(self):
+        pass
+
+    @abstractmethod
+    def open(self, crawl_id: Optional[str] = None) -> str:
+        pass
+
+    @abstractmethod
+    def close_crawl(self):
+        pass
+
+    @abstractmethod
+    def crawl_state(self) -> Tuple[Optional[str], bool]:
+        pass
+
+    def is_closed(self) -> bool:
+        return self.crawl_state()[1]
+
+    def close(self):
+        pass
+
+
+class SQLiteTaskBackend(TaskBackend):
+    """Очередь в файле SQLite для обхода на одной машине (несколько процессов-работников).
+    Выдача аренды - одна транзакция BEGIN IMMEDIATE, поэтому страницу получает ровно один работник.
+    Для нескольких машин файл должен лежать на диске с корректными блокировками;
+    сетевые файловые системы для этого обычно не подходят"""
+
+    PENDING = 'pending'
+    LEASED = 'leased'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, path: str = 'data/crawl_queue.sqlite3', max_attempts: int = 3, max_pages: int = 1000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.max_pages = max_pages
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        with self._transaction():
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    component TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    page INTEGER,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    lease_until REAL,
+                    products TEXT,
+                    has_products INTEGER,
+                    error TEXT,
+                    first_key TEXT,
+                    UNIQUE (component, url)
+                )""")
+            # Очереди прошлых версий без ключа первого товара страницы
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+            if 'first_key' not in existing:
+                self._conn.execute("ALTER TABLE tasks ADD COLUMN first_key TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_until)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS components (
+                    component TEXT PRIMARY KEY,
+                    base_url TEXT NOT NULL,
+                    lazy INTEGER NOT NULL
+                )""")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    @classmethod
+    def from_config(cls, config) -> 'SQLiteTaskBackend':
+        return cls(config.queue_path, max_attempts=config.max_page_retries + 1)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def open(self, crawl_id: Optional[str] = None) -> str:
+        """Новый обход: прошлые страницы и результаты удаляются. Возвращает идентификатор обхода,
+        по которому работники отличают его от прошлого, уже закрытого"""
+        crawl_id = crawl_id or uuid.uuid4().hex[:12]
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM components")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('crawl', ?)", (crawl_id,))
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('state', 'open')")
+        return crawl_id
+
+    def close_crawl(self):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('state', 'closed')")
+
+    def crawl_state(self) -> Tuple[Optional[str], bool]:
+        """(идентификатор текущего обхода или None, закрыт ли он)"""
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta WHERE key IN ('crawl', 'state')"))
+        return meta.get('crawl'), meta.get('state') == 'closed'
+
+    def expire_leases(self):
+        """Истекшие аренды без оставшихся попыток отмечаются неудачными и больше не выдаются"""
+        with self._transaction() as conn:
+            self._expire(conn, time.time())
+
+    def _expire(self, conn, now: float):
+        conn.execute("UPDATE tasks SET status = ?, error = 'истекла аренда' "
+                     "WHERE status = ? AND lease_until < ? AND attempts >= ?",
+                     (self.FAILED, self.LEASED, now, self.max_attempts))
+
+    def publish(self, component: str, base_url: str, urls: List[str], lazy: bool = False):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO components VALUES (?, ?, ?)", (component, base_url, int(lazy)))
+            conn.executemany("INSERT OR IGNORE INTO tasks (component, url, page, status) VALUES (?, ?, ?, ?)",
+                             [(component, url, TaskDistributor.page_number(url), self.PENDING) for url in urls])
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[LeasedTask]:
+        now = time.time()
+        with self._transaction() as conn:
+            # Закрытый обход страниц больше не выдает, даже если какие-то не были обработаны
+            state = conn.execute("SELECT value FROM meta WHERE key = 'state'").fetchone()
+            if state is not None and state[0] == 'closed':
+                return None
+            self._expire(conn, now)
+            row = conn.execute("SELECT id, component, url, attempts FROM tasks "
+                               "WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY id LIMIT 1",
+                               (self.PENDING, self.LEASED, now)).fetchone()
+            if row is None:
+                return None
+            task_id, component, url, attempts = row
+            conn.execute("UPDATE tasks SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 "
+                         "WHERE id = ?", (self.LEASED, worker_id, now + lease_seconds, task_id))
+        return LeasedTask(task_id, component, url, attempts + 1, worker_id)
+
+    def complete(self, task: LeasedTask, products: List[Dict], first_key: Optional[str]):
+        """Сохраняет товары страницы; повторное завершение той же страницы игнорируется.
+        first_key - ключ первого товара сырой страницы (None - товаров нет). Для ленивого компонента
+        последняя страница с товарами добавляет следующую; страница, начинающаяся с того же товара,
+        что и предыдущая (DNS повторяет последнюю страницу за концом каталога), считается пустой"""
+        payload = json.dumps(products, ensure_ascii=False, default=str)
+        with self._transaction() as conn:
+            row = conn.execute("SELECT c.base_url, c.lazy, t.page, "
+                               "(SELECT MAX(page) FROM tasks WHERE component = t.component), "
+                               "(SELECT first_key FROM tasks WHERE component = t.component AND page = t.page - 1) "
+                               "FROM tasks t LEFT JOIN components c ON c.component = t.component WHERE t.id = ?",
+                               (task.task_id,)).fetchone()
+            if row is None:
+                return
+            base_url, lazy, page, last_page, previous_key = row
+            has_products = first_key is not None and first_key != previous_key
+            updated = conn.execute("UPDATE tasks SET status = ?, products = ?, has_products = ?, first_key = ?, "
+                                   "error = NULL WHERE id = ? AND status != ?",
+                                   (self.DONE, payload, int(has_products), first_key, task.task_id,
+                                    self.DONE)).rowcount
+            if not updated or not has_products:
+                return
+
+            if lazy and page is not None and page == last_page < self.max_pages:
+                url = TaskDistributor.generate_page_urls(base_url, page + 1, page + 1)[0]
+                conn.execute("INSERT OR IGNORE INTO tasks (component, url, page, status) VALUES (?, ?, ?, ?)",
+                             (task.component, url, page + 1, self.PENDING))
+
+    def fail(self, task: LeasedTask, error):
+        """Неудачная попытка: страница возвращается в очередь, пока есть попытки.
+        Если аренда уже истекла и страница выдана другому работнику, отметка не делается"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                         "worker = NULL, lease_until = NULL, error = ? WHERE id = ? AND status = ? AND worker = ?",
+                         (self.max_attempts, self.FAILED, self.PENDING, str(error), task.task_id, self.LEASED,
+                          task.worker))
+
+    def progress(self) -> Dict[str, Dict[str, int]]:
+        """{компонент: {статус: число страниц}}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT component, status, COUNT(*) FROM tasks GROUP BY component, status")
+            progress = {}
+            for component, status, count in rows:
+                progress.setdefault(component, {})[status] = count
+        return progress
+
+    def results(self, component: str) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT products FROM tasks WHERE component = ? AND status = ? "
+                                      "ORDER BY page, id", (component, self.DONE)).fetchall()
+        return [product for products, in rows for product in json.loads(products)]
+
+    def found_pages(self, component: str) -> int:
+        """Последняя страница компонента с товарами"""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(page) FROM tasks WHERE component = ? AND has_products = 1",
+                                     (component,)).fetchone()
+        return row[0] or 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+BACKENDS = {
+    'sqlite': SQLiteTaskBackend,
+}
+
+
+def create_backend(config) -> TaskBackend:
+    if config.queue_backend not in BACKENDS:
+        raise ValueError(f"Неизвестная очередь распределенного обхода: {config.queue_backend}")
+    return BACKENDS[config.queue_backend].from_config(config)
+
+
+class CrawlCoordinator:
+    """Координатор: разведка компонентов, публикация страниц в очередь и сбор результатов.
+    Страницы загружают и разбирают работники (CrawlWorker) на любом числе машин.
+
+    Собранные товары передаются в потоковую запись scraper.writer, если она задана.
+    В этом режиме не поддерживаются журнал и resume (новый обход очищает очередь),
+    стадия разбора в процессах (работники разбирают страницы в своих потоках) и фильтр
+    Блума прошлых обходов: повторы отсеиваются только по ссылке внутри обхода"""
+
+    def __init__(self, backend: TaskBackend, scraper, poll_interval: float = 2.0,
+                 timeout: Optional[float] = None):
+        self.backend = backend
+        self.scraper = scraper
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def run(self, components_urls: Dict[str, str], proxies=None) -> Dict[str, List[Dict]]:
+        crawl_id = self.backend.open()
+        print(f"🧭 Координатор: обход {crawl_id}, публикация {len(components_urls)} компонентов")
+        scraper = self.scraper
+        # Потоковая запись открывается только на время сбора результатов (collect)
+        writer, scraper.writer = scraper.writer, None
+        try:
+            scraper._start_session(components_urls, proxies)
+            for component, base_url in components_urls.items():
+                total_pages = scraper.discover_pages(component, base_url)
+                with scraper.lock:
+                    lazy = component in scraper._lazy_components
+                urls = TaskDistributor.generate_page_urls(base_url, 1, total_pages)
+                self.backend.publish(component, base_url, urls, lazy=lazy)
+        finally:
+            try:
+                scraper._stop_session()
+            finally:
+                scraper.writer = writer
+
+        self.wait()
+        self.backend.close_crawl()
+        return self.collect(components_urls)
+
+    def wait(self) -> bool:
+        """Ожидает, пока у всех страниц не останется ни ожидающих, ни арендованных.
+        Истекшие аренды без попыток координатор снимает сам, не дожидаясь работников.
+        Возвращает False, если обход не закончился за timeout секунд"""
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        reported = None
+        while True:
+            self.backend.expire_leases()
+            progress = self.backend.progress()
+            active = sum(counts.get('pending', 0) + counts.get('leased', 0) for counts in progress.values())
+            if not active:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"⚠️  Обход не завершен за {self.timeout} сек, собираются готовые страницы: {progress}")
+                return False
+            if progress != reported:
+                print(f"⏳ Распределенный обход: {progress}")
+                reported = progress
+            time.sleep(self.poll_interval)
+
+    def collect(self, components_urls: Dict[str, str]) -> Dict[str, List[Dict]]:
+        """Товары всех работников без повторов по ссылке; число страниц запоминается для следующего обхода.
+        С потоковой записью товары передаются в нее и остаются в результатах, только если keep_results"""
+        scraper = self.scraper
+        writer = scraper.writer
+        total_products = 0
+        if writer is not None:
+            writer.start()
+        try:
+            for component, base_url in components_urls.items():
+                found = self.backend.found_pages(component)
+                if found:
+                    scraper.page_counts.put(base_url, found)
+                seen = set()
+                products = []
+                for product in self.backend.results(component):
+                    key = product_key(product.get('Ссылка'))
+                    if key is not None and key in seen:
+                        continue
+                    seen.add(key)
+                    products.append(product)
+                if writer is not None:
+                    for start in range(0, len(products), writer.batch_rows):
+                        writer.put(component, products[start:start + writer.batch_rows])
+                total_products += len(products)
+                scraper.results[component] = products if scraper.keep_results else []
+        finally:
+            if writer is not None:
+                try:
+                    writer.close()
+                finally:
+                    print(f"💾 Потоковая запись: {writer.stats()}")
+        scraper.page_counts.save()
+        scraper.compatibility = CompatibilityIndex.build(scraper.results)
+
+        print(f"🎉 Распределенный обход завершен! Собрано {total_products} товаров, "
+              f"страницы: {self.backend.progress()}")
+        return scraper.results
+
+
+class CrawlWorker:
+    """Работник: берет страницы из очереди в аренду, загружает своими браузерами,
+    разбирает и возвращает товары. Работает, пока координатор не закроет обход"""
+
+    def __init__(self, backend: TaskBackend, scraper, worker_id: Optional[str] = None,
+                 lease_seconds: float = 300, poll_interval: float = 1.0, crawl_id: Optional[str] = None):
+        self.backend = backend
+        self.scraper = scraper
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        # Обход, в котором участвует работник: задан явно или первый открытый, который он застал
+        self.crawl_id = crawl_id
+        self.stats = {'done': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+
+    def run(self, proxies=None, max_idle: Optional[float] = None):
+        """Обрабатывает страницы потоками scraper.max_workers; max_idle - выход после стольких
+        секунд без задач, даже если обход не закрыт"""
+        print(f"🛠️  Работник {self.worker_id}: {self.scraper.max_workers} потоков")
+        try:
+            self.scraper._start_session({}, proxies)
+            threads = [threading.Thread(target=self._loop, args=(max_idle,), daemon=True)
+                       for _ in range(self.scraper.max_workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            self.scraper._stop_session()
+        print(f"🛠️  Работник {self.worker_id} завершен: {self.stats}")
+        return self.stats
+
+    def _loop(self, max_idle: Optional[float]):
+        idle_since = time.monotonic()
+        while True:
+            task = self.backend.lease(self.worker_id, self.lease_seconds)
+            if task is None:
+                if self._crawl_finished() or (max_idle is not None and time.monotonic() - idle_since > max_idle):
+                    return
+                time.sleep(self.poll_interval)
+                continue
+
+            idle_since = time.monotonic()
+            self.process(task)
+
+    def _crawl_finished(self) -> bool:
+        """Закрыт ли обход работника. Работник, запущенный раньше координатора, видит закрытый
+        прошлый обход и ждет открытия нового, а не завершается сразу"""
+        crawl_id, closed = self.backend.crawl_state()
+        with self._stats_lock:
+            if self.crawl_id is None and crawl_id is not None and not closed:
+                self.crawl_id = crawl_id
+                print(f"🛠️  Работник {self.worker_id}: участвует в обходе {crawl_id}")
+            return self.crawl_id is not None and (crawl_id != self.crawl_id or closed)
+
+    def process(self, task: LeasedTask):
+        scraper = self.scraper
+        try:
+            print(f"Парсинг страницы: {task.url} (попытка {task.attempts})")
+            data = scraper.fetcher.fetch_page(task.url)
+            # Повторы по ссылке убирает координатор: страница может быть выдана повторно
+            products = scraper.parse_page_data(task.component, data)
+            self.backend.complete(task, products, first_key=PageFrontier.first_key(data))
+            outcome = 'done'
+        except Exception as e:
+            print(f"Ошибка при парсинге {task.url} (попытка {task.attempts}): {e}")
+            self.backend.fail(task, e)
+            outcome = 'failed'
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+
+def main(argv=None):
+    """Запуск из корня проекта:
+    python -m src.core.distributed coordinator [компоненты...]
+    python -m src.core.distributed worker"""
+    from .thread_manager import AdvancedThreadedScraper
+    from ..storage.saver import SQLDataSaver
+    from ..utils.config import Config, ScraperConfig
+
+    parser = argparse.ArgumentParser(description="Распределенный обход каталога DNS")
+    parser.add_argument('role', choices=('coordinator', 'worker'))
+    parser.add_argument('components', nargs='*', help="компоненты координатора (по умолчанию все)")
+    parser.add_argument('--max-idle', type=float, default=None, help="выход работника после простоя, сек")
+    parser.add_argument('--crawl', default=None, help="идентификатор обхода, в котором участвует работник")
+    args = parser.parse_args(argv)
+
+    config = ScraperConfig.from_settings()
+    # Страницы учитывает очередь, а не журнал; работники разбирают страницы сами и ничего не пишут
+    overrides = {'journal': None, 'parse_stage': None}
+    if args.role == 'worker':
+        overrides['writer'] = None
+    scraper = AdvancedThreadedScraper.from_config(config, **overrides)
+    backend = create_backend(config)
+    try:
+        if args.role == 'coordinator':
+            components = args.components or Config.get_components()
+            coordinator = CrawlCoordinator(backend, scraper, timeout=config.queue_crawl_timeout or None)
+            results = coordinator.run({component: Config.URLS[component] for component in components})
+            if scraper.writer is None:
+                # Без потоковой записи товары сохраняются в базу после сбора
+                for component, products in results.items():
+                    SQLDataSaver.save_data(products, component)
+        else:
+            CrawlWorker(backend, scraper, lease_seconds=config.queue_lease_seconds,
+                        crawl_id=args.crawl).run(max_idle=args.max_idle)
+    finally:
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
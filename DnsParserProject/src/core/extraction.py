@@ -0,0 +1,98 @@
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+PatternSpec = Union[str, Tuple[str, int]]
+FieldSpec = Union[PatternSpec, List[PatternSpec]]
+
+
+class SpecExtractor:
+    """Набор полей характеристик, объявленных один раз и скомпилированных при загрузке модуля.
+    Поле может быть списком альтернативных шаблонов: берется первое найденное совпадение"""
+
+    def __init__(self, fields: Dict[str, FieldSpec]):
+        self.patterns = {
+            name: tuple(self._compile(item) for item in (spec if isinstance(spec, list) else [spec]))
+            for name, spec in fields.items()
+        }
+
+    @staticmethod
+    def _compile(spec: PatternSpec) -> re.Pattern:
+        pattern, flags = (spec, 0) if isinstance(spec, str) else spec
+        return re.compile(pattern, flags)
+
+    def extract(self, text: str) -> Dict[str, Optional[re.Match]]:
+        """Ищет каждое поле в строке товара"""
+        result = {}
+        for name, alternatives in self.patterns.items():
+            match = None
+            for pattern in alternatives:
+                match = pattern.search(text)
+                if match:
+                    break
+            result[name] = match
+        return result
+
+    def extract_frame(self, texts: pd.Series) -> Dict[str, pd.DataFrame]:
+        """Постолбцовый вариант extract для parse_batch: для каждого поля таблица групп совпадения
+        (NaN, где совпадения нет). Повторяющиеся строки разбираются один раз, следующая альтернатива
+        проверяется только на строках, где предыдущие не нашли совпадения. Series.str.extract
+        для столбца object так же вызывает re.search на каждую строку, поэтому здесь не используется"""
+        codes, unique = pd.factorize(texts)
+        unique = unique.tolist()
+        result = {}
+        for name, alternatives in self.patterns.items():
+            width = max(pattern.groups for pattern in alternatives)
+            rows = [None] * len(unique)
+            pending = range(len(unique))
+            for pattern in alternatives:
+                missing = []
+                for i in pending:
+                    match = pattern.search(unique[i])
+                    if match:
+                        rows[i] = match.groups() + (None,) * (width - pattern.groups)
+                    else:
+                        missing.append(i)
+                pending = missing
+            for i in pending:
+                rows[i] = (None,) * width
+
+            groups = pd.DataFrame(rows, columns=range(width), dtype=object)
+            result[name] = groups.take(codes).set_axis(texts.index).fillna(np.nan)
+        return result
+
+    def fingerprint(self) -> str:
+        """Отпечаток набора шаблонов: меняется при любом изменении полей"""
+        source = "\n".join(f"{name}\t{pattern.pattern}\t{pattern.flags}"
+                           for name, alternatives in self.patterns.items() for pattern in alternatives)
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def text_column(values: Iterable) -> pd.Series:
+    """Столбец строк с семантикой модуля re (object, а не строковый тип pandas)"""
+    return pd.Series(list(values), dtype=object)
+
+
+def or_na(values: pd.Series, default="N/A") -> pd.Series:
+    """Подставляет значение по умолчанию там, где совпадения нет"""
+    return values.astype(object).where(values.notna(), default)
+
+
+def to_number(group: pd.Series, integer: bool = False, strict_int: bool = False) -> Tuple[pd.Series, pd.Series]:
+    """Число из группы совпадения, как float(...), int(float(...)) или int(...) при strict_int.
+    Возвращает столбец ('N/A' без совпадения) и маску строк, где число не разобралось"""
+    matched = group.notna()
+    if strict_int:
+        valid = group.str.fullmatch(r'\d+').fillna(False).astype(bool)
+        numbers = pd.to_numeric(group.where(valid), errors='coerce')
+    else:
+        numbers = pd.to_numeric(group.str.replace(',', '.', regex=False), errors='coerce')
+        valid = numbers.notna()
+
+    invalid = matched & ~valid
+    numbers = numbers.fillna(0)
+    numbers = numbers.astype('int64') if integer or strict_int else numbers.astype(float)
+    return numbers.astype(object).where(matched & valid, "N/A"), invalid
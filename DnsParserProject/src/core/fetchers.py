@@ -0,0 +1,186 @@
+import logging
+import threading
+from abc import abstractmethod
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .parser import BrowserManager, DNSScraper, extract_products_from_html, unique_by_href
+
+
+CHALLENGE_MARKERS = ('qrator', 'captcha', 'Проверка браузера')
+
+
+def is_challenge_text(text) -> bool:
+    """Страница проверки (капча, Qrator) по началу HTML"""
+    text = (text or '')[:5000].lower()
+    return any(marker.lower() in text for marker in CHALLENGE_MARKERS)
+
+
+class FetchBackend:
+    """Базовый интерфейс загрузки страницы каталога.
+    Ограничение частоты выполняется внутри движка: только он знает прокси запроса
+    и настоящий исход (код ответа, страница проверки)"""
+
+    rate_limiter = None
+    # True - паузу по хосту выдерживает оркестратор до вызова fetch_page (AsyncScraper)
+    host_throttled = False
+
+    @abstractmethod
+    def fetch_page(self, url):
+        """Возвращает [names, prices, hrefs] для страницы каталога"""
+        pass
+
+    def close(self):
+        pass
+
+    def throttle(self, url, proxy=None):
+        """Ожидает разрешения на запрос по корзинам хоста и прокси"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, proxy, host=not self.host_throttled)
+
+    def report(self, url, proxy=None, status_code=None, captcha=False):
+        """Сообщает ограничителю исход запроса: успех восстанавливает скорость, 429/403 и капча снижают"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.report(url, proxy, status_code=status_code, captcha=captcha)
+
+
+class SeleniumFetchBackend(FetchBackend):
+    """Загрузка страниц через браузеры из пула"""
+
+    def __init__(self, pool, proxies=None, extraction_mode='script', waits_factory=None, crawl_mode='pages',
+                 rate_limiter=None):
+        self.pool = pool
+        self.rate_limiter = rate_limiter
+        self.proxies = proxies
+        self.extraction_mode = extraction_mode
+        self.crawl_mode = crawl_mode
+        self.waits_factory = waits_factory
+        self.last_cookies = []
+        self.last_user_agent = None
+
+    def fetch_page(self, url):
+        with self.pool.driver() as driver:
+            # Прокси известен только после выдачи браузера: запрос учитывается и в его корзине
+            proxy = self.pool.proxy_of(driver)
+            self.throttle(url, proxy)
+            waits = self.waits_factory() if self.waits_factory else None
+            scraper = DNSScraper(self.proxies, driver=driver, extraction_mode=self.extraction_mode, waits=waits,
+                                 crawl_mode=self.crawl_mode)
+            try:
+                data = scraper.scrape_page(url)
+            except Exception:
+                if self._challenged(driver):
+                    self.report(url, proxy, captcha=True)
+                raise
+            self.report(url, proxy)
+            self.pool.record_page(driver)
+
+            # Запоминаем сессию браузера, прошедшего проверку, для HTTP-движка
+            self.last_cookies = driver.get_cookies()
+            self.last_user_agent = driver.execute_script("return navigator.userAgent")
+            return data
+
+    @staticmethod
+    def _challenged(driver) -> bool:
+        try:
+            return is_challenge_text(driver.page_source)
+        except Exception:
+            return False
+
+
+class HttpFetchBackend(FetchBackend):
+    """Загрузка страниц без браузера через пул keep-alive HTTP-соединений"""
+
+    CHALLENGE_STATUSES = (401, 403, 429, 503)
+
+    def __init__(self, fallback=None, pool_size=10, timeout=15, rate_limiter=None, proxy_pool=None):
+        self.fallback = fallback
+        self.rate_limiter = rate_limiter
+        self.proxy_pool = proxy_pool
+        self.timeout = timeout
+        self.xpathes = dict(DNSScraper.XPATHES)
+        self.stats = {'http': 0, 'fallback': 0}
+        self._stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update(BrowserManager.EXTRA_HEADERS)
+
+    def warm_up(self, driver, url):
+        """Открывает страницу в браузере и переносит его cookies и User-Agent в HTTP-сессию"""
+        driver.get(url)
+        self.load_session(driver.get_cookies(), driver.execute_script("return navigator.userAgent"))
+
+    def load_session(self, cookies, user_agent=None):
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+    def fetch_page(self, url):
+        proxy = self.proxy_pool.acquire() if self.proxy_pool else None
+        proxies = {'http': f'http://{proxy}', 'https': f'http://{proxy}'} if proxy is not None else None
+        self.throttle(url, proxy)
+
+        try:
+            response = self.session.get(url, timeout=self.timeout, proxies=proxies)
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"⚠️  HTTP-запрос {url} не удался: {e}")
+            if proxy is not None:
+                self.proxy_pool.release(proxy, success=False)
+            return self._fallback(url)
+
+        challenged = self.is_challenge(response)
+        if proxy is not None:
+            self.proxy_pool.release(proxy, success=not challenged)
+
+        # Исход сообщается до перехода на браузер: его запрос учитывается отдельно
+        self.report(url, proxy, status_code=response.status_code, captcha=challenged)
+        if challenged:
+            logging.info(f"🛡️  Страница проверки на {url}, переход на браузер")
+            return self._fallback(url)
+
+        names, prices, hrefs = extract_products_from_html(response.text, self.xpathes, response.url)
+
+        # Цены подгружаются скриптом: без браузера списки могут не совпасть по длине
+        if len(names) != len(prices) or len(names) != len(hrefs):
+            return self._fallback(url)
+
+        with self._stats_lock:
+            self.stats['http'] += 1
+        return unique_by_href([names, prices, hrefs])
+
+    def fetch_html(self, url):
+        """HTML страницы через HTTP-сессию без перехода на браузер; None при ошибке или проверке"""
+        self.throttle(url)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"⚠️  HTTP-запрос {url} не удался: {e}")
+            return None
+        challenged = self.is_challenge(response)
+        self.report(url, status_code=response.status_code, captcha=challenged)
+        return None if challenged else response.text
+
+    def is_challenge(self, response):
+        return response.status_code in self.CHALLENGE_STATUSES or is_challenge_text(response.text)
+
+    def _fallback(self, url):
+        if self.fallback is None:
+            raise RuntimeError(f"Не удалось загрузить {url} без браузера")
+
+        with self._stats_lock:
+            self.stats['fallback'] += 1
+        data = self.fallback.fetch_page(url)
+
+        # Браузер прошел проверку - обновляем сессию свежими cookies
+        if getattr(self.fallback, 'last_cookies', None):
+            self.load_session(self.fallback.last_cookies, self.fallback.last_user_agent)
+        return data
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,152 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CrawlJournal:
+    """Журнал обхода в локальном файле SQLite.
+
+    Для каждой пары (компонент, URL страницы) хранятся статус, число попыток и разобранные товары,
+    для компонента - найденное разведкой число страниц, а при ленивом обходе - самая дальняя
+    поставленная страница. Каждая страница фиксируется отдельной
+    транзакцией, поэтому после падения процесса при возобновлении повторяются только
+    незавершенные и неудачные страницы"""
+
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, path: str = 'data/crawl_journal.sqlite3'):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS components (
+                    component TEXT PRIMARY KEY,
+                    base_url TEXT NOT NULL,
+                    total_pages INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    lazy INTEGER NOT NULL DEFAULT 0
+                )""")
+            # Журналы прошлых версий без признака ленивого обхода
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(components)")}
+            if 'lazy' not in existing:
+                self._conn.execute("ALTER TABLE components ADD COLUMN lazy INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    component TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    products TEXT,
+                    error TEXT,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (component, url)
+                )""")
+
+    @classmethod
+    def from_config(cls, config) -> Optional['CrawlJournal']:
+        """Создает журнал по настройкам ScraperConfig; None, если путь не задан"""
+        return cls(config.journal_path) if config.journal_path else None
+
+    def total_pages(self, component: str, base_url: str) -> Optional[int]:
+        """Число страниц из прошлой разведки того же URL или None"""
+        state = self.component_state(component, base_url)
+        return state[0] if state else None
+
+    def component_state(self, component: str, base_url: str) -> Optional[Tuple[int, bool]]:
+        """(число страниц, ленивый обход) прошлого обхода того же URL или None.
+        Для ленивого обхода число страниц - самая дальняя поставленная страница"""
+        with self._lock:
+            row = self._conn.execute("SELECT base_url, total_pages, lazy FROM components WHERE component = ?",
+                                     (component,)).fetchone()
+        return (row[1], bool(row[2])) if row and row[0] == base_url else None
+
+    def start_component(self, component: str, base_url: str, total_pages: int, lazy: bool = False):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?, ?)",
+                               (component, base_url, total_pages, self._now(), int(lazy)))
+
+    def extend_component(self, component: str, total_pages: int):
+        """Запоминает страницу, до которой дошел ленивый обход"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE components SET total_pages = MAX(total_pages, ?), updated_at = ? "
+                               "WHERE component = ?", (total_pages, self._now(), component))
+
+    def completed_urls(self, component: str) -> set:
+        with self._lock:
+            rows = self._conn.execute("SELECT url FROM pages WHERE component = ? AND status = ?",
+                                      (component, self.DONE)).fetchall()
+        return {url for url, in rows}
+
+    def pending_urls(self, component: str, urls: Iterable[str]) -> List[str]:
+        """URL, которые еще нужно обработать: новые и неудачные, в исходном порядке"""
+        completed = self.completed_urls(component)
+        return [url for url in urls if url not in completed]
+
+    def mark_done(self, component: str, url: str, products: List[Dict]):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO pages (component, url, status, attempts, products, error, updated_at)
+                VALUES (?, ?, ?, 1, ?, NULL, ?)
+                ON CONFLICT (component, url) DO UPDATE SET
+                    status = excluded.status, attempts = attempts + 1,
+                    products = excluded.products, error = NULL, updated_at = excluded.updated_at
+            """, (component, url, self.DONE, json.dumps(products, ensure_ascii=False, default=str), self._now()))
+
+    def mark_failed(self, component: str, url: str, error: str):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO pages (component, url, status, attempts, products, error, updated_at)
+                VALUES (?, ?, ?, 1, NULL, ?, ?)
+                ON CONFLICT (component, url) DO UPDATE SET
+                    status = excluded.status, attempts = attempts + 1,
+                    error = excluded.error, updated_at = excluded.updated_at
+                WHERE status != 'done'
+            """, (component, url, self.FAILED, str(error), self._now()))
+
+    def results(self, component: str, urls: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Товары завершенных страниц компонента (или только перечисленных URL) в порядке записи"""
+        return [product for products in self.page_results(component, urls).values() for product in products]
+
+    def page_results(self, component: str, urls: Optional[Iterable[str]] = None) -> Dict[str, List[Dict]]:
+        """{URL: товары} завершенных страниц компонента (или только перечисленных URL) в порядке записи"""
+        with self._lock:
+            rows = self._conn.execute("SELECT url, products FROM pages WHERE component = ? AND status = ? "
+                                      "ORDER BY rowid", (component, self.DONE)).fetchall()
+        wanted = set(urls) if urls is not None else None
+        return {url: json.loads(products) for url, products in rows if wanted is None or url in wanted}
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """{компонент: {статус: число страниц}}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT component, status, COUNT(*) FROM pages GROUP BY component, status")
+            summary = {}
+            for component, status, count in rows:
+                summary.setdefault(component, {})[status] = count
+        return summary
+
+    def reset(self, components: Optional[Iterable[str]] = None):
+        """Забывает прошлый обход компонентов (всех, если не заданы)"""
+        with self._lock, self._conn:
+            if components is None:
+                self._conn.execute("DELETE FROM pages")
+                self._conn.execute("DELETE FROM components")
+                return
+            for component in components:
+                self._conn.execute("DELETE FROM pages WHERE component = ?", (component,))
+                self._conn.execute("DELETE FROM components WHERE component = ?", (component,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec='seconds')
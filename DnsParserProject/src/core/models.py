@@ -1,51 +1,141 @@
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Any
+from typing import Any, Dict, List, Optional
+import hashlib
 import re
 
+import numpy as np
+import pandas as pd
+
+from .extraction import SpecExtractor, text_column, or_na, to_number
+from .records import (
+    ProductRecord, RamRecord, MotherboardRecord, CpuCoolerRecord, CoolingSystemRecord, CpuRecord, GpuRecord
+)
+
+# Название товара - все до первой квадратной скобки
+TITLE_PATTERN = re.compile(r'^(.*?)(?:\s*\[|$)')
+
 
 class DataParser:
+    # Поля характеристик компонента, компилируются один раз при загрузке модуля
+    FIELDS = SpecExtractor({})
+    # Типизированная запись товара (records.py)
+    RECORD = ProductRecord
+
     @classmethod
     @abstractmethod
     def data_dict_creator(cls, component_info):
         pass
 
+    @staticmethod
+    def _title(product_string):
+        return TITLE_PATTERN.match(product_string).group(1).strip()
+
+    @classmethod
+    def parse_batch(cls, names, prices, hrefs) -> pd.DataFrame:
+        """Разбор целой страницы или компонента по столбцам: каждый шаблон применяется один раз ко всем товарам.
+        Возвращает таблицу с теми же столбцами, что и data_dict_creator; товары, которые
+        data_dict_creator не разобрал бы (None), в таблицу не попадают"""
+        if not len(names) == len(prices) == len(hrefs):
+            raise ValueError(f"Разная длина столбцов: {len(names)} названий, {len(prices)} цен, {len(hrefs)} ссылок")
+
+        frame, invalid = cls._parse_columns(names, prices, hrefs)
+        return frame[~invalid].reset_index(drop=True)
+
+    @classmethod
+    def parse_records(cls, names, prices, hrefs) -> List[ProductRecord]:
+        """Разбор в типизированные записи: числовые поля приводятся один раз при извлечении"""
+        return cls.RECORD.from_dicts(cls.parse_batch(names, prices, hrefs).to_dict('records'))
+
+    @classmethod
+    def parse_specs(cls, names) -> List[Optional[Dict[str, Any]]]:
+        """Только характеристики по названиям, без цены и ссылки; None для неразобранных товаров.
+        Разбор построчный: на уникальных названиях страницы data_dict_creator быстрее parse_batch,
+        которому нужны преобразования столбцов pandas (benchmarks/bench_batch.py)"""
+        specs = []
+        for name in names:
+            spec = cls.data_dict_creator([name, None, None])
+            if spec is not None:
+                del spec["Цена"], spec["Ссылка"]
+            specs.append(spec)
+        return specs
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Отпечаток всех шаблонов парсера: поля, дополнительные выражения и списки слов"""
+        parts = [cls.FIELDS.fingerprint()]
+        for name in sorted(dir(cls)):
+            value = getattr(cls, name)
+            if isinstance(value, SpecExtractor) and name != 'FIELDS':
+                parts.append(f"{name}={value.fingerprint()}")
+            elif isinstance(value, re.Pattern):
+                parts.append(f"{name}={value.pattern}/{value.flags}")
+            elif isinstance(value, tuple) and all(isinstance(item, str) for item in value):
+                parts.append(f"{name}={'|'.join(value)}")
+        return hashlib.sha1("\n".join(parts).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _parse_columns(cls, names, prices, hrefs):
+        names = text_column(names)
+        groups = cls.FIELDS.extract_frame(names)
+        frame, invalid = cls._build_frame(names, text_column(prices), text_column(hrefs), groups)
+        return frame, invalid.to_numpy(dtype=bool)
+
+    @classmethod
+    def parse_page(cls, data) -> pd.DataFrame:
+        """Разбор результата DNSScraper.scrape_page: [names, prices, hrefs]"""
+        names, prices, hrefs = data
+        return cls.parse_batch(names, prices, hrefs)
+
+    @classmethod
+    @abstractmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        """Собирает таблицу из групп совпадений; возвращает (таблица, маска неразобранных строк)"""
+        pass
+
+    @staticmethod
+    def _titles(names):
+        return names.str.extract(TITLE_PATTERN.pattern, expand=True)[0].str.strip()
+
 class RamDataParser(DataParser):
+    RECORD = RamRecord
+    FIELDS = SpecExtractor({
+        'capacity': (r'([\d.]+)\s*Г?Б', re.IGNORECASE),
+        'type': (r'(DDR\d+)', re.IGNORECASE),
+        'speed': (r'([\d.]+)\s*М?Гц', re.IGNORECASE),
+        # Форматы таймингов: 11(CL)-11-11-28, CL11-11-11-28 или 11-11-11-28
+        'timings': [
+            r'(\d+)\(CL\)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)',
+            r'CL(\d+)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)',
+            r'(\d+)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)',
+        ],
+        'modules': (r'([\d.]+)\s*Г?Б?x?\s*([\d.]+)\s*шт', re.IGNORECASE),
+    })
+
     @classmethod
     def data_dict_creator(cls, component_info):
         ram_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
         # Дополнительные поиски для параметров
-        capacity_match = re.search(r'([\d.]+)\s*Г?Б', ram_string, re.IGNORECASE)
-        type_match = re.search(r'(DDR\d+)', ram_string, re.IGNORECASE)
-        speed_match = re.search(r'([\d.]+)\s*М?Гц', ram_string, re.IGNORECASE)
-        timings_match = re.search(r'(\d+)\(CL\)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)', ram_string) or \
-                        re.search(r'CL(\d+)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)', ram_string) or \
-                        re.search(r'(\d+)[\s-]*(\d+)[\s-]*(\d+)[\s-]*(\d+)', ram_string)
-        modules_match = re.search(r'([\d.]+)\s*Г?Б?x?\s*([\d.]+)\s*шт', ram_string, re.IGNORECASE)
+        fields = cls.FIELDS.extract(ram_string)
+        capacity_match = fields['capacity']
+        type_match = fields['type']
+        speed_match = fields['speed']
+        timings_match = fields['timings']
+        modules_match = fields['modules']
 
         try:
             # Формируем строку таймингов
             if timings_match:
-                if ram_string.count('(CL)') > 0:
-                    # Формат с (CL): 11(CL)-11-11-28
-                    timings_str = f"{timings_match.group(1)}-{timings_match.group(2)}-{timings_match.group(3)}-{timings_match.group(4)}"
-                    cl = timings_match.group(1)
-                elif 'CL' in ram_string:
-                    # Формат с CL: CL11-11-11-28
-                    timings_str = f"{timings_match.group(1)}-{timings_match.group(2)}-{timings_match.group(3)}-{timings_match.group(4)}"
-                    cl = timings_match.group(1)
-                else:
-                    # Простой формат: 11-11-11-28
-                    timings_str = f"{timings_match.group(1)}-{timings_match.group(2)}-{timings_match.group(3)}-{timings_match.group(4)}"
-                    cl = timings_match.group(1)
+                timings_str = f"{timings_match.group(1)}-{timings_match.group(2)}-{timings_match.group(3)}-{timings_match.group(4)}"
+                cl = timings_match.group(1)
             else:
                 timings_str = "N/A"
                 cl = "N/A"
 
             result = {
-                "Название": re.match(r'^(.*?)(?:\s*\[|$)', ram_string).group(1).strip(),
+                "Название": cls._title(ram_string),
                 "Цена": price,
                 "Ссылка": href,
                 "Общий объем (ГБ)": float(capacity_match.group(1).replace(',', '.')) if capacity_match else "N/A",
@@ -61,24 +151,55 @@ class RamDataParser(DataParser):
             print(f"Ошибка обработки данных: {e} в строке: {ram_string}")
             return None
 
+    @classmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        capacity, bad_capacity = to_number(groups['capacity'][0])
+        module_size, bad_module = to_number(groups['modules'][0])
+        modules_count, bad_count = to_number(groups['modules'][1], strict_int=True)
+        speed, bad_speed = to_number(groups['speed'][0], integer=True)
+        timings = groups['timings']
+
+        frame = pd.DataFrame({
+            "Название": cls._titles(names),
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Общий объем (ГБ)": capacity,
+            "Тип памяти": or_na(groups['type'][0].str.upper()),
+            "Размер модуля (ГБ)": module_size,
+            "Количество модулей": modules_count,
+            "Частота (МГц)": speed,
+            "Тайминги": or_na(timings[0] + '-' + timings[1] + '-' + timings[2] + '-' + timings[3]),
+            "Латентность (CL)": or_na(timings[0]),
+        })
+        return frame, bad_capacity | bad_module | bad_count | bad_speed
+
 
 class MotherboardDataParser(DataParser):
+    RECORD = MotherboardRecord
+    FIELDS = SpecExtractor({
+        'socket': (r'\b(LGA\s?\d+|BGA\d+|Socket\s?\d+|s\d+)\b', re.IGNORECASE),
+        'chipset': (r'(Intel|AMD)\s*([A-Z0-9]+)', re.IGNORECASE),
+        'ram_slots': (r'(\d+)x(DDR\d[L]?)[-\s]*(\d+)?\s*МГц', re.IGNORECASE),
+        'form_factor': (r'(Micro-ATX|Mini-ITX|Mini-DTX|ATX|E-ATX|XL-ATX|Thin Mini-ITX)', re.IGNORECASE),
+        'pcie': (r'(\d+)xPCI-Ex(\d+)', re.IGNORECASE),
+    })
+
     @classmethod
     def data_dict_creator(cls, component_info):
         mb_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
         # Основные параметры для поиска
-        socket_match = re.search(r'\b(LGA\s?\d+|BGA\d+|Socket\s?\d+|s\d+)\b', mb_string, re.IGNORECASE)
-        chipset_match = re.search(r'(Intel|AMD)\s*([A-Z0-9]+)', mb_string, re.IGNORECASE)
-        ram_slots_match = re.search(r'(\d+)x(DDR\d[L]?)[-\s]*(\d+)?\s*МГц', mb_string, re.IGNORECASE)
-        form_factor_match = re.search(r'(Micro-ATX|Mini-ITX|Mini-DTX|ATX|E-ATX|XL-ATX|Thin Mini-ITX)', mb_string,
-                                      re.IGNORECASE)
-        pcie_match = re.search(r'(\d+)xPCI-Ex(\d+)', mb_string, re.IGNORECASE)
+        fields = cls.FIELDS.extract(mb_string)
+        socket_match = fields['socket']
+        chipset_match = fields['chipset']
+        ram_slots_match = fields['ram_slots']
+        form_factor_match = fields['form_factor']
+        pcie_match = fields['pcie']
 
         try:
             result = {
-                "Название": re.match(r'^(.*?)(?:\s*\[|$)', mb_string).group(1).strip(),
+                "Название": cls._title(mb_string),
                 "Цена": price,
                 "Ссылка": href,
                 "Сокет": socket_match.group() if socket_match else "N/A",
@@ -97,23 +218,59 @@ class MotherboardDataParser(DataParser):
             print(f"Ошибка обработки данных: {e} в строке: {mb_string}")
             return None
 
+    @classmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        chipset = groups['chipset']
+        ram_slots = groups['ram_slots']
+        pcie = groups['pcie']
+        slots_count, bad_slots = to_number(ram_slots[0], strict_int=True)
+        pcie_count, bad_pcie = to_number(pcie[0], strict_int=True)
+
+        frame = pd.DataFrame({
+            "Название": cls._titles(names),
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Сокет": or_na(groups['socket'][0]),
+            "Чипсет": or_na(chipset[0] + ' ' + chipset[1]),
+            "Количество слотов памяти": slots_count,
+            "Тип слотов памяти": or_na(ram_slots[1].str.upper()),
+            "Частота слотов памяти": or_na(ram_slots[2] + ' МГц'),
+            "Форм-фактор": or_na(groups['form_factor'][0], "Нестандартный"),
+            "Количество слотов PCI-E": pcie_count,
+            "Версия слотов PCI-E": or_na('x' + pcie[1]),
+        })
+        return frame, bad_slots | bad_pcie
+
 class CpuCoolerDataParser(DataParser):
+    RECORD = CpuCoolerRecord
+    FIELDS = SpecExtractor({
+        'base': (r'основание\s*-\s*([а-яА-Яa-zA-Z]+)', re.IGNORECASE),
+        'rpm': r'(\d+)\s*об/\s*мин',
+        'noise': r'(\d+\.?\d*)\s*дБ',
+        'pin': (r'(\d+)\s*pin', re.IGNORECASE),
+        'tdp': r'(\d+)\s*Вт',
+        'fan_size': r'(\d+)\s*мм',
+    })
+    # Размер вентилятора по названию (например, R94 может означать 94мм)
+    FAN_SIZE_FROM_NAME = re.compile(r'(\d{2,3})(?:mm|мм|\s*мм)?')
+
     @classmethod
     def data_dict_creator(cls, component_info):
         cooler_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
         # Основные параметры для поиска
-        base_match = re.search(r'основание\s*-\s*([а-яА-Яa-zA-Z]+)', cooler_string, re.IGNORECASE)
-        rpm_match = re.search(r'(\d+)\s*об/\s*мин', cooler_string)
-        noise_match = re.search(r'(\d+\.?\d*)\s*дБ', cooler_string)
-        pin_match = re.search(r'(\d+)\s*pin', cooler_string, re.IGNORECASE)
-        tdp_match = re.search(r'(\d+)\s*Вт', cooler_string)
-        fan_size_match = re.search(r'(\d+)\s*мм', cooler_string)
+        fields = cls.FIELDS.extract(cooler_string)
+        base_match = fields['base']
+        rpm_match = fields['rpm']
+        noise_match = fields['noise']
+        pin_match = fields['pin']
+        tdp_match = fields['tdp']
+        fan_size_match = fields['fan_size']
 
         try:
             result = {
-                "Название": re.match(r'^(.*?)(?:\s*\[|$)', cooler_string).group(1).strip(),
+                "Название": cls._title(cooler_string),
                 "Цена": price,
                 "Ссылка": href,
                 "Материал основания": base_match.group(1).capitalize() if base_match else "N/A",
@@ -126,7 +283,7 @@ class CpuCoolerDataParser(DataParser):
 
             # Дополнительно проверяем размер вентилятора по названию (например, R94 может означать 94мм)
             if result["Размер вентилятора"] == "N/A":
-                size_from_name = re.search(r'(\d{2,3})(?:mm|мм|\s*мм)?', result["Название"])
+                size_from_name = cls.FAN_SIZE_FROM_NAME.search(result["Название"])
                 if size_from_name:
                     result["Размер вентилятора"] = f"{size_from_name.group(1)} мм"
 
@@ -135,23 +292,55 @@ class CpuCoolerDataParser(DataParser):
             print(f"Ошибка обработки данных: {e} в строке: {cooler_string}")
             return None
 
+    @classmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        titles = cls._titles(names)
+        fan_size = groups['fan_size'][0]
+        # Размер вентилятора по названию, если в характеристиках его нет
+        fan_size = fan_size.where(fan_size.notna(), titles.str.extract(cls.FAN_SIZE_FROM_NAME.pattern, expand=True)[0])
+
+        frame = pd.DataFrame({
+            "Название": titles,
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Материал основания": or_na(groups['base'][0].str.capitalize()),
+            "Скорость вращения": or_na(groups['rpm'][0] + ' об/мин'),
+            "Уровень шума": or_na(groups['noise'][0] + ' дБ'),
+            "Разъем питания": or_na(groups['pin'][0] + ' pin'),
+            "Макс. TDP": or_na(groups['tdp'][0] + ' Вт'),
+            "Размер вентилятора": or_na(fan_size + ' мм'),
+        })
+        return frame, pd.Series(False, index=names.index)
+
 
 class CoolingSystemDataParser(DataParser):
+    RECORD = CoolingSystemRecord
+    FIELDS = SpecExtractor({
+        'fan_size': r'(\d+)\s*мм',
+        'sections': r'(\d+)\s*секци[ияей]',
+        'power': (r'(SATA Power|3 pin|4 pin|15 pin)', re.IGNORECASE),
+        'radiator': (r'радиатор\s*-\s*([а-яА-Яa-zA-Z]+)', re.IGNORECASE),
+        'tdp': (r'TDP\s*(\d+)\s*Вт', re.IGNORECASE),
+        'fan_count': r'(\d+)\s*вентилятор',
+    })
+    LIQUID_WORDS = ('liquid', 'water', 'сжо', 'жидкост')
+
     @classmethod
     def data_dict_creator(cls, component_info):
         cooling_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
         # Основные параметры для поиска
-        fan_size_match = re.search(r'(\d+)\s*мм', cooling_string)
-        sections_match = re.search(r'(\d+)\s*секци[ияей]', cooling_string)
-        power_match = re.search(r'(SATA Power|3 pin|4 pin|15 pin)', cooling_string, re.IGNORECASE)
-        radiator_match = re.search(r'радиатор\s*-\s*([а-яА-Яa-zA-Z]+)', cooling_string, re.IGNORECASE)
-        tdp_match = re.search(r'TDP\s*(\d+)\s*Вт', cooling_string, re.IGNORECASE)
-        fan_count_match = re.search(r'(\d+)\s*вентилятор', cooling_string)
+        fields = cls.FIELDS.extract(cooling_string)
+        fan_size_match = fields['fan_size']
+        sections_match = fields['sections']
+        power_match = fields['power']
+        radiator_match = fields['radiator']
+        tdp_match = fields['tdp']
+        fan_count_match = fields['fan_count']
         try:
             result = {
-                "Название": re.match(r'^(.*?)(?:\s*\[|$)', cooling_string).group(1).strip(),
+                "Название": cls._title(cooling_string),
                 "Цена": price,
                 "Ссылка": href,
                 "Размер вентилятора(ов)": f"{fan_size_match.group(1)} мм" if fan_size_match else "N/A",
@@ -164,8 +353,8 @@ class CoolingSystemDataParser(DataParser):
             }
 
             # Автоматическое определение типа охлаждения по названию
-            if result["Тип охлаждения"] == "N/A":
-                if any(word in cooling_string.lower() for word in ['liquid', 'water', 'сжо', 'жидкост']):
+            if result.get("Тип охлаждения", "N/A") == "N/A":
+                if any(word in cooling_string.lower() for word in cls.LIQUID_WORDS):
                     result["Тип охлаждения"] = "Жидкостное"
                 else:
                     result["Тип охлаждения"] = "Воздушное"
@@ -184,33 +373,67 @@ class CoolingSystemDataParser(DataParser):
             print(f"Ошибка обработки данных: {e} в строке: {cooling_string}")
             return None
 
+    @classmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        titles = cls._titles(names)
+        sections = or_na(groups['sections'][0], "1")
+        fan_count = groups['fan_count'][0]
+        fan_count = fan_count.where(fan_count.notna(), sections)
+
+        liquid = names.str.lower().str.contains('|'.join(cls.LIQUID_WORDS), regex=True)
+        # Уточнение количества вентиляторов для СЖО по названию
+        fan_count = pd.Series(np.select(
+            [liquid & titles.str.contains('360', regex=False),
+             liquid & titles.str.contains('240', regex=False),
+             liquid & titles.str.contains('120', regex=False)],
+            ["3", "2", "1"],
+            default=fan_count.to_numpy(dtype=object),
+        ), index=names.index, dtype=object)
+
+        frame = pd.DataFrame({
+            "Название": titles,
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Размер вентилятора(ов)": or_na(groups['fan_size'][0] + ' мм'),
+            "Количество секций": sections,
+            "Количество вентиляторов": fan_count,
+            "Питание": or_na(groups['power'][0]),
+            "Материал радиатора": or_na(groups['radiator'][0].str.capitalize()),
+            "TDP": or_na(groups['tdp'][0] + ' Вт'),
+            "Тип охлаждения": pd.Series(np.where(liquid, "Жидкостное", "Воздушное"), index=names.index, dtype=object),
+        })
+        return frame, pd.Series(False, index=names.index)
+
 class CpuDataParser(DataParser):
+    RECORD = CpuRecord
+    # Универсальный шаблон для всех типов процессоров
+    PATTERN = re.compile(r"""
+        ^(.*?)\s*                # Название процессора
+        (?:\[.*?)?               # Опциональное начало характеристик
+        (LGA\s\d+|AM\d|FM\d\+?|Socket\s*\d+),?\s*  # Сокет (LGA 1200, AM4, FM2+, Socket AM4)
+        (?:.*?)?                 # Пропускаем возможные дополнительные символы
+        (\d+)\s*(?:ядер[а]?|x|х)\s*  # Количество ядер
+        (?:.*?)?                 # Пропускаем возможные дополнительные символы
+        ([\d.]+)\s*ГГц,?\s*      # Частота
+        (?:L2\s*[-—]?\s*([\d.]+)\s*МБ,?\s*)?  # Опциональный L2
+        (?:L3\s*[-—]?\s*([\d.]+)\s*МБ,?\s*)?  # Опциональный L3
+        (?:.*?)?                 # Пропускаем возможные дополнительные характеристики
+        (\d+)\s*(?:x|х|канал[а]?|каналов)\s*(?:DDR\d[L]?)\s*,?\s*  # Память
+        (?:.*?)?                 # Пропускаем возможные дополнительные символы
+        (?:([^,]+?),?\s*)?       # Графика (опционально)
+        (?:.*?)?                 # Пропускаем возможные дополнительные символы
+        TDP\s*[-—]?\s*([\d.]+)\s*Вт  # TDP
+        .*?$                    # Конец строки
+    """, re.VERBOSE | re.IGNORECASE)
+    FIELDS = SpecExtractor({'cpu': (PATTERN.pattern, PATTERN.flags)})
+
     @classmethod
     def data_dict_creator(cls, component_info):
         cpu_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
-        # Универсальный шаблон для всех типов процессоров
-        pattern = r"""
-            ^(.*?)\s*                # Название процессора
-            (?:\[.*?)?               # Опциональное начало характеристик
-            (LGA\s\d+|AM\d|FM\d\+?|Socket\s*\d+),?\s*  # Сокет (LGA 1200, AM4, FM2+, Socket AM4)
-            (?:.*?)?                 # Пропускаем возможные дополнительные символы
-            (\d+)\s*(?:ядер[а]?|x|х)\s*  # Количество ядер
-            (?:.*?)?                 # Пропускаем возможные дополнительные символы
-            ([\d.]+)\s*ГГц,?\s*      # Частота
-            (?:L2\s*[-—]?\s*([\d.]+)\s*МБ,?\s*)?  # Опциональный L2
-            (?:L3\s*[-—]?\s*([\d.]+)\s*МБ,?\s*)?  # Опциональный L3
-            (?:.*?)?                 # Пропускаем возможные дополнительные характеристики
-            (\d+)\s*(?:x|х|канал[а]?|каналов)\s*(?:DDR\d[L]?)\s*,?\s*  # Память
-            (?:.*?)?                 # Пропускаем возможные дополнительные символы
-            (?:([^,]+?),?\s*)?       # Графика (опционально)
-            (?:.*?)?                 # Пропускаем возможные дополнительные символы
-            TDP\s*[-—]?\s*([\d.]+)\s*Вт  # TDP
-            .*?$                    # Конец строки
-        """
-
-        match = re.search(pattern, cpu_string, re.VERBOSE | re.IGNORECASE)
+
+        match = cls.PATTERN.search(cpu_string)
         if not match:
             print(f"Не удалось распарсить строку: {cpu_string}")
             return None
@@ -233,39 +456,73 @@ class CpuDataParser(DataParser):
             print(f"Ошибка обработки данных: {e} в строке: {cpu_string}")
             return None
 
-class GpuDataParser(DataParser):
     @classmethod
-    def data_dict_creator(cls, component_info):
-        def extract_connectors(gpu_string):
-            connectors = []
-            connector_patterns = {
-                "DVI": r"DVI[- ]?[ID]?",
-                "HDMI": r"HDMI",
-                "VGA": r"VGA|D-Sub",
-                "DisplayPort": r"DisplayPort|DP"
-            }
+    def _build_frame(cls, names, prices, hrefs, groups):
+        match = groups['cpu']
+        cores, bad_cores = to_number(match[2], strict_int=True)
+        frequency, bad_frequency = to_number(match[3])
+        l2, bad_l2 = to_number(match[4])
+        l3, bad_l3 = to_number(match[5])
+        channels, bad_channels = to_number(match[6], strict_int=True)
+        tdp, bad_tdp = to_number(match[8], integer=True)
+
+        frame = pd.DataFrame({
+            "Название": match[0].str.strip(),
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Сокет": match[1].str.strip(),
+            "Количество ядер": cores,
+            "Частота (ГГц)": frequency,
+            "Кэш L2 (МБ)": l2,
+            "Кэш L3 (МБ)": l3,
+            "Количество каналов памяти": channels,
+            "Графика": or_na(match[7].str.strip(), "Нет"),
+            "TDP (Вт)": tdp,
+        })
+        # Строки, которые шаблон не распознал, отбрасываются, как и в data_dict_creator
+        unmatched = match[0].isna()
+        return frame, unmatched | bad_cores | bad_frequency | bad_l2 | bad_l3 | bad_channels | bad_tdp
 
-            for name, pattern in connector_patterns.items():
-                if re.search(pattern, gpu_string, re.IGNORECASE):
-                    connectors.append(name)
+class GpuDataParser(DataParser):
+    RECORD = GpuRecord
+    FIELDS = SpecExtractor({
+        'memory_bus': r'([\d.]+)\s*бит',
+        'memory_type': (r'(DDR\d|GDDR\d)', re.IGNORECASE),
+        'memory_size': (r'([\d.]+)\s*Г?Б', re.IGNORECASE),
+        'gpu_clock': (r'(?:GPU\s*:?\s*)?([\d.]+)\s*М?Гц', re.IGNORECASE),
+        'memory_clock': (r'(?:память\s*:?\s*)?([\d.]+)\s*М?Гц', re.IGNORECASE),
+        'pcie': (r'PCI[Ee]\s*([\d.]+)', re.IGNORECASE),
+    })
+    CONNECTORS = SpecExtractor({
+        "DVI": (r"DVI[- ]?[ID]?", re.IGNORECASE),
+        "HDMI": (r"HDMI", re.IGNORECASE),
+        "VGA": (r"VGA|D-Sub", re.IGNORECASE),
+        "DisplayPort": (r"DisplayPort|DP", re.IGNORECASE)
+    })
 
-            return ", ".join(connectors) if connectors else "N/A"
+    @classmethod
+    def extract_connectors(cls, gpu_string):
+        connectors = [name for name, match in cls.CONNECTORS.extract(gpu_string).items() if match]
+        return ", ".join(connectors) if connectors else "N/A"
 
+    @classmethod
+    def data_dict_creator(cls, component_info):
         gpu_string = component_info[0]
         price = component_info[1]
         href = component_info[2]
 
         # Дополнительные поиски для параметров, которые могут быть в разных местах
-        memory_bus_match = re.search(r'([\d.]+)\s*бит', gpu_string)
-        memory_type_match = re.search(r'(DDR\d|GDDR\d)', gpu_string, re.IGNORECASE)
-        memory_size_match = re.search(r'([\d.]+)\s*Г?Б', gpu_string, re.IGNORECASE)
-        gpu_clock_match = re.search(r'(?:GPU\s*:?\s*)?([\d.]+)\s*М?Гц', gpu_string, re.IGNORECASE)
-        memory_clock_match = re.search(r'(?:память\s*:?\s*)?([\d.]+)\s*М?Гц', gpu_string, re.IGNORECASE)
-        pcie_match = re.search(r'PCI[Ee]\s*([\d.]+)', gpu_string, re.IGNORECASE)
+        fields = cls.FIELDS.extract(gpu_string)
+        memory_bus_match = fields['memory_bus']
+        memory_type_match = fields['memory_type']
+        memory_size_match = fields['memory_size']
+        gpu_clock_match = fields['gpu_clock']
+        memory_clock_match = fields['memory_clock']
+        pcie_match = fields['pcie']
 
         try:
             result = {
-                "Название": re.match(r'^(.*?)(?:\s*\[|$)', gpu_string).group(1).strip(),
+                "Название": cls._title(gpu_string),
                 "Цена": price,
                 "Ссылка": href,
                 "Объем памяти (ГБ)": float(
@@ -277,13 +534,40 @@ class GpuDataParser(DataParser):
                 "Частота памяти (МГц)": int(
                     float(memory_clock_match.group(1).replace(',', '.'))) if memory_clock_match else "N/A",
                 "Версия PCIe": pcie_match.group(1) if pcie_match else "N/A",
-                "Разъемы": extract_connectors(gpu_string)
+                "Разъемы": cls.extract_connectors(gpu_string)
             }
             return result
         except (ValueError, AttributeError, IndexError) as e:
             print(f"Ошибка обработки данных: {e} в строке: {gpu_string}")
             return None
 
+    @classmethod
+    def _build_frame(cls, names, prices, hrefs, groups):
+        memory_size, bad_size = to_number(groups['memory_size'][0])
+        memory_bus, bad_bus = to_number(groups['memory_bus'][0], strict_int=True)
+        gpu_clock, bad_gpu_clock = to_number(groups['gpu_clock'][0], integer=True)
+        memory_clock, bad_memory_clock = to_number(groups['memory_clock'][0], integer=True)
+
+        connectors = pd.Series('', index=names.index, dtype=object)
+        for name, alternatives in cls.CONNECTORS.patterns.items():
+            found = names.str.contains(alternatives[0].pattern, flags=alternatives[0].flags, regex=True)
+            connectors = connectors + np.where(found, name + ', ', '')
+        connectors = connectors.str.rstrip(', ')
+
+        frame = pd.DataFrame({
+            "Название": cls._titles(names),
+            "Цена": prices,
+            "Ссылка": hrefs,
+            "Объем памяти (ГБ)": memory_size,
+            "Тип памяти": or_na(groups['memory_type'][0].str.upper()),
+            "Шина памяти (бит)": memory_bus,
+            "Частота GPU (МГц)": gpu_clock,
+            "Частота памяти (МГц)": memory_clock,
+            "Версия PCIe": or_na(groups['pcie'][0]),
+            "Разъемы": connectors.where(connectors != '', "N/A"),
+        })
+        return frame, bad_size | bad_bus | bad_gpu_clock | bad_memory_clock
+
 
 @dataclass
 class ParserResult:
@@ -560,6 +844,191 @@ class ComponentScorer:
 
         return round(score, 2)
 
+    # Названия компонентов парсеров, которые оцениваются методами охлаждения
+    FRAME_ALIASES = {'cpu_cooler': 'air_cooler', 'cooling_system': 'water_cooling'}
+
+    def score_frame(self, component, frame: pd.DataFrame) -> np.ndarray:
+        """Оценка всего каталога компонента за один проход по столбцам.
+        Результат совпадает с score_<компонент> для каждой строки; NaN там, где скалярный
+        метод выбросил бы исключение или значение отсутствует"""
+        component = self.FRAME_ALIASES.get(component, component)
+        scorer = getattr(self, f"_score_{component}_frame", None)
+        if scorer is None:
+            raise ValueError(f"Неизвестный тип компонента: {component}")
+        if len(frame) == 0:
+            return np.empty(0)
+
+        columns = {}
+
+        def column(name, convert=None):
+            # Значение поля как массив float; заодно копится маска ошибок преобразования
+            if name not in frame:
+                raise KeyError(name)
+            values = self._numeric_column(frame[name], convert)
+            columns[name] = values
+            return values
+
+        score = scorer(frame, column, self.weights[component])
+        invalid = np.zeros(len(frame), dtype=bool)
+        for values in columns.values():
+            invalid |= np.isnan(values)
+        score = np.where(invalid, np.nan, score)
+        return np.array([round(value, 2) for value in score.tolist()])
+
+    def score_batch(self, component, columns) -> np.ndarray:
+        """Оценка по столбцам-массивам {поле: значения} или списку словарей характеристик"""
+        return self.score_frame(component, pd.DataFrame(columns))
+
+    def score_records(self, component, records: List[ProductRecord]) -> np.ndarray:
+        """Оценка типизированных записей: числовые поля уже разобраны, строки с единицами не разбираются"""
+        if not records:
+            return np.empty(0)
+        return self.score_frame(component, type(records[0]).to_frame(records))
+
+    @staticmethod
+    def _numeric_column(series: pd.Series, convert=None) -> np.ndarray:
+        """Числовое значение поля: сначала convert (как в скалярных методах), затем только числа;
+        строки и ошибки преобразования дают NaN"""
+        if convert is None and pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            return series.to_numpy(dtype=float, na_value=np.nan)
+
+        result = np.empty(len(series))
+        for i, value in enumerate(series.tolist()):
+            try:
+                value = convert(value) if convert is not None else value
+            except (ValueError, TypeError, AttributeError, IndexError):
+                value = None
+            result[i] = value if isinstance(value, (int, float, np.number)) else np.nan
+        return result
+
+    @staticmethod
+    def _lookup(series: pd.Series, table, default, convert=None) -> np.ndarray:
+        """Оценка по таблице значений, как table.get(value, default)"""
+        values = series.tolist() if convert is None else [convert(value) for value in series.tolist()]
+        return np.array([table.get(value, default) for value in values], dtype=float)
+
+    @staticmethod
+    def _leading_number(number_type):
+        # Число из строки вида '2000 об/мин'; нестроковые значения используются как есть
+        return lambda value: number_type(value.split()[0]) if isinstance(value, str) else value
+
+    def _score_cpu_frame(self, frame, column, weights):
+        cores = column('Количество ядер')
+        cores_score = np.where(cores <= 16, np.minimum(cores * 10, 100), 100)
+        score = cores_score * weights['Количество ядер']
+
+        frequency = column('Частота (ГГц)')
+        freq_score = np.where(frequency * 1000 <= 5000, np.minimum((frequency * 1000 - 2000) / 20, 100), 100)
+        score = score + freq_score * weights['Частота (ГГц)']
+
+        score = score + np.minimum(column('Кэш L2 (МБ)') * 5, 100) * weights['Кэш L2 (МБ)']
+        score = score + np.minimum(column('Кэш L3 (МБ)') * 2, 100) * weights['Кэш L3 (МБ)']
+
+        channels_score = self._lookup(frame['Количество каналов памяти'], {1: 30, 2: 70, 4: 100, 8: 100}, 0)
+        score = score + channels_score * weights['Количество каналов памяти']
+
+        graphics_score = np.where(frame['Графика'].to_numpy(dtype=object) != 'Нет', 100, 0)
+        score = score + graphics_score * weights['Графика']
+
+        score = score + np.maximum(0, 100 - (column('TDP (Вт)') / 2)) * weights['TDP (Вт)']
+        return score
+
+    def _score_ram_frame(self, frame, column, weights):
+        score = np.minimum(column('Общий объем (ГБ)') * 2, 100) * weights['Общий объем (ГБ)']
+
+        memory_type_score = self._lookup(frame['Тип памяти'], {'DDR3': 30, 'DDR4': 70, 'DDR5': 100}, 0)
+        score = score + memory_type_score * weights['Тип памяти']
+
+        score = score + np.minimum(column('Размер модуля (ГБ)') * 5, 100) * weights['Размер модуля (ГБ)']
+        score = score + np.minimum(column('Количество модулей') * 25, 100) * weights['Количество модулей']
+
+        frequency = column('Частота (МГц)')
+        freq_table = {2133: 30, 2666: 40, 3200: 60, 3600: 70, 4000: 80, 4800: 90, 5600: 100}
+        freq_score = np.maximum(self._lookup(frame['Частота (МГц)'], freq_table, 0), np.minimum(frequency / 40, 100))
+        score = score + freq_score * weights['Частота (МГц)']
+
+        timings = column('Тайминги', lambda value: float(value.split('-')[0])
+                         if isinstance(value, str) and '-' in value else value)
+        score = score + np.maximum(0, 100 - (timings * 5)) * weights['Тайминги']
+
+        score = score + np.maximum(0, 100 - (column('Латентность (CL)') * 10)) * weights['Латентность (CL)']
+        return score
+
+    def _score_motherboard_frame(self, frame, column, weights):
+        chipset_scores = {
+            'H610': 40, 'B660': 60, 'H670': 70, 'Z690': 85, 'Z790': 95,
+            'A520': 40, 'B550': 65, 'X570': 85, 'X670': 95
+        }
+        score = self._lookup(frame['Чипсет'], chipset_scores, 50) * weights['Чипсет']
+
+        score = score + np.minimum(column('Количество слотов памяти') * 25, 100) * weights['Количество слотов памяти']
+
+        memory_type_score = np.where(frame['Тип слотов памяти'].isin(['DDR4', 'DDR5']).to_numpy(), 100, 50)
+        score = score + memory_type_score * weights['Тип слотов памяти']
+
+        mem_freq = column('Частота слотов памяти', self._leading_number(int))
+        score = score + np.minimum(mem_freq / 40, 100) * weights['Частота слотов памяти']
+
+        form_factor_scores = {'Mini-ITX': 60, 'Micro-ATX': 70, 'ATX': 85, 'E-ATX': 95}
+        score = score + self._lookup(frame['Форм-фактор'], form_factor_scores, 50) * weights['Форм-фактор']
+
+        score = score + np.minimum(column('Количество слотов PCI-E') * 20, 100) * weights['Количество слотов PCI-E']
+
+        brand = column('Поддержка CPU', lambda value: 100 if any(b in value.lower() for b in ['intel', 'amd']) else 0)
+        score = score + brand * weights['Поддержка CPU']
+        return score
+
+    def _score_air_cooler_frame(self, frame, column, weights):
+        material_scores = {'aluminum': 60, 'copper': 85, 'copper+heatpipes': 100}
+        material = column('Материал основания', lambda value: material_scores.get(value.lower(), 50))
+        score = material * weights['Материал основания']
+
+        speed = column('Скорость вращения', self._leading_number(int))
+        score = score + np.minimum(speed / 20, 100) * weights['Скорость вращения']
+
+        noise = column('Уровень шума', self._leading_number(float))
+        score = score + np.maximum(0, 100 - (noise * 5)) * weights['Уровень шума']
+
+        connector_scores = {'3pin': 60, '4pin': 85, 'PWM': 100}
+        connector_score = self._lookup(frame['Разъем питания'], connector_scores, 50, lambda value: ''.join(
+            filter(str.isdigit, value)) if isinstance(value, str) else str(value))
+        score = score + connector_score * weights['Разъем питания']
+
+        score = score + np.minimum(column('Макс. TDP', self._leading_number(int)) / 2, 100) * weights['Макс. TDP']
+        size = column('Размер вентилятора', self._leading_number(int))
+        score = score + np.minimum(size / 2, 100) * weights['Размер вентилятора']
+        return score
+
+    def _score_water_cooling_frame(self, frame, column, weights):
+        fan_size = column('Размер вентилятора(ов)', self._leading_number(int))
+        score = np.minimum(fan_size / 2, 100) * weights['Размер вентилятора(ов)']
+
+        score = score + np.minimum(column('Количество секций', int) * 20, 100) * weights['Количество секций']
+        score = score + np.minimum(column('Количество вентиляторов', int) * 25, 100) * weights['Количество вентиляторов']
+
+        power_scores = {'3pin': 60, '4pin': 85, 'PWM': 100, 'SATA': 70, 'MOLEX': 50}
+        score = score + self._lookup(frame['Питание'], power_scores, 50) * weights['Питание']
+
+        score = score + np.minimum(column('TDP', self._leading_number(int)) / 2, 100) * weights['TDP']
+        return score
+
+    def _score_gpu_frame(self, frame, column, weights):
+        score = np.minimum(column('Объем памяти (ГБ)') * 5, 100) * weights['Объем памяти (ГБ)']
+
+        memory_type_scores = {'GDDR5': 40, 'GDDR6': 70, 'GDDR6X': 85, 'HBM2': 95}
+        score = score + self._lookup(frame['Тип памяти'], memory_type_scores, 50) * weights['Тип памяти']
+
+        score = score + np.minimum(column('Шина памяти (бит)') * 1.5, 100) * weights['Шина памяти (бит)']
+        score = score + np.minimum(column('Частота GPU (МГц)') / 20, 100) * weights['Частота GPU (МГц)']
+
+        pcie_scores = {'3.0': 60, '4.0': 85, '5.0': 100}
+        score = score + self._lookup(frame['Версия PCIe'], pcie_scores, 50) * weights['Версия PCIe']
+
+        connectors = column('Разъемы', lambda value: min(len(value.split(',')) * 20, 100)
+                            if isinstance(value, str) else 50)
+        score = score + connectors * weights['Разъемы']
+        return score
+
     def evaluate_system(self, components):
         """Оценка всей системы"""
         scores = {}
@@ -0,0 +1,196 @@
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PRICE_KEY = "Цена"
+HREF_KEY = "Ссылка"
+TITLE_KEY = "Название"
+
+# Отличает «нет в кэше» от закэшированного None (товар не разбирается)
+_MISS = object()
+
+
+class ParseCache:
+    """LRU-кэш разобранных характеристик по ключу (тип компонента, нормализованное название).
+    Цена и ссылка в кэш не попадают и подставляются при каждом обращении.
+    Записи парсера сбрасываются, как только меняется отпечаток его шаблонов"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, max_size: int = 50000, path: Optional[str] = None):
+        self.max_size = max_size
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple[str, str], Optional[Dict]]' = OrderedDict()
+        self._fingerprints: Dict[str, str] = {}
+        self._checked = set()
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            self.load()
+
+    @classmethod
+    def from_config(cls, config):
+        """Создает кэш по настройкам ScraperConfig"""
+        return cls(max_size=config.parse_cache_size, path=config.parse_cache_path)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Название без лишних пробелов: по нему и строится ключ, и выполняется разбор"""
+        return " ".join(str(name).split())
+
+    def parse(self, component: str, component_info) -> Optional[Dict]:
+        """Кэширующая замена parser.data_dict_creator([name, price, href])"""
+        name, price, href = component_info
+        return self.parse_page(component, [[name], [price], [href]])[0]
+
+    def parse_page(self, component: str, data) -> List[Optional[Dict]]:
+        """Разбор страницы [names, prices, hrefs]: из кэша берутся известные названия,
+        остальные разбираются одним пакетом. Порядок товаров сохраняется, None - товар не разобран"""
+        from .parser import ParserFactory
+
+        names, prices, hrefs = data
+        keys, specs, missing = self.lookup(component, names)
+        if missing:
+            parsed = ParserFactory.get_parser(component).parse_specs([name for _, name in missing])
+            specs = self.fill(keys, specs, dict(zip(missing, parsed)))
+        return self.records(specs, prices, hrefs)
+
+    def lookup(self, component: str, names) -> Tuple[List[Tuple[str, str]], List, List[Tuple[str, str]]]:
+        """Первая половина parse_page: ключи названий, характеристики из кэша (заглушка для
+        отсутствующих) и ключи без повторов, которые нужно разобрать"""
+        from .parser import ParserFactory
+
+        parser = ParserFactory.get_parser(component)
+        keys = [(component, self.normalize(name)) for name in names]
+
+        with self._lock:
+            self._check_fingerprint(component, parser)
+            specs = [self._get(key) for key in keys]
+
+        missing = list(dict.fromkeys(key for key, spec in zip(keys, specs) if spec is _MISS))
+        return keys, specs, missing
+
+    def fill(self, keys, specs, parsed: Dict[Tuple[str, str], Optional[Dict]]) -> List[Optional[Dict]]:
+        """Вторая половина parse_page: сохраняет разобранные характеристики и подставляет их вместо заглушек"""
+        with self._lock:
+            for key, spec in parsed.items():
+                self._put(key, spec)
+        return [parsed[key] if spec is _MISS else spec for key, spec in zip(keys, specs)]
+
+    @classmethod
+    def records(cls, specs, prices, hrefs) -> List[Optional[Dict]]:
+        return [cls._record(spec, price, href) for spec, price, href in zip(specs, prices, hrefs)]
+
+    @staticmethod
+    def is_missing(spec) -> bool:
+        return spec is _MISS
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self._checked.clear()
+
+    def load(self):
+        """Загружает кэш с диска; записи парсеров с изменившимися шаблонами отбрасываются"""
+        from .parser import ParserFactory
+
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Кэш разбора {self.path} не прочитан: {e}")
+            return
+
+        if stored.get('version') != self.FORMAT_VERSION:
+            return
+
+        current = {}
+        for component, fingerprint in stored.get('fingerprints', {}).items():
+            parser = ParserFactory.get_parser(component)
+            if parser is not None and parser.fingerprint() == fingerprint:
+                current[component] = fingerprint
+
+        with self._lock:
+            self._fingerprints.update(current)
+            for component, name, spec in stored.get('entries', []):
+                if component in current:
+                    self._put((component, name), spec)
+        logging.info(f"Кэш разбора загружен: {len(self._entries)} записей")
+
+    def save(self):
+        """Сохраняет кэш на диск (запись во временный файл и замена)"""
+        if not self.path:
+            return
+
+        with self._lock:
+            stored = {
+                'version': self.FORMAT_VERSION,
+                'fingerprints': dict(self._fingerprints),
+                'entries': [[component, name, spec] for (component, name), spec in self._entries.items()],
+            }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def _check_fingerprint(self, component, parser):
+        # Шаблоны не меняются во время работы, поэтому отпечаток проверяется один раз на компонент
+        if component in self._checked:
+            return
+        self._checked.add(component)
+        fingerprint = parser.fingerprint()
+        if self._fingerprints.get(component) != fingerprint:
+            if component in self._fingerprints:
+                logging.info(f"Шаблоны парсера {component} изменились, кэш компонента сброшен")
+            for key in [key for key in self._entries if key[0] == component]:
+                del self._entries[key]
+            self._fingerprints[component] = fingerprint
+
+    def _get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return _MISS
+
+    def _put(self, key, spec):
+        self._entries[key] = spec
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _record(spec, price, href) -> Optional[Dict]:
+        if spec is None:
+            return None
+        record = {}
+        for key, value in spec.items():
+            record[key] = value
+            if key == TITLE_KEY:
+                record[PRICE_KEY] = price
+                record[HREF_KEY] = href
+        return record
+
@@ -0,0 +1,258 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .parse_cache import ParseCache
+
+SCORE_KEY = "Оценка"
+
+
+def parse_chunk(component: str, names: List[str], known_specs: List[Dict], score: bool):
+    """Выполняется в процессе пула: разбор названий и, при score, оценка известных и разобранных
+    характеристик. Возвращает (характеристики названий, оценки known_specs, оценки названий)"""
+    from .models import ComponentScorer
+    from .parser import ParserFactory
+
+    parser = ParserFactory.get_parser(component)
+    parsed = parser.parse_specs(names) if names else []
+    if not score:
+        return parsed, None, None
+
+    specs = known_specs + parsed
+    valid = [i for i, spec in enumerate(specs) if spec]
+    scores = [None] * len(specs)
+    if valid:
+        records = parser.RECORD.from_dicts(specs[i] for i in valid)
+        for i, value in zip(valid, ComponentScorer().score_records(component, records).tolist()):
+            scores[i] = None if np.isnan(value) else value
+    return parsed, scores[:len(known_specs)], scores[len(known_specs):]
+
+
+@dataclass
+class _Page:
+    component: str
+    url: Optional[str]
+    prices: list
+    hrefs: list
+    keys: list
+    specs: list
+
+
+@dataclass
+class _Chunk:
+    component: str
+    pages: List[_Page] = field(default_factory=list)
+    missing: Dict[Tuple[str, str], None] = field(default_factory=dict)
+    known: Dict[Tuple[str, str], Dict] = field(default_factory=dict)
+
+
+class ParseStage:
+    """Разбор страниц в пуле процессов отдельно от потоков браузеров.
+
+    Потоки браузеров только передают сырые страницы [names, prices, hrefs] в ограниченную очередь.
+    Поток сборки берет известные названия из ParseCache, а остальные копит по компонентам
+    и отправляет пакетами по chunk_size названий в ProcessPoolExecutor. Разобранные страницы
+    передаются в on_page(component, url, products), ошибки - в on_error(component, url, error).
+    Число пакетов в работе ограничено, поэтому при нехватке процессоров очередь заполняется
+    и submit блокирует потоки браузеров. Если процесс разбора упал, пакеты сломанного пула
+    передаются в on_error, а следующие пакеты идут в новый пул"""
+
+    def __init__(self, processes: Optional[int] = None, chunk_size: int = 200, max_pending: int = 64,
+                 flush_interval: float = 0.5, score: bool = False, parse_cache: Optional[ParseCache] = None):
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.flush_interval = flush_interval
+        self.score = score
+        self.parse_cache = parse_cache or ParseCache()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._executor = None
+        self._workers = 1
+        self._thread = None
+        self._on_page = None
+        self._on_error = None
+        self._chunks: Dict[str, _Chunk] = {}
+        self._in_flight = None
+        self._pending = 0
+        self._done = threading.Condition()
+        self._metrics = {'pages': 0, 'chunks': 0, 'parsed_names': 0, 'cached_names': 0, 'errors': 0}
+
+    @classmethod
+    def from_config(cls, config, parse_cache: Optional[ParseCache] = None) -> Optional['ParseStage']:
+        """Создает стадию по настройкам ScraperConfig; None, если разбор идет в потоках браузеров"""
+        if not config.parse_processes:
+            return None
+        return cls(processes=config.parse_processes, chunk_size=config.parse_chunk_size,
+                   score=config.parse_score, parse_cache=parse_cache)
+
+    def start(self, on_page: Callable, on_error: Optional[Callable] = None):
+        if self._thread is not None:
+            return self
+        self._on_page = on_page
+        self._on_error = on_error
+        self._workers = self.processes or os.cpu_count() or 1
+        self._executor = self._new_executor()
+        # Два пакета на процесс: пока один разбирается, следующий уже передан
+        self._in_flight = threading.Semaphore(2 * self._workers)
+        self._thread = threading.Thread(target=self._run, name='parse-stage', daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, component: str, url: Optional[str], data):
+        """Передает сырую страницу на разбор; блокирует, пока в очереди нет места"""
+        with self._done:
+            self._pending += 1
+        self._queue.put((component, url, data))
+
+    def join(self):
+        """Ожидает разбора всех переданных страниц"""
+        self._queue.put(())
+        with self._done:
+            self._done.wait_for(lambda: self._pending == 0)
+
+    def close(self):
+        if self._thread is not None:
+            self.join()
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: запуск процесса из потока сборки не копирует блокировки работающих потоков браузеров
+        return ProcessPoolExecutor(max_workers=self._workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def stats(self) -> Dict:
+        with self._done:
+            return dict(self._metrics)
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                self._flush_all()
+                return
+
+            if item:
+                self._add(*item)
+            # Пустой элемент - запрос join или истекший интервал: отправляются и неполные пакеты
+            if not item or time.monotonic() >= deadline:
+                self._flush_all()
+                deadline = time.monotonic() + self.flush_interval
+
+    def _add(self, component: str, url: Optional[str], data):
+        names, prices, hrefs = data
+        try:
+            keys, specs, missing = self.parse_cache.lookup(component, names)
+        except Exception as e:
+            self._fail([_Page(component, url, prices, hrefs, [], [])], e)
+            return
+
+        chunk = self._chunks.setdefault(component, _Chunk(component))
+        chunk.pages.append(_Page(component, url, prices, hrefs, keys, specs))
+        chunk.missing.update(dict.fromkeys(missing))
+        if self.score:
+            chunk.known.update((key, spec) for key, spec in zip(keys, specs) if spec and not ParseCache.is_missing(spec))
+        with self._done:
+            self._metrics['cached_names'] += len(keys) - len(missing)
+        if len(chunk.missing) >= self.chunk_size:
+            self._flush(component)
+
+    def _flush_all(self):
+        for component in list(self._chunks):
+            self._flush(component)
+
+    def _flush(self, component: str):
+        chunk = self._chunks.pop(component, None)
+        if chunk is None:
+            return
+        if not chunk.missing and not self.score:
+            # Все названия уже в кэше - процесс не нужен
+            self._deliver(chunk, [], None, None)
+            return
+
+        self._in_flight.acquire()
+        missing = list(chunk.missing)
+        try:
+            future = self._submit(chunk, missing)
+        except Exception as e:
+            # Пакет не принят пулом: страницы считаются неудачными, иначе join ждал бы их вечно
+            self._in_flight.release()
+            self._fail(chunk.pages, e)
+            return
+        future.add_done_callback(lambda done: self._complete(chunk, missing, done))
+
+    def _submit(self, chunk: _Chunk, missing):
+        args = (parse_chunk, chunk.component, [name for _, name in missing], list(chunk.known.values()), self.score)
+        try:
+            return self._executor.submit(*args)
+        except BrokenProcessPool:
+            # Процесс разбора упал, и пул больше не принимает пакеты: пакет передается в новый пул
+            print("⚠️  Пул процессов разбора сломан, запускается новый")
+            self._executor.shutdown(wait=False)
+            self._executor = self._new_executor()
+            return self._executor.submit(*args)
+
+    def _complete(self, chunk: _Chunk, missing, future):
+        self._in_flight.release()
+        try:
+            parsed, known_scores, parsed_scores = future.result()
+        except Exception as e:
+            self._fail(chunk.pages, e)
+            return
+        self._deliver(chunk, list(zip(missing, parsed)), known_scores, parsed_scores)
+
+    def _deliver(self, chunk: _Chunk, parsed, known_scores, parsed_scores):
+        parsed_specs = dict(parsed)
+        scores = None
+        if self.score:
+            scores = dict(zip(chunk.known, known_scores or []))
+            scores.update(zip(parsed_specs, parsed_scores or []))
+
+        for page in chunk.pages:
+            try:
+                specs = self.parse_cache.fill(page.keys, page.specs, parsed_specs)
+                products = self.parse_cache.records(specs, page.prices, page.hrefs)
+                if scores is not None:
+                    for key, product in zip(page.keys, products):
+                        if product is not None:
+                            product[SCORE_KEY] = scores.get(key)
+                self._on_page(page.component, page.url, [product for product in products if product])
+            except Exception as e:
+                self._fail([page], e)
+                continue
+            with self._done:
+                self._metrics['pages'] += 1
+            self._finish(1)
+
+        with self._done:
+            self._metrics['chunks'] += 1
+            self._metrics['parsed_names'] += len(parsed_specs)
+
+    def _fail(self, pages: List[_Page], error):
+        for page in pages:
+            print(f"Ошибка разбора {page.url or page.component}: {error}")
+            if self._on_error is not None:
+                self._on_error(page.component, page.url, error)
+        with self._done:
+            self._metrics['errors'] += len(pages)
+        self._finish(len(pages))
+
+    def _finish(self, pages: int):
+        with self._done:
+            self._pending -= pages
+            self._done.notify_all()
@@ -1,20 +1,96 @@
 import logging
+import queue
+import threading
+from contextlib import contextmanager
 
-import sys
+import psutil
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 import random
 from time import sleep
 import undetected_chromedriver as uc
-import time
-import requests
+from urllib.parse import urljoin
+from lxml import html as lxml_html
 
+from .proxy_pool import ProxyPool
+from .waits import COUNT_SCRIPT, WaitStrategy
 from .models import RamDataParser, CpuCoolerDataParser, CoolingSystemDataParser, CpuDataParser, GpuDataParser, MotherboardDataParser
+from ..utils.helpers import clean_price
+
+# Один вызов execute_script вместо отдельного запроса к WebDriver на каждый элемент
+EXTRACT_PRODUCTS_SCRIPT = """
+const grab = (xpath, fn) => {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const values = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        values.push(fn(snapshot.snapshotItem(i)));
+    }
+    return values;
+};
+return [
+    grab(arguments[0], node => node.innerText.trim()),
+    grab(arguments[1], node => node.innerText.trim()),
+    grab(arguments[2], node => node.href),
+];
+"""
+
+# Догрузка после «Показать ещё»: только узлы с номерами не меньше уже прочитанных
+EXTRACT_NEW_PRODUCTS_SCRIPT = """
+const grab = (xpath, start, fn) => {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const values = [];
+    for (let i = start; i < snapshot.snapshotLength; i++) {
+        values.push(fn(snapshot.snapshotItem(i)));
+    }
+    return values;
+};
+const start = arguments[3];
+return [
+    grab(arguments[0], start[0], node => node.innerText.trim()),
+    grab(arguments[1], start[1], node => node.innerText.trim()),
+    grab(arguments[2], start[2], node => node.href),
+];
+"""
+
+
+def unique_by_href(data):
+    """Убирает повторы товаров по ссылке, сохраняя порядок. Списки разной длины
+    (цены еще не подгрузились) возвращаются как есть - сопоставить их по позиции нельзя"""
+    names, prices, hrefs = data
+    if not (len(names) == len(prices) == len(hrefs)) or len(set(hrefs)) == len(hrefs):
+        return data
+
+    seen = set()
+    keep = [i for i, href in enumerate(hrefs) if not (href in seen or seen.add(href))]
+    return [[names[i] for i in keep], [prices[i] for i in keep], [hrefs[i] for i in keep]]
+
+
+def extract_products_from_html(page_html, xpathes, base_url=''):
+    """Извлекает названия, цены и ссылки товаров из HTML-кода страницы"""
+    tree = lxml_html.fromstring(page_html)
+    names = [node.text_content().strip() for node in tree.xpath(xpathes['name'])]
+    prices = [clean_price(node.text_content().strip()) for node in tree.xpath(xpathes['price'])]
+    hrefs = [urljoin(base_url, node.get('href', '')) for node in tree.xpath(xpathes['href'])]
+    return [names, prices, hrefs]
+
 
 class BrowserManager:
+    EXTRA_HEADERS = {
+        'Accept-Language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Sec-CH-UA': '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
+        'Sec-CH-UA-Mobile': '?0',
+        'Sec-CH-UA-Platform': '"Windows"',
+        'Referer': 'https://www.dns-shop.ru/',
+        'DNT': '1'
+    }
+    # Прокси, взятые start_browser из общего пула: возвращаются в пул в quit_browser
+    _acquired_proxies = {}
+    _acquired_lock = threading.Lock()
+
     @classmethod
-    def start_browser(cls, proxies=None):
+    def start_browser(cls, proxies=None, proxy=None):
         # 1. Расширенные настройки Chrome
         options = uc.ChromeOptions()
         options.add_argument('--disable-blink-features=AutomationControlled')
@@ -27,19 +103,13 @@ class BrowserManager:
         options.add_argument('--disable-notifications')
         options.add_argument('--disable-geolocation')
 
-        if proxies:
-            is_proxy_used = False
-            for proxy in proxies:
-                if cls.check_proxy_simple(proxy):
-                    options.add_argument(f"--proxy-server={proxy}")
-                    is_proxy_used = True
-    
-            if not is_proxy_used:
-                print("Все прокси не доступны")
-                logging.error("❌ Не удается установить соединение ни с одним прокси")
-                logging.info("Завершение работы парсера...")
-                sys.exit()
-
+        # Браузер работает через один прокси; из списка выбирается лучший проверенный
+        proxy_pool = None
+        if proxy is None and proxies:
+            proxy_pool = ProxyPool.shared(proxies)
+            proxy = proxy_pool.acquire()
+        if proxy is not None:
+            options.add_argument(f"--proxy-server={proxy}")
 
         # 2. Ротация User-Agent
         user_agents = [
@@ -49,103 +119,326 @@ class BrowserManager:
         options.add_argument(f'user-agent={random.choice(user_agents)}')
 
         # 3. Запуск браузера с улучшенной маскировкой
-        driver = uc.Chrome(
-            options=options,
-            headless=False,
-            use_subprocess=True,
-            version_main=140,
-        )
+        try:
+            driver = uc.Chrome(
+                options=options,
+                headless=False,
+                use_subprocess=True,
+                version_main=140,
+            )
+        except Exception:
+            if proxy_pool is not None:
+                proxy_pool.release(proxy, success=False)
+            raise
+        if proxy_pool is not None:
+            with cls._acquired_lock:
+                cls._acquired_proxies[id(driver)] = (proxy_pool, proxy)
 
         # 4. Кастомные заголовки
         # Правильный формат для CDP команды
         driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
-            'headers': {
-                'Accept-Language': 'ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Sec-CH-UA': '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
-                'Sec-CH-UA-Mobile': '?0',
-                'Sec-CH-UA-Platform': '"Windows"',
-                'Referer': 'https://www.dns-shop.ru/',
-                'DNT': '1'
-            }
+            'headers': cls.EXTRA_HEADERS
         })
 
         return driver
 
+    @classmethod
+    def quit_browser(cls, driver):
+        """Закрывает браузер, запущенный start_browser, и возвращает его прокси в общий пул"""
+        with cls._acquired_lock:
+            acquired = cls._acquired_proxies.pop(id(driver), None)
+        try:
+            driver.quit()
+        finally:
+            if acquired is not None:
+                proxy_pool, proxy = acquired
+                proxy_pool.release(proxy)
+
     @staticmethod
     # Эмулируем человеческое поведение
-    def human_like_actions(next_page, driver):
+    def human_like_actions(next_page, driver, waits=None):
+        # Паузы берутся из бюджета стратегии ожидания, если она передана
+        pause = waits.humanize if waits is not None else (lambda: sleep(random.uniform(0.5, 2)))
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.2);")
-        sleep(random.uniform(0.5, 1.5))
+        pause()
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.5);")
-        sleep(random.uniform(0.7, 2))
+        pause()
         next_page_elem = driver.find_element(By.XPATH, next_page)
         driver.execute_script("arguments[0].scrollIntoView(true);", next_page_elem)
-        sleep(random.uniform(1, 3))
+        pause()
 
     @classmethod
     def check_proxy_simple(cls, proxy, timeout=10):
-        proxies = {
-            'http': f'http://{proxy}',
-            'https': f'http://{proxy}'
-        }
+        return ProxyPool.measure_latency(proxy, timeout) is not None
 
+
+class BrowserPool:
+    """Пул заранее запущенных браузеров, которые выдаются во временное пользование"""
+
+    def __init__(self, size=3, proxies=None, max_pages=50, max_memory_mb=2048, prelaunch=True, proxy_pool=None):
+        self.size = size
+        self.proxy_pool = proxy_pool or (ProxyPool.shared(proxies) if proxies else None)
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._idle = queue.Queue()
+        self._pages = {}
+        self._driver_proxies = {}
+        self._lock = threading.Lock()
+        self._launching = 0
+        self._closed = False
+
+        if prelaunch:
+            for _ in range(size):
+                self._idle.put(self._launch())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Выдает браузер из пула и возвращает его обратно после использования"""
+        driver = self._acquire(timeout)
+        success = False
         try:
-            start_time = time.time()
-            response = requests.get(
-                'http://httpbin.org/ip',
-                proxies=proxies,
-                timeout=timeout
-            )
-            response_time = time.time() - start_time
-
-            if response.status_code == 200:
-                logging.info(1, f"✅ Прокси {proxy} доступен")
-                logging.info(1, f"⏱️  Время ответа: {response_time:.2f} сек")
-                logging.info(1, f"🌐 IP адрес: {response.json()['origin']}")
-                return True
-            else:
-                logging.error(f"❌ Прокси недоступен, статус: {response.status_code}")
-                return False
-
-        except requests.exceptions.ConnectTimeout:
-            logging.warn(f"⏰ Таймаут подключения к прокси {proxy}")
-            return False
-        except requests.exceptions.ConnectionError:
-            logging.error(f"🔌 Ошибка подключения к прокси {proxy}")
-            return False
+            yield driver
+            success = True
+        finally:
+            proxy = self.proxy_of(driver)
+            if proxy is not None:
+                self.proxy_pool.report(proxy, success)
+            self._release(driver)
+
+    def proxy_of(self, driver):
+        """Прокси, через который работает браузер"""
+        with self._lock:
+            return self._driver_proxies.get(id(driver))
+
+    def record_page(self, driver):
+        """Учитывает загруженную страницу для последующей переработки браузера"""
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+
+    def close(self):
+        """Закрывает все свободные браузеры пула"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+    def _acquire(self, timeout):
+        if self._closed:
+            raise RuntimeError("Пул браузеров закрыт")
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Догоняем пул до нужного размера, если браузеры были потеряны
+        with self._lock:
+            can_launch = len(self._pages) + self._launching < self.size
+            if can_launch:
+                self._launching += 1
+        if can_launch:
+            try:
+                return self._launch()
+            finally:
+                with self._lock:
+                    self._launching -= 1
+
+        return self._idle.get(timeout=timeout)
+
+    def _release(self, driver):
+        if self._closed:
+            self._quit(driver)
+            return
+
+        if not self._is_healthy(driver):
+            logging.warning("♻️  Браузер не прошел проверку, перезапуск")
+            driver = self._replace(driver)
+        elif self._needs_recycle(driver):
+            logging.info("♻️  Браузер достиг лимита страниц или памяти, перезапуск")
+            driver = self._replace(driver)
+
+        if driver is not None:
+            self._idle.put(driver)
+
+    def _replace(self, driver):
+        self._quit(driver)
+        try:
+            return self._launch()
         except Exception as e:
-            logging.error(f"❌ Ошибка при проверке прокси: {e}")
+            logging.error(f"❌ Не удалось перезапустить браузер: {e}")
+            return None
+
+    def _launch(self):
+        # Каждому браузеру выдается свой прокси, чтобы нагрузка распределялась по пулу
+        proxy = self.proxy_pool.acquire() if self.proxy_pool else None
+        try:
+            driver = BrowserManager.start_browser(proxy=proxy)
+        except Exception:
+            if proxy is not None:
+                self.proxy_pool.release(proxy, success=False)
+            raise
+
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self._driver_proxies[id(driver)] = proxy
+        return driver
+
+    def _quit(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            proxy = self._driver_proxies.pop(id(driver), None)
+        if proxy is not None:
+            self.proxy_pool.release(proxy)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return bool(driver.window_handles) and \
+                driver.execute_script("return document.readyState") is not None
+        except Exception:
             return False
 
+    def _needs_recycle(self, driver):
+        with self._lock:
+            pages = self._pages.get(id(driver), 0)
+        if self.max_pages and pages >= self.max_pages:
+            return True
+
+        if self.max_memory_mb:
+            used = self.memory_mb(driver)
+            return used is not None and used >= self.max_memory_mb
+
+        return False
+
+    @staticmethod
+    def memory_mb(driver):
+        """Резидентная память браузера в МБ: процесс Chrome со всеми дочерними (рендереры, GPU)
+        и chromedriver. None, если процессы браузера не найдены"""
+        pids = [getattr(driver, 'browser_pid', None),
+                getattr(getattr(getattr(driver, 'service', None), 'process', None), 'pid', None)]
+        seen, total = set(), 0
+        for pid in filter(None, pids):
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except psutil.Error:
+                continue
+            for process in processes:
+                if process.pid in seen:
+                    continue
+                seen.add(process.pid)
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+        return total / (1024 * 1024) if seen else None
+
 class DNSScraper:
-    def __init__(self, proxies):
-        self.driver = BrowserManager.start_browser(proxies)
-        self.xpathes = {
-            "name": "//div[@class='catalog-product__name-wrapper']//span",
-            "price": "//div[@class='product-buy__price']",
-            "href": "//a[@class='catalog-product__name ui-link ui-link_black']",
-            "next-page": "//button[contains(text(), 'Показать ещё')]"
-        }
+    EXTRACTION_MODES = ('script', 'source', 'elements')
+    # pages - каждая страница ?p=N один раз без «Показать ещё»;
+    # expand - нажимать «Показать ещё», пока есть кнопка, и прочитать страницу целиком;
+    # delta - после каждого нажатия читать только новые карточки
+    CRAWL_MODES = ('pages', 'expand', 'delta')
+    XPATHES = {
+        "name": "//div[@class='catalog-product__name-wrapper']//span",
+        "price": "//div[@class='product-buy__price']",
+        "href": "//a[@class='catalog-product__name ui-link ui-link_black']",
+        "next-page": "//button[contains(text(), 'Показать ещё')]"
+    }
+
+    def __init__(self, proxies, driver=None, extraction_mode='script', waits=None, crawl_mode='pages'):
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Неизвестный режим извлечения: {extraction_mode}")
+        if crawl_mode not in self.CRAWL_MODES:
+            raise ValueError(f"Неизвестный режим обхода: {crawl_mode}")
+        self.extraction_mode = extraction_mode
+        self.crawl_mode = crawl_mode
+        self._owns_driver = driver is None
+        self.driver = driver if driver is not None else BrowserManager.start_browser(proxies)
+        self.xpathes = dict(self.XPATHES)
+        self.waits = waits or WaitStrategy()
 
     def scrape_page(self, url):
-        # Получение страницы
-        self.driver.get(url)
-        sleep(random.uniform(5, 10))
-
-        # Ожидаем загрузки элементов
-        WebDriverWait(self.driver, 15).until(
-            EC.presence_of_element_located((By.XPATH, self.xpathes['name'])))
-
-        while self.driver.find_element(By.XPATH, self.xpathes["next-page"]):
-            BrowserManager.human_like_actions(self.xpathes["next-page"], self.driver)  # Имитируем поведение человека
-            button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, self.xpathes["next-page"]))
-            )
-            button.click()
-            sleep(random.uniform(0.5, 1.5))
+        with self.waits.page(url):
+            # Получение страницы: ждем карточки товаров, а не фиксированное время
+            self.driver.get(url)
+            if not self.waits.wait_for_products(self.driver, self.xpathes['name']):
+                raise TimeoutException(f"Карточки товаров не появились на {url}")
+            self.waits.humanize()
+
+            if self.crawl_mode == 'delta':
+                return unique_by_href(self._scrape_delta())
+            if self.crawl_mode == 'expand':
+                while self._show_more():
+                    pass
+            return unique_by_href(self.extract_products())
+
+    def _show_more(self) -> bool:
+        """Нажимает «Показать ещё»; False, если кнопки нет или новые карточки не подгрузились"""
+        if not self.driver.find_elements(By.XPATH, self.xpathes["next-page"]):
+            return False
+
+        count = self.driver.execute_script(COUNT_SCRIPT, self.xpathes['name'])
+        BrowserManager.human_like_actions(self.xpathes["next-page"], self.driver, self.waits)  # Имитируем поведение человека
+        button = WebDriverWait(self.driver, 10).until(
+            EC.element_to_be_clickable(
+                (By.XPATH, self.xpathes["next-page"]))
+        )
+        button.click()
+
+        # Новые карточки не подгрузились - дальше кликать бесполезно
+        return self.waits.wait_for_count_increase(self.driver, self.xpathes['name'], count,
+                                                  gone_xpath=self.xpathes["next-page"])
+
+    def _scrape_delta(self):
+        """Читает карточки порциями: после каждого «Показать ещё» передаются только новые.
+        Списки читаются с собственных позиций, поэтому цена, подгруженная позже названия,
+        попадет в следующую порцию"""
+        data = [[], [], []]
+        self._extract_new(data)
+        try:
+            while self._show_more():
+                self._extract_new(data)
+        except TimeoutException as e:
+            # Уже прочитанные карточки не теряются из-за сбоя очередного нажатия
+            logging.warning(f"⚠️  «Показать ещё» не сработала, собрано {len(data[0])} товаров: {e}")
+        # Карточки, появившиеся одновременно с исчезновением кнопки
+        self._extract_new(data)
+        return data
+
+    def _extract_new(self, data):
+        names, prices, hrefs = data
+        new_names, new_prices, new_hrefs = self.driver.execute_script(
+            EXTRACT_NEW_PRODUCTS_SCRIPT, self.xpathes['name'], self.xpathes['price'], self.xpathes['href'],
+            [len(names), len(prices), len(hrefs)])
+        names.extend(new_names)
+        prices.extend(clean_price(price) for price in new_prices)
+        hrefs.extend(new_hrefs)
+
+    def extract_products(self):
+        """Извлекает названия, цены и ссылки всех товаров на странице"""
+        if self.extraction_mode == 'script':
+            names, prices, hrefs = self.driver.execute_script(
+                EXTRACT_PRODUCTS_SCRIPT, self.xpathes['name'], self.xpathes['price'], self.xpathes['href'])
+            return [names, [clean_price(price) for price in prices], hrefs]
+
+        if self.extraction_mode == 'source':
+            return extract_products_from_html(self.driver.page_source, self.xpathes, self.driver.current_url)
 
-        # Получаем элементы с обработкой ошибок
+        # Поэлементный режим: отдельный запрос к WebDriver на каждый товар
         names = self.__find_names()
         prices = self.__find_prices()
         hrefs = self.__find_hrefs()
@@ -158,13 +451,15 @@ class DNSScraper:
 
     def __find_prices(self):
         # Поиск и обработка цен
-        return [price.text.replace('\u202f', '').replace('P', '').replace('\u2009', '') for price in self.driver.find_elements(By.XPATH, self.xpathes['price'])]
+        return [clean_price(price.text) for price in self.driver.find_elements(By.XPATH, self.xpathes['price'])]
 
     def __find_hrefs(self):
         return [href.get_attribute('href') for href in self.driver.find_elements(By.XPATH, self.xpathes['href'])]
 
     def close(self):
-        self.driver.quit()
+        # Браузер из пула возвращается владельцу, а не закрывается
+        if self._owns_driver:
+            BrowserManager.quit_browser(self.driver)
 
 class ParserFactory:
     @staticmethod
@@ -0,0 +1,149 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import requests
+
+
+@dataclass
+class ProxyStats:
+    """Результаты проверок и использования одного прокси"""
+    proxy: str
+    healthy: bool = False
+    latency: Optional[float] = None
+    checked_at: float = 0.0
+    in_use: int = 0
+    recent: deque = field(default_factory=lambda: deque(maxlen=20))
+
+    @property
+    def failure_rate(self) -> float:
+        return self.recent.count(False) / len(self.recent) if self.recent else 0.0
+
+
+class ProxyPool:
+    """Пул прокси: параллельная проверка, кэширование результатов и выдача лучшего прокси"""
+
+    _shared: Dict[tuple, 'ProxyPool'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, proxies, ttl=300, timeout=10, check_url='http://httpbin.org/ip', max_workers=16):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.check_url = check_url
+        self.max_workers = max_workers
+        self._stats = {str(proxy): ProxyStats(str(proxy)) for proxy in proxies}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, proxies, **kwargs) -> 'ProxyPool':
+        """Общий пул для одного и того же списка прокси, чтобы кэш проверок не терялся"""
+        key = tuple(str(proxy) for proxy in proxies)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(proxies, **kwargs)
+            return cls._shared[key]
+
+    @classmethod
+    def measure_latency(cls, proxy, timeout=10, check_url='http://httpbin.org/ip') -> Optional[float]:
+        """Возвращает время ответа через прокси в секундах или None, если прокси недоступен"""
+        proxies = {
+            'http': f'http://{proxy}',
+            'https': f'http://{proxy}'
+        }
+
+        try:
+            start_time = time.time()
+            response = requests.get(check_url, proxies=proxies, timeout=timeout)
+            response_time = time.time() - start_time
+
+            if response.status_code == 200:
+                logging.info(f"✅ Прокси {proxy} доступен, время ответа: {response_time:.2f} сек")
+                return response_time
+
+            logging.error(f"❌ Прокси {proxy} недоступен, статус: {response.status_code}")
+            return None
+
+        except requests.exceptions.ConnectTimeout:
+            logging.warning(f"⏰ Таймаут подключения к прокси {proxy}")
+            return None
+        except requests.exceptions.ConnectionError:
+            logging.error(f"🔌 Ошибка подключения к прокси {proxy}")
+            return None
+        except Exception as e:
+            logging.error(f"❌ Ошибка при проверке прокси {proxy}: {e}")
+            return None
+
+    def refresh(self, force=False):
+        """Параллельно перепроверяет прокси с устаревшим результатом"""
+        with self._refresh_lock:
+            now = time.time()
+            with self._lock:
+                stale = [stats.proxy for stats in self._stats.values()
+                         if force or now - stats.checked_at >= self.ttl]
+            if not stale:
+                return
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+                latencies = list(executor.map(
+                    lambda proxy: self.measure_latency(proxy, self.timeout, self.check_url), stale))
+
+            with self._lock:
+                for proxy, latency in zip(stale, latencies):
+                    stats = self._stats[proxy]
+                    if latency is not None and not stats.healthy:
+                        stats.recent.clear()
+                    stats.healthy = latency is not None
+                    stats.latency = latency
+                    stats.checked_at = time.time()
+
+    def ranked(self) -> List[str]:
+        """Здоровые прокси от лучшего к худшему"""
+        self.refresh()
+        with self._lock:
+            healthy = [stats for stats in self._stats.values() if stats.healthy]
+            healthy.sort(key=self._rank)
+            return [stats.proxy for stats in healthy]
+
+    def acquire(self) -> str:
+        """Выдает один прокси с учетом задержки, доли ошибок и текущей нагрузки"""
+        self.refresh()
+        with self._lock:
+            healthy = [stats for stats in self._stats.values() if stats.healthy]
+            if not healthy:
+                raise RuntimeError("❌ Не удается установить соединение ни с одним прокси")
+
+            best = min(healthy, key=lambda stats: self._rank(stats) * (1 + stats.in_use))
+            best.in_use += 1
+            return best.proxy
+
+    def release(self, proxy, success: Optional[bool] = None):
+        """Возвращает прокси в пул и, если известно, учитывает результат его использования"""
+        with self._lock:
+            stats = self._stats.get(str(proxy))
+            if stats is None:
+                return
+            stats.in_use = max(0, stats.in_use - 1)
+            if success is not None:
+                self._record(stats, success)
+
+    def report(self, proxy, success: bool):
+        """Учитывает результат запроса через прокси"""
+        with self._lock:
+            stats = self._stats.get(str(proxy))
+            if stats is not None:
+                self._record(stats, success)
+
+    def _record(self, stats: ProxyStats, success: bool):
+        stats.recent.append(success)
+        # Прокси, который стабильно отказывает, исключаем до следующей проверки
+        if len(stats.recent) >= 5 and stats.failure_rate > 0.8:
+            stats.healthy = False
+
+    @staticmethod
+    def _rank(stats: ProxyStats) -> float:
+        return (stats.latency or 0.0) * (1 + 4 * stats.failure_rate) + stats.failure_rate
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Корзина токенов с пополнением во времени и запасом на всплески"""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1, min_requests_per_minute: float = 1):
+        self.base_rate = requests_per_minute / 60.0
+        self.rate = self.base_rate
+        self.min_rate = min(min_requests_per_minute / 60.0, self.base_rate)
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """Забирает токен и возвращает, сколько секунд нужно подождать до его появления"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def slow_down(self, factor: float):
+        self.rate = max(self.min_rate, self.rate * factor)
+
+    def recover(self, step: float):
+        self.rate = min(self.base_rate, self.rate + self.base_rate * step)
+
+
+class RateLimiter:
+    """Ограничение частоты запросов по хостам и прокси.
+    Ожидание вычисляется под блокировкой, а сама пауза выполняется уже без нее"""
+
+    THROTTLE_STATUSES = (403, 429)
+
+    def __init__(self, requests_per_minute: float = 30, proxy_requests_per_minute: Optional[float] = None,
+                 burst: int = 1, backoff_factor: float = 0.5, recovery_step: float = 0.05,
+                 min_requests_per_minute: float = 1):
+        self.requests_per_minute = requests_per_minute
+        self.proxy_requests_per_minute = proxy_requests_per_minute or requests_per_minute
+        self.burst = burst
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.min_requests_per_minute = min_requests_per_minute
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._metrics = {'requests': 0, 'waits': 0, 'total_wait': 0.0, 'max_wait': 0.0, 'throttled': 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """Создает ограничитель по настройкам ScraperConfig"""
+        return cls(
+            requests_per_minute=config.requests_per_minute,
+            proxy_requests_per_minute=config.proxy_requests_per_minute,
+            burst=config.rate_burst,
+            backoff_factor=config.rate_backoff_factor,
+            min_requests_per_minute=config.min_requests_per_minute,
+        )
+
+    def reserve(self, url: str, proxy: Optional[str] = None, host: bool = True) -> float:
+        """Резервирует запрос и возвращает необходимую паузу в секундах.
+        host=False - корзина хоста уже учтена вызывающим, резервируется только прокси"""
+        if not host and proxy is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            wait = self._bucket(self._host_key(url), self.requests_per_minute).reserve(now) if host else 0.0
+            if proxy is not None:
+                wait = max(wait, self._bucket(self._proxy_key(proxy), self.proxy_requests_per_minute).reserve(now))
+
+            self._metrics['requests'] += 1
+            if wait > 0:
+                self._metrics['waits'] += 1
+                self._metrics['total_wait'] += wait
+                self._metrics['max_wait'] = max(self._metrics['max_wait'], wait)
+        return wait
+
+    def acquire(self, url: str, proxy: Optional[str] = None, host: bool = True):
+        """Ожидает разрешения на запрос"""
+        wait = self.reserve(url, proxy, host)
+        if wait > 0:
+            time.sleep(wait)
+
+    def report(self, url: str, proxy: Optional[str] = None, status_code: Optional[int] = None,
+               captcha: bool = False):
+        """Учитывает ответ сервера: при 429/403 или капче скорость снижается, при успехе постепенно восстанавливается"""
+        throttled = captcha or status_code in self.THROTTLE_STATUSES
+        keys = [self._host_key(url)] + ([self._proxy_key(proxy)] if proxy is not None else [])
+
+        with self._lock:
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                if throttled:
+                    bucket.slow_down(self.backoff_factor)
+                else:
+                    bucket.recover(self.recovery_step)
+            if throttled:
+                self._metrics['throttled'] += 1
+
+    def metrics(self) -> Dict:
+        """Статистика ожиданий и замедлений, текущая скорость по каждому ключу (запросов в минуту)"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['avg_wait'] = metrics['total_wait'] / metrics['waits'] if metrics['waits'] else 0.0
+            metrics['rates'] = {key: round(bucket.rate * 60, 2) for key, bucket in self._buckets.items()}
+        return metrics
+
+    def _bucket(self, key: str, requests_per_minute: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(requests_per_minute, self.burst, self.min_requests_per_minute)
+            self._buckets[key] = bucket
+        return bucket
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        return f"host:{urlparse(url).netloc or url}"
+
+    @staticmethod
+    def _proxy_key(proxy) -> str:
+        return f"proxy:{proxy}"
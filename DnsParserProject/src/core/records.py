@@ -0,0 +1,273 @@
+import re
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MISSING = "N/A"
+LEADING_NUMBER = re.compile(r'^\s*(\d+(?:\.\d+)?)')
+
+
+def _number(value, number_type):
+    """Число из значения парсера: 8, '8', '220 Вт'; None для 'N/A' и нечисловых строк"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, np.number)):
+        return None if isinstance(value, float) and np.isnan(value) else number_type(value)
+    match = LEADING_NUMBER.match(str(value))
+    if not match:
+        return None
+    return number_type(float(match.group(1))) if number_type is int else number_type(match.group(1))
+
+
+def _text(value) -> Optional[str]:
+    if value is None or value == MISSING or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return str(value)
+
+
+def _format_number(value) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+# Виды полей: (разбор значения словаря, значение для словаря).
+# int / float - число в словаре, *_text - число строкой ('16'), unit - число с единицей ('220 Вт')
+KINDS = {
+    'text': (_text, lambda value, unit: MISSING if value is None else value),
+    'int': (lambda value: _number(value, int), lambda value, unit: MISSING if value is None else value),
+    'float': (lambda value: _number(value, float), lambda value, unit: MISSING if value is None else value),
+    'int_text': (lambda value: _number(value, int), lambda value, unit: MISSING if value is None else str(value)),
+    'int_unit': (lambda value: _number(value, int),
+                 lambda value, unit: MISSING if value is None else f"{value} {unit}"),
+    'float_unit': (lambda value: _number(value, float),
+                   lambda value, unit: MISSING if value is None else f"{_format_number(value)} {unit}"),
+}
+NUMERIC_KINDS = ('int', 'float', 'int_text', 'int_unit', 'float_unit')
+
+
+@dataclass(slots=True)
+class ProductRecord:
+    """Типизированная запись товара вместо словаря с русскими ключами.
+
+    Числовые характеристики разбираются один раз, отсутствующие значения хранятся как None.
+    SCHEMA связывает атрибуты с ключами словаря парсера и задает вид поля, поэтому
+    from_dict / to_dict переводят запись в прежний формат и обратно"""
+    name: str
+    price: Optional[int]
+    href: Optional[str]
+
+    SCHEMA: ClassVar[Tuple[Tuple[str, str, str], ...]] = ()
+    COMMON: ClassVar[Tuple[Tuple[str, str, str], ...]] = (
+        ('name', 'Название', 'text'),
+        ('price', 'Цена', 'price'),
+        ('href', 'Ссылка', 'text'),
+    )
+    UNITS: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def fields(cls) -> Tuple[Tuple[str, str, str], ...]:
+        return cls.COMMON + cls.SCHEMA
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ProductRecord':
+        values = {}
+        for attribute, key, kind in cls.fields():
+            value = data.get(key)
+            if kind == 'price':
+                values[attribute] = parse_price(value)
+            else:
+                values[attribute] = KINDS[kind][0](value)
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Словарь в формате парсера; цена - целое число рублей"""
+        result = {}
+        for attribute, key, kind in self.fields():
+            value = getattr(self, attribute)
+            if kind == 'price':
+                result[key] = value
+            else:
+                result[key] = KINDS[kind][1](value, self.UNITS.get(attribute))
+        return result
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[Optional[Dict[str, Any]]]) -> List['ProductRecord']:
+        return [cls.from_dict(item) for item in items if item]
+
+    @classmethod
+    def to_frame(cls, records: List['ProductRecord']) -> pd.DataFrame:
+        """Таблица с ключами словаря парсера: числовые поля - числами (NaN без значения),
+        текстовые - как в словаре. Подходит для ComponentScorer.score_frame"""
+        columns = {}
+        for attribute, key, kind in cls.fields():
+            values = [getattr(record, attribute) for record in records]
+            if kind == 'price' or kind in NUMERIC_KINDS:
+                columns[key] = pd.to_numeric(pd.Series(values, dtype=object))
+            else:
+                columns[key] = pd.Series([MISSING if value is None else value for value in values], dtype=object)
+        return pd.DataFrame(columns)
+
+
+def parse_price(value) -> Optional[int]:
+    """Цена из текста карточки ('12 999 ₽', '12999') или числа; None, если цифр нет"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, np.number)):
+        return None if isinstance(value, float) and np.isnan(value) else int(value)
+    digits = ''.join(ch for ch in str(value) if ch.isdigit())
+    return int(digits) if digits else None
+
+
+@dataclass(slots=True)
+class RamRecord(ProductRecord):
+    capacity_gb: Optional[float] = None
+    memory_type: Optional[str] = None
+    module_size_gb: Optional[float] = None
+    modules: Optional[int] = None
+    frequency_mhz: Optional[int] = None
+    timings: Optional[str] = None
+    cas_latency: Optional[int] = None
+
+    SCHEMA: ClassVar = (
+        ('capacity_gb', 'Общий объем (ГБ)', 'float'),
+        ('memory_type', 'Тип памяти', 'text'),
+        ('module_size_gb', 'Размер модуля (ГБ)', 'float'),
+        ('modules', 'Количество модулей', 'int'),
+        ('frequency_mhz', 'Частота (МГц)', 'int'),
+        ('timings', 'Тайминги', 'text'),
+        ('cas_latency', 'Латентность (CL)', 'int_text'),
+    )
+
+
+@dataclass(slots=True)
+class MotherboardRecord(ProductRecord):
+    socket: Optional[str] = None
+    chipset: Optional[str] = None
+    memory_slots: Optional[int] = None
+    memory_type: Optional[str] = None
+    memory_frequency_mhz: Optional[int] = None
+    form_factor: Optional[str] = None
+    pcie_slots: Optional[int] = None
+    pcie_slot_width: Optional[str] = None
+
+    SCHEMA: ClassVar = (
+        ('socket', 'Сокет', 'text'),
+        ('chipset', 'Чипсет', 'text'),
+        ('memory_slots', 'Количество слотов памяти', 'int'),
+        ('memory_type', 'Тип слотов памяти', 'text'),
+        ('memory_frequency_mhz', 'Частота слотов памяти', 'int_unit'),
+        ('form_factor', 'Форм-фактор', 'text'),
+        ('pcie_slots', 'Количество слотов PCI-E', 'int'),
+        ('pcie_slot_width', 'Версия слотов PCI-E', 'text'),
+    )
+    UNITS: ClassVar = {'memory_frequency_mhz': 'МГц'}
+
+
+@dataclass(slots=True)
+class CpuCoolerRecord(ProductRecord):
+    base_material: Optional[str] = None
+    rpm: Optional[int] = None
+    noise_db: Optional[float] = None
+    power_pins: Optional[int] = None
+    max_tdp_w: Optional[int] = None
+    fan_size_mm: Optional[int] = None
+
+    SCHEMA: ClassVar = (
+        ('base_material', 'Материал основания', 'text'),
+        ('rpm', 'Скорость вращения', 'int_unit'),
+        ('noise_db', 'Уровень шума', 'float_unit'),
+        ('power_pins', 'Разъем питания', 'int_unit'),
+        ('max_tdp_w', 'Макс. TDP', 'int_unit'),
+        ('fan_size_mm', 'Размер вентилятора', 'int_unit'),
+    )
+    UNITS: ClassVar = {'rpm': 'об/мин', 'noise_db': 'дБ', 'power_pins': 'pin', 'max_tdp_w': 'Вт', 'fan_size_mm': 'мм'}
+
+
+@dataclass(slots=True)
+class CoolingSystemRecord(ProductRecord):
+    fan_size_mm: Optional[int] = None
+    sections: Optional[int] = None
+    fans: Optional[int] = None
+    power: Optional[str] = None
+    radiator_material: Optional[str] = None
+    tdp_w: Optional[int] = None
+    cooling_type: Optional[str] = None
+
+    SCHEMA: ClassVar = (
+        ('fan_size_mm', 'Размер вентилятора(ов)', 'int_unit'),
+        ('sections', 'Количество секций', 'int_text'),
+        ('fans', 'Количество вентиляторов', 'int_text'),
+        ('power', 'Питание', 'text'),
+        ('radiator_material', 'Материал радиатора', 'text'),
+        ('tdp_w', 'TDP', 'int_unit'),
+        ('cooling_type', 'Тип охлаждения', 'text'),
+    )
+    UNITS: ClassVar = {'fan_size_mm': 'мм', 'tdp_w': 'Вт'}
+
+
+@dataclass(slots=True)
+class CpuRecord(ProductRecord):
+    socket: Optional[str] = None
+    cores: Optional[int] = None
+    frequency_ghz: Optional[float] = None
+    l2_cache_mb: Optional[float] = None
+    l3_cache_mb: Optional[float] = None
+    memory_channels: Optional[int] = None
+    graphics: Optional[str] = None
+    tdp_w: Optional[int] = None
+
+    SCHEMA: ClassVar = (
+        ('socket', 'Сокет', 'text'),
+        ('cores', 'Количество ядер', 'int'),
+        ('frequency_ghz', 'Частота (ГГц)', 'float'),
+        ('l2_cache_mb', 'Кэш L2 (МБ)', 'float'),
+        ('l3_cache_mb', 'Кэш L3 (МБ)', 'float'),
+        ('memory_channels', 'Количество каналов памяти', 'int'),
+        ('graphics', 'Графика', 'text'),
+        ('tdp_w', 'TDP (Вт)', 'int'),
+    )
+
+
+@dataclass(slots=True)
+class GpuRecord(ProductRecord):
+    memory_gb: Optional[float] = None
+    memory_type: Optional[str] = None
+    memory_bus_bits: Optional[int] = None
+    gpu_clock_mhz: Optional[int] = None
+    memory_clock_mhz: Optional[int] = None
+    pcie_version: Optional[str] = None
+    connectors: Optional[str] = None
+
+    SCHEMA: ClassVar = (
+        ('memory_gb', 'Объем памяти (ГБ)', 'float'),
+        ('memory_type', 'Тип памяти', 'text'),
+        ('memory_bus_bits', 'Шина памяти (бит)', 'int'),
+        ('gpu_clock_mhz', 'Частота GPU (МГц)', 'int'),
+        ('memory_clock_mhz', 'Частота памяти (МГц)', 'int'),
+        ('pcie_version', 'Версия PCIe', 'text'),
+        ('connectors', 'Разъемы', 'text'),
+    )
+
+
+# Тип записи для каждого каталога парсера
+RECORD_TYPES = {
+    'ram': RamRecord,
+    'motherboard': MotherboardRecord,
+    'cpu_cooler': CpuCoolerRecord,
+    'cooling_system': CoolingSystemRecord,
+    'cpu': CpuRecord,
+    'gpu': GpuRecord,
+}
+
+
+def to_records(component: str, items: Iterable[Optional[Dict[str, Any]]]) -> List[ProductRecord]:
+    """Словари парсера компонента -> типизированные записи (None пропускаются)"""
+    if component not in RECORD_TYPES:
+        raise ValueError(f"Неизвестный тип компонента: {component}")
+    return RECORD_TYPES[component].from_dicts(items)
+
+
+def to_dicts(records: Iterable[ProductRecord]) -> List[Dict[str, Any]]:
+    """Записи -> словари в формате парсера, например для ExcelDataSaver и SQLDataSaver"""
+    return [record.to_dict() for record in records]
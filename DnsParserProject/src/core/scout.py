@@ -1,31 +1,178 @@
 import re
-import random
-from time import sleep
-from typing import Tuple, List, Dict
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple, List, Dict, Optional
+from lxml import html as lxml_html
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from .dedup import product_key
+
+PAGE_NUMBER = re.compile(r'[?&]p=(\d+)')
+
+
+class PageCountCache:
+    """Число страниц каталога по URL между запусками (JSON-файл).
+    Свежие записи (моложе ttl секунд) заменяют разведку, устаревшие служат оценкой для
+    ленивого обхода, который сам находит последнюю страницу"""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Не удалось прочитать кэш страниц {self.path}: {e}")
+
+    @classmethod
+    def from_config(cls, config):
+        """Создает кэш по настройкам ScraperConfig"""
+        return cls(path=config.page_count_path, ttl=config.page_count_ttl)
+
+    def get(self, url: str) -> Optional[int]:
+        """Число страниц, если запись не старше ttl"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None or time.time() - entry['updated'] > self.ttl:
+            return None
+        return entry['pages']
+
+    def estimate(self, url: str) -> Optional[int]:
+        """Число страниц из прошлого обхода независимо от возраста записи"""
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry['pages'] if entry else None
+
+    def put(self, url: str, pages: int):
+        with self._lock:
+            self._entries[url] = {'pages': int(pages), 'updated': time.time()}
+
+    def save(self):
+        if self.path is None:
+            return
+        with self._lock:
+            entries = dict(self._entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+
+class PageFrontier:
+    """Ленивое определение конца каталога при обходе по оценке числа страниц.
+    Если последняя поставленная страница вернула товары, ставится следующая;
+    обход компонента заканчивается на странице без товаров. DNS на номер за концом
+    каталога может отдать последнюю страницу еще раз, поэтому страница, первый товар
+    которой совпадает с первым товаром предыдущей, тоже считается концом каталога"""
+
+    def __init__(self, max_pages: int = 1000):
+        self.max_pages = max_pages
+        self._components: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def start(self, component: str, base_url: str, total_pages: int, lazy: bool):
+        with self._lock:
+            self._components[component] = {'base_url': base_url, 'last': total_pages, 'found': 0, 'lazy': lazy,
+                                            'first_keys': {}}
+
+    @staticmethod
+    def first_key(data) -> Optional[str]:
+        """Ключ первого товара сырой страницы [names, prices, hrefs] или None, если товаров нет"""
+        if not data or not data[0] or len(data) < 3 or not data[2]:
+            return None
+        return product_key(data[2][0])
+
+    def page_loaded(self, component: str, url: str, first_key: Optional[str]) -> Optional[str]:
+        """Отмечает загруженную страницу по ключу ее первого товара (None - товаров нет);
+        возвращает URL следующей страницы, если ее нужно поставить"""
+        page = TaskDistributor.page_number(url)
+        with self._lock:
+            state = self._components.get(component)
+            if state is None or page is None:
+                return None
+            first_keys = state['first_keys']
+            has_products = first_key is not None and first_key != first_keys.get(page - 1)
+            if first_key is not None:
+                first_keys[page] = first_key
+            if has_products:
+                state['found'] = max(state['found'], page)
+            if not (state['lazy'] and has_products and page == state['last'] < self.max_pages):
+                return None
+            state['last'] += 1
+            next_page = state['last']
+        return TaskDistributor.generate_page_urls(state['base_url'], next_page, next_page)[0]
+
+    def found_pages(self, component: str) -> int:
+        """Последняя страница компонента с товарами (0, если таких не было)"""
+        with self._lock:
+            state = self._components.get(component)
+            return state['found'] if state else 0
+
 
 class PageScout:
-    """Класс-разведчик для определения количества страниц"""
+    """Класс-разведчик для определения количества страниц.
+    Сначала пробует HTML, загруженный HTTP-движком, затем браузер из пула"""
+
+    def __init__(self, pool=None, waits=None, fetcher=None):
+        from .waits import WaitStrategy
 
-    def __init__(self):
         self.driver = None
+        self.pool = pool
+        self.fetcher = fetcher
+        self.waits = waits or WaitStrategy()
         self.xpathes = {
             "pagination": "//div[contains(@class, 'pagination-widget')]//a",
             "last_page": "//div[contains(@class, 'pagination-widget')]//a[contains(@class, 'pagination-widget__page-link_last')]",
             "page_numbers": "//div[contains(@class, 'pagination-widget')]//a[contains(@class, 'pagination-widget__page-link')]",
             "product_count": "//div[contains(@class, 'products-count')]",
+            "product_card": "//div[contains(@class, 'catalog-product')]",
         }
 
-    def get_total_pages(self, url: str) -> int:
-        """Определяет общее количество страниц для парсинга"""
+    def get_total_pages(self, url: str) -> Optional[int]:
+        """Определяет общее количество страниц для парсинга; None, если его не удалось определить"""
+        page_html = self.fetcher.fetch_html(url) if hasattr(self.fetcher, 'fetch_html') else None
+        if page_html:
+            total_pages = self.count_from_html(page_html)
+            if total_pages > 0:
+                print(f"Определено страниц для парсинга без браузера: {total_pages}")
+                return total_pages
+
         try:
+            if self.pool is not None:
+                # Берем уже запущенный браузер из общего пула
+                with self.pool.driver() as driver:
+                    self.driver = driver
+                    self.pool.record_page(driver)
+                    return self._scout(url)
+
             from .parser import BrowserManager
             self.driver = BrowserManager.start_browser()
+            try:
+                return self._scout(url)
+            finally:
+                BrowserManager.quit_browser(self.driver)
+
+        except Exception as e:
+            print(f"Ошибка при определении количества страниц: {e}")
+            return None
+        finally:
+            self.driver = None
+
+    def _scout(self, url: str) -> Optional[int]:
+        with self.waits.page(url):
             self.driver.get(url)
-            sleep(random.uniform(3, 6))
+            # Ждем, пока отрисуются пагинация или карточки, вместо фиксированной паузы
+            self.waits.wait_for_any(self.driver, [self.xpathes["pagination"], self.xpathes["product_card"]])
+            self.waits.wait_for_network_idle(self.driver, timeout=3)
 
             # Пробуем разные методы определения количества страниц
             total_pages = self._try_pagination_methods()
@@ -33,15 +180,40 @@ class PageScout:
             if total_pages == 0:
                 total_pages = self._estimate_from_product_count()
 
-            print(f"Определено страниц для парсинга: {total_pages}")
-            return max(1, total_pages)
+        if total_pages == 0:
+            print("Не удалось определить количество страниц")
+            return None
+        print(f"Определено страниц для парсинга: {total_pages}")
+        return total_pages
 
-        except Exception as e:
-            print(f"Ошибка при определении количества страниц: {e}")
-            return 1
-        finally:
-            if self.driver:
-                self.driver.quit()
+    def count_from_html(self, page_html: str) -> int:
+        """Число страниц по HTML страницы каталога теми же способами, что и в браузере; 0, если не найдено"""
+        try:
+            tree = lxml_html.fromstring(page_html)
+        except Exception:
+            return 0
+
+        for node in tree.xpath(self.xpathes["last_page"]):
+            text = node.text_content().strip()
+            if text.isdigit():
+                return int(text)
+
+        max_page = 0
+        for node in tree.xpath(self.xpathes["pagination"]):
+            match = PAGE_NUMBER.search(node.get("href") or "")
+            if match:
+                max_page = max(max_page, int(match.group(1)))
+            text = node.text_content().strip()
+            if text.isdigit():
+                max_page = max(max_page, int(text))
+        if max_page:
+            return max_page
+
+        for node in tree.xpath(self.xpathes["product_count"]):
+            match = re.search(r'(\d+)\s*из\s*(\d+)', node.text_content())
+            if match:
+                return max(1, (int(match.group(2)) + 19) // 20)
+        return 0
 
     def _try_pagination_methods(self) -> int:
         """Пробует разные методы определения пагинации"""
@@ -64,7 +236,7 @@ class PageScout:
     def _get_from_last_page_button(self) -> int:
         """Получает номер последней страницы из кнопки 'последняя'"""
         try:
-            last_page_element = WebDriverWait(self.driver, 10).until(
+            last_page_element = WebDriverWait(self.driver, 2).until(
                 EC.presence_of_element_located((By.XPATH, self.xpathes["last_page"]))
             )
             last_page_text = last_page_element.text.strip()
@@ -117,7 +289,7 @@ class PageScout:
             return 0
 
     def _estimate_from_product_count(self) -> int:
-        """Оценивает количество страниц по общему числу товаров"""
+        """Оценивает количество страниц по общему числу товаров; 0, если счетчика нет"""
         try:
             count_element = self.driver.find_element(By.XPATH, self.xpathes["product_count"])
             count_text = count_element.text.strip()
@@ -129,7 +301,7 @@ class PageScout:
         except:
             pass
 
-        return 5
+        return 0
 
 
 class TaskDistributor:
@@ -157,6 +329,12 @@ class TaskDistributor:
         print(f"Распределение страниц между {num_threads} потоками: {distributions}")
         return distributions
 
+    @staticmethod
+    def page_number(url: str) -> Optional[int]:
+        """Номер страницы из URL, построенного generate_page_urls"""
+        match = PAGE_NUMBER.search(url)
+        return int(match.group(1)) if match else None
+
     @staticmethod
     def generate_page_urls(base_url: str, start_page: int, end_page: int) -> List[str]:
         """Генерирует URL для диапазона страниц"""
@@ -169,4 +347,69 @@ class TaskDistributor:
                 url = f"{base_url}?p={page}"
             urls.append(url)
 
-        return urls
\ No newline at end of file
+        return urls
+
+
+@dataclass
+class PageTask:
+    """Задача на парсинг одной страницы каталога"""
+    component: str
+    url: str
+    attempts: int = 0
+
+
+class PageTaskQueue:
+    """Общая очередь страниц всех компонентов: свободный поток забирает следующую страницу"""
+
+    def __init__(self, max_retries: int = 2):
+        self.max_retries = max_retries
+        self.progress = {}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+
+    def add_component(self, component: str, base_url: str, total_pages: int, urls: Optional[List[str]] = None):
+        """Ставит в очередь все страницы компонента или только перечисленные urls"""
+        page_urls = TaskDistributor.generate_page_urls(base_url, 1, total_pages) if urls is None else urls
+
+        with self._lock:
+            self.progress[component] = {'total': len(page_urls), 'done': 0, 'failed': 0, 'retried': 0}
+
+        for url in page_urls:
+            self._queue.put(PageTask(component, url))
+
+    def add_page(self, component: str, url: str):
+        """Добавляет страницу к уже поставленному компоненту (ленивый обход каталога)"""
+        with self._lock:
+            self.progress[component]['total'] += 1
+        self._queue.put(PageTask(component, url))
+
+    def get(self, timeout: Optional[float] = None) -> Optional[PageTask]:
+        """Возвращает следующую задачу или None, если очередь закрыта"""
+        return self._queue.get(timeout=timeout)
+
+    def task_done(self, task: PageTask, success: bool) -> bool:
+        """Отмечает завершение задачи; неудачная страница возвращается в очередь, пока есть попытки.
+        Возвращает True, если все страницы компонента обработаны"""
+        with self._lock:
+            counters = self.progress[task.component]
+            if success:
+                counters['done'] += 1
+            elif task.attempts < self.max_retries:
+                counters['retried'] += 1
+                task.attempts += 1
+                self._queue.put(task)
+            else:
+                counters['failed'] += 1
+            finished = counters['done'] + counters['failed'] == counters['total']
+
+        self._queue.task_done()
+        return finished
+
+    def join(self):
+        """Ожидает обработки всех поставленных страниц"""
+        self._queue.join()
+
+    def close(self, num_workers: int):
+        """Останавливает потоки, ожидающие задачи"""
+        for _ in range(num_workers):
+            self._queue.put(None)
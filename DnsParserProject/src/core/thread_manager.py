@@ -1,146 +1,474 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-from typing import Dict, List, Tuple
-import time
+from typing import Dict, List, Optional
+
+from .compatibility import CompatibilityIndex
+from .dedup import Deduplicator, product_key
+from .parse_cache import ParseCache
+from .rate_limiter import RateLimiter
+from .scout import PageCountCache, PageFrontier
+from .waits import WaitStats, WaitStrategy
 
 
 class AdvancedThreadedScraper:
     """Продвинутый многопоточный скрапер с распределением страниц"""
 
-    def __init__(self, max_workers=3, requests_per_minute=30):
+    def __init__(self, max_workers=3, requests_per_minute=30, pool_size=None,
+                 max_pages_per_browser=50, max_browser_memory_mb=2048, extraction_mode='script',
+                 fetch_backend='selenium', max_retries=2, rate_limiter=None,
+                 proxy_check_ttl=300, proxy_check_timeout=10, wait_timeout=15, humanization_budget=3.0,
+                 parse_cache=None, writer=None, keep_results=True, journal=None, resume=False,
+                 page_counts=None, lazy_pages=True, crawl_mode='pages', deduplicator=None, parse_stage=None):
         self.max_workers = max_workers
         self.requests_per_minute = requests_per_minute
+        self.pool_size = pool_size or max_workers
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_browser_memory_mb = max_browser_memory_mb
+        self.extraction_mode = extraction_mode
+        self.fetch_backend = fetch_backend
+        # pages - страницы ?p=N по отдельности; expand / delta - весь каталог одной задачей
+        # через «Показать ещё», поэтому диапазоны p= не пересекаются с догруженными товарами
+        if crawl_mode != 'pages' and fetch_backend != 'selenium':
+            raise ValueError(f"Режим обхода {crawl_mode} доступен только с движком selenium")
+        self.crawl_mode = crawl_mode
+        self.pool = None
+        self.fetcher = None
+        self.max_retries = max_retries
+        self.proxy_check_ttl = proxy_check_ttl
+        self.proxy_check_timeout = proxy_check_timeout
+        self.proxy_pool = None
+        self.wait_timeout = wait_timeout
+        self.humanization_budget = humanization_budget
+        self.wait_stats = WaitStats()
+        self.task_queue = None
         self.results = {}
+        self.compatibility = None
         self.lock = threading.Lock()
-        self.last_request_time = 0
-        self.request_lock = threading.Lock()
-
-    def rate_limit(self):
-        """Контроль скорости запросов"""
-        with self.request_lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            min_interval = 60.0 / self.requests_per_minute
-
-            if time_since_last < min_interval:
-                time.sleep(min_interval - time_since_last)
-
-            self.last_request_time = time.time()
-
-    def scrape_page_range(self, component: str, page_range: Tuple[int, int], base_url: str, proxies: list[str]) -> List[Dict]:
-        """Парсинг диапазона страниц для одного компонента"""
+        self.rate_limiter = rate_limiter or RateLimiter(requests_per_minute=requests_per_minute)
+        self.parse_cache = parse_cache or ParseCache()
+        # Повторы товаров (пересечения страниц, «Показать ещё», повторы запросов) отсеиваются до разбора
+        self.deduplicator = deduplicator or Deduplicator()
+        # Ключи товаров страниц в стадии разбора: фиксируются в отсеве повторов после записи страницы
+        self._page_keys: Dict[tuple, List[str]] = {}
+        # Задачи страниц в стадии разбора: остаются открытыми, пока стадия не вызовет on_page / on_error
+        self._stage_tasks: Dict[tuple, object] = {}
+        # Разбор в пуле процессов (ParseStage); без него страницы разбираются в потоках браузеров
+        self.parse_stage = parse_stage
+        if parse_stage is not None:
+            # Стадия разбора пользуется тем же кэшем, который сохраняется в конце обхода
+            parse_stage.parse_cache = self.parse_cache
+        # Потоковая запись страниц (StreamingWriter); без нее товары копятся в self.results
+        self.writer = writer
+        self.keep_results = keep_results or writer is None
+        # Журнал обхода (CrawlJournal): при resume завершенные страницы не загружаются повторно
+        self.journal = journal
+        self.resume = resume
+        self._resumed_urls: Dict[str, List[str]] = {}
+        # Число страниц каталогов между запусками (PageCountCache); при lazy_pages устаревшая
+        # запись служит оценкой без разведки, а конец каталога находится во время обхода
+        self.page_counts = page_counts or PageCountCache()
+        self.lazy_pages = lazy_pages
+        self.frontier = PageFrontier()
+        self._lazy_components = set()
+
+    @classmethod
+    def from_config(cls, config, **overrides) -> 'AdvancedThreadedScraper':
+        """Создает скрапер по настройкам ScraperConfig вместе с ограничителем, кэшами, журналом,
+        отсевом повторов, стадией разбора и потоковой записью; overrides заменяют аргументы конструктора"""
+        from ..storage.sink import StreamingWriter
+        from .journal import CrawlJournal
+        from .parse_stage import ParseStage
+
+        kwargs = dict(
+            max_workers=config.max_workers, requests_per_minute=config.requests_per_minute,
+            pool_size=config.browser_pool_size, max_pages_per_browser=config.max_pages_per_browser,
+            max_browser_memory_mb=config.max_browser_memory_mb, extraction_mode=config.extraction_mode,
+            fetch_backend=config.fetch_backend, max_retries=config.max_page_retries,
+            proxy_check_ttl=config.proxy_check_ttl, proxy_check_timeout=config.proxy_check_timeout,
+            wait_timeout=config.wait_timeout, humanization_budget=config.humanization_budget,
+            keep_results=config.keep_results, resume=config.resume, lazy_pages=config.lazy_pages,
+            crawl_mode=config.crawl_mode,
+        )
+        # Компоненты создаются, только если не переданы в overrides: журнал и запись открывают файлы
+        factories = {
+            'rate_limiter': lambda: RateLimiter.from_config(config),
+            'parse_cache': lambda: ParseCache.from_config(config),
+            'page_counts': lambda: PageCountCache.from_config(config),
+            'deduplicator': lambda: Deduplicator.from_config(config),
+            'journal': lambda: CrawlJournal.from_config(config),
+            'parse_stage': lambda: ParseStage.from_config(config),
+            'writer': lambda: StreamingWriter.from_config(config),
+        }
+        kwargs.update((name, factory()) for name, factory in factories.items() if name not in overrides)
+        kwargs.update(overrides)
+        return cls(**kwargs)
+
+    def make_waits(self) -> WaitStrategy:
+        """Стратегия ожидания для одной страницы с общей статистикой"""
+        return WaitStrategy(timeout=self.wait_timeout, humanization_budget=self.humanization_budget,
+                            stats=self.wait_stats)
+
+    def parse_page_data(self, component: str, data) -> List[Dict]:
+        """Разбор данных одной страницы парсером компонента; известные названия берутся из кэша"""
+        return [product for product in self.parse_cache.parse_page(component, data) if product]
+
+    def process_page(self, component: str, data, url: Optional[str] = None) -> List[Dict]:
+        """Отсев повторов, разбор страницы, передача товаров на потоковую запись и отметка в журнале.
+        Возвращает товары, если они хранятся до конца обхода, иначе пустой список"""
+        data, keys = self.deduplicator.check_page(component, data)
         try:
-            from .parser import DNSScraper, ParserFactory
-            from .scout import TaskDistributor
-
-            start_page, end_page = page_range
-            print(f"Поток начинает парсинг {component} со страниц {start_page}-{end_page}")
-
-            all_data = []
-            scraper = DNSScraper(proxies)
-
-            page_urls = TaskDistributor.generate_page_urls(base_url, start_page, end_page)
-
-            for page_url in page_urls:
-                self.rate_limit()
-
-                try:
-                    print(f"Парсинг страницы: {page_url}")
-                    data = scraper.scrape_page(page_url)
-                    parser = ParserFactory.get_parser(component)
-                    result = parser.data_dict_creator(data)
-
-                    if result:
-                        all_data.extend(result)
-
-                except Exception as e:
-                    print(f"Ошибка при парсинге {page_url}: {e}")
-                    continue
+            products = self.finish_page(component, self.parse_page_data(component, data), url)
+        except Exception:
+            # Страница будет повторена: ее товары не должны считаться уже встреченными
+            self.deduplicator.release(component, keys)
+            raise
+        self.deduplicator.commit(component, keys)
+        return products
+
+    def finish_page(self, component: str, products: List[Dict], url: Optional[str] = None) -> List[Dict]:
+        """Передача разобранных товаров страницы на потоковую запись и отметка в журнале.
+        С потоковой записью страница отмечается, только когда записан ее пакет (pages_written)"""
+        journaled = self.journal is not None and url is not None
+        if self.writer is not None:
+            self.writer.put(component, products, page=url if journaled else None)
+        elif journaled:
+            self.journal.mark_done(component, url, products)
+        return products if self.keep_results else []
+
+    def pages_written(self, component: str, pages):
+        """Отметка в журнале страниц, пакет которых подтвердил получатель потоковой записи"""
+        for url, products in pages:
+            self.journal.mark_done(component, url, products)
+
+    def record_failure(self, component: str, url: str, error):
+        with self.lock:
+            keys = self._page_keys.pop((component, url), None)
+        if keys:
+            self.deduplicator.release(component, keys)
+        if self.journal is not None:
+            self.journal.mark_failed(component, url, error)
+
+    def discover_pages(self, component: str, base_url: str) -> int:
+        """Число страниц компонента: из журнала при возобновлении, из кэша числа страниц
+        или разведкой. При lazy_pages устаревшая запись кэша используется как оценка;
+        если разведка не определила число страниц, обход идет лениво с первой страницы.
+        В режимах expand / delta весь каталог загружается с первой страницы"""
+        from .scout import PageScout
+
+        if self.crawl_mode != 'pages':
+            return 1
+
+        state = self.journal.component_state(component, base_url) if self.resume and self.journal else None
+        if state is not None:
+            total_pages, lazy = state
+            if lazy:
+                # Ленивый обход продолжается с самой дальней поставленной страницы
+                with self.lock:
+                    self._lazy_components.add(component)
+            print(f"📒 Для {component} число страниц взято из журнала: {total_pages}")
+            return total_pages
+
+        total_pages = self.page_counts.get(base_url)
+        if total_pages is None and self.lazy_pages:
+            total_pages = self.page_counts.estimate(base_url)
+            if total_pages is not None:
+                with self.lock:
+                    self._lazy_components.add(component)
+                print(f"📐 Для {component} оценка по прошлому обходу: {total_pages} стр., конец найдется при обходе")
+                return total_pages
+        if total_pages is not None:
+            print(f"🗂️  Для {component} число страниц взято из кэша: {total_pages}")
+            return total_pages
+
+        print(f"🕵️  Разведка для компонента: {component}")
+        total_pages = PageScout(self.pool, self.make_waits(), self.fetcher).get_total_pages(base_url)
+        if total_pages is None:
+            # Число страниц неизвестно: в кэш ничего не пишется, конец каталога находится
+            # ленивым обходом с первой страницы
+            with self.lock:
+                self._lazy_components.add(component)
+            print(f"📐 Для {component} число страниц не определено, конец найдется при обходе")
+            return 1
+        print(f"📊 Для {component} найдено страниц: {total_pages}")
+        self.page_counts.put(base_url, total_pages)
+        return total_pages
+
+    def pending_pages(self, component: str, base_url: str, total_pages: int) -> List[str]:
+        """URL страниц, которые нужно обойти: без журнала - все, иначе все, кроме завершенных ранее"""
+        from .scout import TaskDistributor
+
+        page_urls = TaskDistributor.generate_page_urls(base_url, 1, total_pages)
+        with self.lock:
+            lazy = component in self._lazy_components
+        self.frontier.start(component, base_url, total_pages, lazy)
+        if self.journal is None:
+            return page_urls
+
+        self.journal.start_component(component, base_url, total_pages, lazy)
+        pending = self.journal.pending_urls(component, page_urls)
+        remaining = set(pending)
+        resumed = [url for url in page_urls if url not in remaining]
+        if resumed:
+            print(f"📒 {component}: пропущено завершенных страниц {len(resumed)}, осталось {len(pending)}")
+            page_results = self.journal.page_results(component, resumed)
+            self.deduplicator.seed(component, (product.get('Ссылка') for products in page_results.values()
+                                               for product in products))
+            if lazy:
+                # Завершенные страницы восстанавливают границу ленивого обхода, как если бы загрузились сейчас
+                for url in resumed:
+                    products = page_results.get(url)
+                    first_key = product_key(products[0].get('Ссылка')) if products else None
+                    next_url = self._frontier_loaded(component, url, first_key)
+                    if next_url is not None:
+                        pending.append(next_url)
+        with self.lock:
+            self._resumed_urls[component] = resumed
+        return pending
+
+    def page_loaded(self, component: str, url: str, data) -> Optional[str]:
+        """Отмечает загруженную страницу для ленивого обхода; возвращает URL следующей страницы,
+        если каталог еще не закончился"""
+        return self._frontier_loaded(component, url, PageFrontier.first_key(data))
+
+    def _frontier_loaded(self, component: str, url: str, first_key: Optional[str]) -> Optional[str]:
+        from .scout import TaskDistributor
+
+        next_url = self.frontier.page_loaded(component, url, first_key)
+        if next_url is not None and self.journal is not None:
+            self.journal.extend_component(component, TaskDistributor.page_number(next_url))
+        return next_url
+
+    def finish_component(self, component: str, base_url: str):
+        """Запоминает найденное обходом число страниц ленивого компонента"""
+        with self.lock:
+            lazy = component in self._lazy_components
+        found = self.frontier.found_pages(component)
+        if lazy and found:
+            self.page_counts.put(base_url, found)
+
+    def resumed_results(self, component: str) -> List[Dict]:
+        """Товары страниц, завершенных в прошлых запусках и пропущенных в этом"""
+        with self.lock:
+            resumed = self._resumed_urls.get(component)
+        if not resumed or not self.keep_results:
+            return []
+        return self.journal.results(component, resumed)
+
+    def scout_component(self, component: str, base_url: str) -> int:
+        """Разведка компонента и постановка его страниц в общую очередь"""
+        total_pages = self.discover_pages(component, base_url)
+        self.task_queue.add_component(component, base_url, total_pages,
+                                      urls=self.pending_pages(component, base_url, total_pages))
+        return total_pages
+
+    def page_worker(self, component_data: Dict[str, List[Dict]]):
+        """Поток забирает страницы из общей очереди, пока она не закроется"""
+        while True:
+            task = self.task_queue.get()
+            if task is None:
+                break
+
+            success = False
+            staged = False
+            try:
+                # Ограничение частоты и учет ответа - внутри движка загрузки, с прокси запроса
+                print(f"Парсинг страницы: {task.url}")
+                data = self.fetcher.fetch_page(task.url)
+                if self.parse_stage is None:
+                    products = self.process_page(task.component, data, task.url)
+                    with self.lock:
+                        component_data[task.component].extend(products)
 
-            scraper.close()
-            print(f"Завершен парсинг {component} ({len(all_data)} товаров)")
-            return all_data
+                next_url = self.page_loaded(task.component, task.url, data)
+                if next_url is not None:
+                    self.task_queue.add_page(task.component, next_url)
 
-        except Exception as e:
-            print(f"Ошибка в потоке для {component}: {e}")
-            return []
+                if self.parse_stage is not None:
+                    # Поток браузера только передает страницу: разбор и запись идут в стадии разбора,
+                    # она же завершает задачу, и при ошибке разбора страница загружается повторно
+                    page, keys = self.deduplicator.check_page(task.component, data)
+                    with self.lock:
+                        self._page_keys[(task.component, task.url)] = keys
+                        self._stage_tasks[(task.component, task.url)] = task
+                    staged = True
+                    self.parse_stage.submit(task.component, task.url, page)
+                success = True
+
+            except Exception as e:
+                print(f"Ошибка при парсинге {task.url} (попытка {task.attempts + 1}): {e}")
+                if staged:
+                    # Страница не попала в стадию разбора: задачу завершает поток
+                    staged = False
+                    with self.lock:
+                        self._stage_tasks.pop((task.component, task.url), None)
+                self.record_failure(task.component, task.url, e)
+            finally:
+                if not staged:
+                    self._complete_task(task, success)
+
+    def _complete_task(self, task, success: bool):
+        """Завершение задачи страницы в общей очереди; неудачная возвращается в очередь, пока есть попытки"""
+        if self.task_queue.task_done(task, success):
+            counters = self.task_queue.progress[task.component]
+            print(f"✅ Завершен парсинг {task.component}: страниц {counters['done']}/{counters['total']}, "
+                  f"ошибок {counters['failed']}, повторов {counters['retried']}")
+
+    def scrape_all(self, components_urls: Dict[str, str], proxies=None) -> Dict[str, List[Dict]]:
+        """Многопоточный парсинг всех компонентов через общую очередь страниц"""
+        print(f"🚀 Запуск многопоточного парсера для {len(components_urls)} компонентов")
 
-    def scrape_component(self, component: str, base_url: str, proxies: list[str]) -> Dict:
-        """Парсинг одного компонента с распределением по страницам"""
         try:
-            from .scout import PageScout, TaskDistributor
-
-            print(f"🕵️  Разведка для компонента: {component}")
-
-            total_pages = PageScout().get_total_pages(base_url)
-            print(f"📊 Для {component} найдено страниц: {total_pages}")
-
-            page_distributions = TaskDistributor.distribute_pages(total_pages, self.max_workers)
-            print(f"📋 Распределение для {component}: {page_distributions}")
-
-            all_component_data = []
-
-            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(page_distributions))) as executor:
-                future_to_range = {
-                    executor.submit(self.scrape_page_range, component, page_range, base_url, proxies): page_range
-                    for page_range in page_distributions
-                }
-
-                for future in as_completed(future_to_range):
-                    page_range = future_to_range[future]
-                    try:
-                        page_data = future.result()
-                        all_component_data.extend(page_data)
-                        print(f"✓ Завершен диапазон {page_range} для {component}")
-                    except Exception as e:
-                        print(f"✗ Ошибка в диапазоне {page_range}: {e}")
-
-            print(f"✅ Завершен парсинг {component}, собрано {len(all_component_data)} товаров")
-            return {
-                'component_type': component,
-                'data': all_component_data,
-                'success': True
-            }
+            self._start_session(components_urls, proxies)
+            self._run_components(components_urls, proxies)
+        finally:
+            self._stop_session()
 
-        except Exception as e:
-            print(f"❌ Критическая ошибка для {component}: {e}")
-            return {
-                'component_type': component,
-                'data': [],
-                'success': False,
-                'error': str(e)
-            }
+        # Индекс совместимости для подбора сборок и запросов по сокету / типу памяти
+        self.compatibility = CompatibilityIndex.build(self.results)
 
-    def scrape_all(self, components_urls: Dict[str, str], proxies) -> Dict[str, List[Dict]]:
-        """Многопоточный парсинг всех компонентов с распределением по страницам"""
-        print(f"🚀 Запуск многопоточного парсера для {len(components_urls)} компонентов")
+        total_products = sum(len(data) for data in self.results.values() if data)
+        print(f"🎉 Парсинг завершен! Собрано {total_products} товаров")
+        print(f"⏱️  Ожидание страниц: {self.wait_stats.summary()}")
+
+        return self.results
 
+    def _start_session(self, components_urls: Dict[str, str], proxies):
+        """Запускает пул браузеров и движок загрузки страниц"""
+        from .parser import BrowserPool
+        from .proxy_pool import ProxyPool
+
+        # Прокси проверяются параллельно один раз, дальше каждый браузер получает свой
+        self.proxy_pool = ProxyPool(proxies, ttl=self.proxy_check_ttl,
+                                    timeout=self.proxy_check_timeout) if proxies else None
+
+        # Браузеры запускаются один раз и используются и разведчиком, и потоками страниц.
+        # HTTP-движку браузеры нужны только для прогрева сессии и обхода проверок
+        self.pool = BrowserPool(
+            size=self.pool_size,
+            proxy_pool=self.proxy_pool,
+            max_pages=self.max_pages_per_browser,
+            max_memory_mb=self.max_browser_memory_mb,
+            prelaunch=self.fetch_backend == 'selenium',
+        )
+        self.fetcher = self._create_fetcher(components_urls, proxies)
+        self.deduplicator.reset(list(components_urls))
+        if self.journal is not None and not self.resume:
+            # Новый обход: прошлые отметки этих компонентов не используются
+            self.journal.reset(components_urls)
+        if self.writer is not None:
+            self.writer.start(on_written=self.pages_written if self.journal is not None else None)
+
+    def _stop_session(self):
+        """Останавливает движок загрузки, закрывает браузеры, дописывает потоковую запись
+        и сохраняет кэши разбора и числа страниц и фильтр повторов.
+        Ошибка потоковой записи передается вызывающему после освобождения ресурсов"""
+        writer_error = None
+        if self.parse_stage is not None:
+            # Сначала дописываются страницы из стадии разбора, затем закрывается запись
+            self.parse_stage.close()
+            print(f"⚙️  Разбор в процессах: {self.parse_stage.stats()}")
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except Exception as e:
+                writer_error = e
+            print(f"💾 Потоковая запись: {self.writer.stats()}")
+        print(f"🗃️  Кэш разбора: {self.parse_cache.stats()}")
+        print(f"🧹 Отсев повторов: {self.deduplicator.stats()}")
+        if writer_error is None:
+            # Иначе товары незаписанных пакетов считались бы встреченными в следующих обходах
+            self.deduplicator.save()
+        self.parse_cache.save()
+        self.page_counts.save()
+        if self.fetcher:
+            self.fetcher.close()
+            self.fetcher = None
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+        if writer_error is not None:
+            raise writer_error
+
+    def _create_fetcher(self, components_urls: Dict[str, str], proxies):
+        """Создает движок загрузки страниц согласно настройке fetch_backend"""
+        from .fetchers import SeleniumFetchBackend, HttpFetchBackend
+
+        selenium_fetcher = SeleniumFetchBackend(self.pool, proxies, self.extraction_mode, self.make_waits,
+                                                self.crawl_mode, rate_limiter=self.rate_limiter)
+        if self.fetch_backend == 'selenium':
+            return selenium_fetcher
+
+        if self.fetch_backend != 'http':
+            raise ValueError(f"Неизвестный движок загрузки: {self.fetch_backend}")
+
+        fetcher = HttpFetchBackend(fallback=selenium_fetcher, pool_size=self.pool_size * self.max_workers,
+                                   rate_limiter=self.rate_limiter, proxy_pool=self.proxy_pool)
+        if components_urls:
+            with self.pool.driver() as driver:
+                fetcher.warm_up(driver, next(iter(components_urls.values())))
+        return fetcher
+
+    def _collect_page(self, component_data: Dict[str, List[Dict]], component: str, url: str, products: List[Dict]):
+        """Товары страницы, разобранной стадией разбора"""
+        products = self.finish_page(component, products, url)
+        with self.lock:
+            component_data[component].extend(products)
+            keys = self._page_keys.pop((component, url), None)
+            task = self._stage_tasks.pop((component, url), None)
+        if keys:
+            self.deduplicator.commit(component, keys)
+        if task is not None:
+            self._complete_task(task, True)
+
+    def _stage_failed(self, component: str, url: str, error):
+        """Ошибка стадии разбора: страница возвращается в очередь, пока есть попытки"""
+        with self.lock:
+            task = self._stage_tasks.pop((component, url), None)
+        self.record_failure(component, url, error)
+        if task is not None:
+            self._complete_task(task, False)
+
+    def _run_components(self, components_urls: Dict[str, str], proxies):
+        """Разведка компонентов и парсинг их страниц через общую очередь"""
+        from .scout import PageTaskQueue
+
+        self.task_queue = PageTaskQueue(max_retries=self.max_retries)
+        component_data = {component: [] for component in components_urls}
+
+        workers = [
+            threading.Thread(target=self.page_worker, args=(component_data,), daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        if self.parse_stage is not None:
+            self.parse_stage.start(on_page=lambda component, url, products: self._collect_page(
+                component_data, component, url, products), on_error=self._stage_failed)
+        for worker in workers:
+            worker.start()
+
+        # Потоки начинают забирать страницы, пока идет разведка остальных компонентов
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_component = {
-                executor.submit(self.scrape_component, component, url, proxies): component
+                executor.submit(self.scout_component, component, url): component
                 for component, url in components_urls.items()
             }
 
-            completed = 0
-            total = len(components_urls)
-
             for future in as_completed(future_to_component):
                 component = future_to_component[future]
                 try:
-                    result = future.result()
-
-                    with self.lock:
-                        self.results[component] = result['data']
-
-                    completed += 1
-                    status = "✓" if result['success'] else "✗"
-                    print(f"{status} {component} завершен ({completed}/{total})")
-
+                    future.result()
                 except Exception as e:
-                    print(f"✗ Ошибка при обработке {component}: {e}")
-                    completed += 1
+                    print(f"✗ Ошибка разведки {component}: {e}")
 
-        total_products = sum(len(data) for data in self.results.values() if data)
-        print(f"🎉 Парсинг завершен! Собрано {total_products} товаров")
+        self.task_queue.join()
+        self.task_queue.close(len(workers))
+        for worker in workers:
+            worker.join()
+        if self.parse_stage is not None:
+            self.parse_stage.join()
 
-        return self.results
+        for component in component_data:
+            self.finish_component(component, components_urls[component])
+            component_data[component] = self.resumed_results(component) + component_data[component]
+
+        with self.lock:
+            self.results.update(component_data)
@@ -0,0 +1,154 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+NETWORK_STATE_SCRIPT = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+# Число узлов по XPath одним числом, без передачи ссылок на все элементы
+COUNT_SCRIPT = """
+return document.evaluate('count(' + arguments[0] + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue;
+"""
+
+
+@dataclass
+class PageWaitRecord:
+    """Сколько времени ушло на ожидание одной страницы"""
+    url: str
+    wait_seconds: float = 0.0
+    humanize_seconds: float = 0.0
+    conditions: int = 0
+    timeouts: int = 0
+
+
+class WaitStats:
+    """Общая статистика ожиданий по всем страницам"""
+
+    def __init__(self):
+        self.records: List[PageWaitRecord] = []
+        self._lock = threading.Lock()
+
+    def add(self, record: PageWaitRecord):
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> Dict:
+        with self._lock:
+            records = list(self.records)
+        pages = len(records)
+        waited = sum(record.wait_seconds for record in records)
+        humanized = sum(record.humanize_seconds for record in records)
+        return {
+            'pages': pages,
+            'wait_seconds': round(waited, 2),
+            'humanize_seconds': round(humanized, 2),
+            'avg_page_wait': round((waited + humanized) / pages, 2) if pages else 0.0,
+            'timeouts': sum(record.timeouts for record in records),
+        }
+
+
+class HumanizationBudget:
+    """Ограниченный запас случайных пауз «как у человека» на одну страницу"""
+
+    def __init__(self, total_seconds: float = 3.0, min_pause: float = 0.2, max_pause: float = 1.0):
+        self.total_seconds = total_seconds
+        self.min_pause = min_pause
+        self.max_pause = max_pause
+        self.remaining = total_seconds
+
+    def reset(self):
+        self.remaining = self.total_seconds
+
+    def pause(self) -> float:
+        if self.remaining <= 0:
+            return 0.0
+        delay = min(random.uniform(self.min_pause, self.max_pause), self.remaining)
+        time.sleep(delay)
+        self.remaining -= delay
+        return delay
+
+
+class WaitStrategy:
+    """Ожидание реальных условий на странице вместо фиксированных пауз"""
+
+    def __init__(self, timeout: float = 15, poll_frequency: float = 0.25, humanization_budget: float = 3.0,
+                 stats: Optional[WaitStats] = None):
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.budget = HumanizationBudget(humanization_budget)
+        self.stats = stats
+        self.record: Optional[PageWaitRecord] = None
+
+    @contextmanager
+    def page(self, url: str):
+        """Учитывает все ожидания внутри блока как ожидания одной страницы"""
+        self.record = PageWaitRecord(url)
+        self.budget.reset()
+        try:
+            yield self.record
+        finally:
+            if self.stats is not None:
+                self.stats.add(self.record)
+            self.record = None
+
+    def until(self, driver, condition, timeout: Optional[float] = None) -> bool:
+        """Ждет выполнения условия; возвращает False по таймауту"""
+        started = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout or self.timeout, poll_frequency=self.poll_frequency).until(condition)
+            return True
+        except TimeoutException:
+            if self.record:
+                self.record.timeouts += 1
+            return False
+        finally:
+            if self.record:
+                self.record.wait_seconds += time.monotonic() - started
+                self.record.conditions += 1
+
+    def wait_for_products(self, driver, xpath: str, min_count: int = 1, timeout: Optional[float] = None) -> bool:
+        """Ждет, пока на странице появится хотя бы min_count карточек"""
+        return self.until(driver, lambda d: len(d.find_elements(By.XPATH, xpath)) >= min_count, timeout)
+
+    def wait_for_any(self, driver, xpathes: List[str], timeout: Optional[float] = None) -> bool:
+        """Ждет появления любого из элементов"""
+        return self.until(driver, lambda d: any(d.find_elements(By.XPATH, xpath) for xpath in xpathes), timeout)
+
+    def wait_for_count_increase(self, driver, xpath: str, previous_count: int, gone_xpath: Optional[str] = None,
+                                timeout: Optional[float] = None) -> bool:
+        """Ждет роста числа карточек после «Показать ещё» или исчезновения кнопки"""
+        def condition(d):
+            if d.execute_script(COUNT_SCRIPT, xpath) > previous_count:
+                return True
+            return gone_xpath is not None and not d.find_elements(By.XPATH, gone_xpath)
+
+        return self.until(driver, condition, timeout)
+
+    def wait_for_network_idle(self, driver, idle_time: float = 0.5, timeout: Optional[float] = None) -> bool:
+        """Ждет загрузки документа и паузы в сетевых запросах не короче idle_time"""
+        state = {'count': -1, 'since': time.monotonic()}
+
+        def condition(d):
+            ready_state, resources = d.execute_script(NETWORK_STATE_SCRIPT)
+            now = time.monotonic()
+            if resources != state['count']:
+                state['count'], state['since'] = resources, now
+                return False
+            return ready_state == 'complete' and now - state['since'] >= idle_time
+
+        return self.until(driver, condition, timeout)
+
+    def humanize(self) -> float:
+        """Случайная пауза в пределах бюджета страницы"""
+        delay = self.budget.pause()
+        if self.record:
+            self.record.humanize_seconds += delay
+        return delay
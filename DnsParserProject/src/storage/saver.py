@@ -1,7 +1,19 @@
+import hashlib
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sqlite3
+import uuid
 from abc import abstractmethod
-from typing import List, Dict, Any
+from datetime import date, datetime
+from itertools import chain
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..core.parse_stage import SCORE_KEY
+from ..core.records import KINDS, NUMERIC_KINDS, RECORD_TYPES, parse_price
+from ..utils.config import Config
 
 
 class DataSaver:
@@ -24,73 +36,471 @@ class ExcelDataSaver(DataSaver):
 
 
 class SQLDataSaver(DataSaver):
+    """Сохранение в SQLite: типизированные столбцы и пакетная вставка в одной транзакции"""
+
+    DEFAULT_PATH = 'db.sqlite3'
+    CHUNK_SIZE = 10000
+    # Ссылок в одном запросе известных товаров (ограничение SQLite на число параметров - 999 в старых версиях)
+    KEY_LOOKUP_CHUNK = 500
+    # Режим upsert: ключ товара, цена и служебные столбцы
+    KEY_COLUMN = 'Ссылка'
+    PRICE_COLUMN = 'Цена'
+    HASH_COLUMN = 'content_hash'
+    UPDATED_COLUMN = 'updated_at'
+    PRICE_HISTORY_TABLE = 'price_history'
+    _key_prefixes: Dict[tuple, bytes] = {}
+    # Пустые значения парсеров: в числовых столбцах хранятся как NULL
+    MISSING_VALUES = ('', 'N/A')
+    PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -65536,
+    }
+
     @classmethod
-    def save_data(cls, params_dict, table_name):
-        if not params_dict:
-            print(f"Нет данных для сохранения в таблицу {table_name}")
-            return
+    def database_path(cls) -> str:
+        """Путь к базе из database.path в settings.yaml"""
+        try:
+            settings = Config.load_settings()
+        except OSError:
+            settings = {}
+        return (settings.get('database') or {}).get('path') or cls.DEFAULT_PATH
 
-        conn = sqlite3.connect(r'C:\Users\user\PycharmProjects\ComplectPC\ComplectPC\db.sqlite3', uri=True)
-        cursor = conn.cursor()
+    @classmethod
+    def database_mode(cls) -> str:
+        """Режим записи из database.mode в settings.yaml: append или upsert"""
+        try:
+            settings = Config.load_settings()
+        except OSError:
+            settings = {}
+        return (settings.get('database') or {}).get('mode') or 'append'
 
-        # Получаем все уникальные ключи из всех словарей
-        all_keys = set()
-        for d in params_dict:
-            if d:
-                all_keys.update(d.keys())
+    @classmethod
+    def connect(cls, db_path=None) -> sqlite3.Connection:
+        """Соединение с базой и настройками для массовой записи"""
+        conn = sqlite3.connect(db_path or cls.database_path())
+        for name, value in cls.PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
 
-        if not all_keys:
-            print("Нет валидных ключей для создания таблицы")
-            return
+    @classmethod
+    def infer_schema(cls, columns: Dict[str, List[Any]]) -> Dict[str, str]:
+        """Тип SQLite для каждого столбца по значениям парсера: INTEGER, REAL или TEXT.
+        Целые числа в строках (цена, CL, число секций) тоже считаются числами,
+        а строки вида '4.0' (версия PCIe) остаются текстом"""
+        schema = {}
+        for column, values in columns.items():
+            kinds = set()
+            for value in set(values):
+                if cls._is_missing(value) or value in cls.MISSING_VALUES:
+                    continue
+                kinds.add(cls._kind(value))
+                if 'TEXT' in kinds:
+                    break
+            if kinds == {'INTEGER'}:
+                schema[column] = 'INTEGER'
+            elif kinds and kinds <= {'INTEGER', 'REAL'}:
+                schema[column] = 'REAL'
+            else:
+                schema[column] = 'TEXT'
+        return schema
 
-        columns = list(all_keys)
-        safe_table_name = f'"{table_name}"'
-        safe_columns = [f'"{col}" TEXT' for col in columns]
+    @classmethod
+    def save_data(cls, params_dict, table_name, db_path=None, chunk_size=None, mode=None,
+                  raise_errors=False) -> int:
+        """Сохраняет список словарей в таблицу; возвращает число записанных строк.
+        В режиме upsert записываются только новые и изменившиеся товары (см. upsert_data).
+        raise_errors - передать ошибку SQLite вызывающему (потоковая запись), а не только напечатать"""
+        if (mode or cls.database_mode()) == 'upsert':
+            stats = cls.upsert_data(params_dict, table_name, db_path, chunk_size, raise_errors=raise_errors)
+            return stats['inserted'] + stats['updated']
 
-        # Создаем таблицу
-        create_query = f"""
-            CREATE TABLE IF NOT EXISTS {safe_table_name} (
-                {', '.join(safe_columns)}
-            )
-        """
+        rows = [d for d in params_dict or [] if d]
+        if not rows:
+            print(f"Нет данных для сохранения в таблицу {table_name}")
+            return 0
 
+        names, schema, values = cls._prepare(rows)
+        conn = cls.connect(db_path)
         try:
-            cursor.execute(create_query)
+            with conn:
+                cls._ensure_table(conn, table_name, schema)
+                cls._insert(conn, table_name, names, values, chunk_size)
+            print(f"Данные успешно сохранены в таблицу {table_name}: {len(values)} строк")
+            return len(values)
 
-            # Вставляем данные
-            for d in params_dict:
-                if not d:
-                    continue
+        except sqlite3.Error as e:
+            print(f"Ошибка SQLite при работе с таблицей {table_name}: {e}")
+            if raise_errors:
+                raise
+            return 0
+        finally:
+            conn.close()
 
-                placeholders = ', '.join(['?'] * len(columns))
-                values = [str(d.get(col, '')) for col in columns]
-                insert_query = f"""
-                    INSERT INTO {safe_table_name} ({', '.join(f'"{col}"' for col in columns)})
-                    VALUES ({placeholders})
-                """
-                cursor.execute(insert_query, values)
+    @classmethod
+    def upsert_data(cls, params_dict, table_name, db_path=None, chunk_size=None,
+                    raise_errors=False) -> Dict[str, int]:
+        """Инкрементальная запись по ключу-ссылке товара.
+
+        Для каждой строки считается хэш содержимого; строки с уже известным хэшем не пишутся,
+        новые вставляются, изменившиеся обновляются на месте. Изменения цены (и первая цена
+        нового товара) добавляются в таблицу price_history. Возвращает счетчики
+        inserted, updated, unchanged, skipped (строки без ссылки) и price_changes"""
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'price_changes': 0}
+
+        # Повторы ссылки внутри пакета: остается последняя версия товара
+        latest = {}
+        for row in params_dict or []:
+            if not row:
+                continue
+            if cls._is_missing(row.get(cls.KEY_COLUMN)) or row.get(cls.KEY_COLUMN) in cls.MISSING_VALUES:
+                stats['skipped'] += 1
+                continue
+            latest[row[cls.KEY_COLUMN]] = row
+        if not latest:
+            print(f"Нет данных для сохранения в таблицу {table_name}")
+            return stats
+
+        conn = cls.connect(db_path)
+        try:
+            with conn:
+                known = cls._known_rows(conn, table_name, list(latest))
+                now = datetime.now().isoformat(timespec='seconds')
+                rows, history = [], []
+                for href, row in latest.items():
+                    content_hash = cls.content_hash(row)
+                    previous = known.get(href)
+                    if previous is not None and previous[0] == content_hash:
+                        stats['unchanged'] += 1
+                        continue
+                    stats['inserted' if previous is None else 'updated'] += 1
+                    rows.append({**row, cls.HASH_COLUMN: content_hash, cls.UPDATED_COLUMN: now})
+                    price = row.get(cls.PRICE_COLUMN)
+                    if previous is None or cls._price_key(previous[1]) != cls._price_key(price):
+                        history.append((table_name, href, price, now))
+
+                if rows:
+                    names, schema, values = cls._prepare(rows)
+                    cls._ensure_table(conn, table_name, schema)
+                    cls._ensure_key(conn, table_name)
+                    cls._insert(conn, table_name, names, values, chunk_size, upsert=True)
+                history = [item for item in history if cls._price_key(item[2]) is not None]
+                if history:
+                    cls._record_prices(conn, history)
+                stats['price_changes'] = len(history)
 
-            conn.commit()
-            print(f"Данные успешно сохранены в таблицу {table_name}")
+            print(f"Таблица {table_name}: новых {stats['inserted']}, изменено {stats['updated']}, "
+                  f"без изменений {stats['unchanged']}, изменений цены {stats['price_changes']}")
+            return stats
 
         except sqlite3.Error as e:
             print(f"Ошибка SQLite при работе с таблицей {table_name}: {e}")
-            conn.rollback()
+            if raise_errors:
+                raise
+            return stats
         finally:
             conn.close()
 
     @classmethod
-    def clear_database(cls, db_file):
-        """Удаляет все данные из всех таблиц, сохраняя структуру"""
-        conn = sqlite3.connect(db_file)
+    def content_hash(cls, row: Dict) -> str:
+        """Хэш содержимого товара. Парсеры всегда отдают поля в одном порядке, поэтому
+        хэшируются набор ключей (его байты кэшируются) и представление значений"""
+        keys = tuple(row)
+        prefix = cls._key_prefixes.get(keys)
+        if prefix is None:
+            prefix = cls._key_prefixes[keys] = '\x1f'.join(map(str, keys)).encode('utf-8')
+        digest = hashlib.blake2b(prefix, digest_size=16)
+        digest.update(repr(tuple(row.values())).encode('utf-8'))
+        return digest.hexdigest()
+
+    @classmethod
+    def _prepare(cls, rows: List[Dict]) -> Tuple[List[str], Dict[str, str], List[tuple]]:
+        """Имена столбцов (в порядке первого появления ключей), их типы и строки для вставки"""
+        names = list(dict.fromkeys(chain.from_iterable(rows)))
+        columns = {name: [row.get(name) for row in rows] for name in names}
+        schema = cls.infer_schema(columns)
+        values = list(zip(*(cls._column_values(columns[name], schema[name]) for name in names)))
+        return names, schema, values
+
+    @classmethod
+    def _insert(cls, conn, table_name, names, values, chunk_size=None, upsert=False):
+        insert_query = (f"INSERT INTO {cls._quote(table_name)} ({', '.join(cls._quote(name) for name in names)}) "
+                        f"VALUES ({', '.join(['?'] * len(names))})")
+        if upsert:
+            updates = ', '.join(f"{cls._quote(name)} = excluded.{cls._quote(name)}"
+                                for name in names if name != cls.KEY_COLUMN)
+            insert_query += f" ON CONFLICT({cls._quote(cls.KEY_COLUMN)}) DO UPDATE SET {updates}"
+
+        chunk_size = chunk_size or cls.CHUNK_SIZE
+        for start in range(0, len(values), chunk_size):
+            conn.executemany(insert_query, values[start:start + chunk_size])
+
+    @classmethod
+    def _known_rows(cls, conn, table_name, hrefs: List[Any]) -> Dict[Any, Tuple[str, Any]]:
+        """{ссылка: (хэш, цена)} для уже сохраненных товаров из пакета hrefs.
+        Запрашиваются только ссылки пакета, частями по KEY_LOOKUP_CHUNK: стоимость записи пакета
+        не зависит от размера таблицы (поиск идет по уникальному индексу ссылки)"""
+        safe_table_name = cls._quote(table_name)
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({safe_table_name})")}
+        if cls.KEY_COLUMN not in existing:
+            return {}
+        # Таблица из режима append получает индекс до поиска, а не после первой записи
+        cls._ensure_key(conn, table_name)
+        content_hash = cls._quote(cls.HASH_COLUMN) if cls.HASH_COLUMN in existing else 'NULL'
+        price = cls._quote(cls.PRICE_COLUMN) if cls.PRICE_COLUMN in existing else 'NULL'
+        key = cls._quote(cls.KEY_COLUMN)
+        known = {}
+        for start in range(0, len(hrefs), cls.KEY_LOOKUP_CHUNK):
+            chunk = hrefs[start:start + cls.KEY_LOOKUP_CHUNK]
+            query = (f"SELECT {key}, {content_hash}, {price} FROM {safe_table_name} "
+                     f"WHERE {key} IN ({', '.join(['?'] * len(chunk))})")
+            known.update((href, (row_hash, row_price)) for href, row_hash, row_price in conn.execute(query, chunk))
+        return known
+
+    @classmethod
+    def _ensure_key(cls, conn, table_name):
+        """Уникальный индекс по ссылке; повторы, накопленные режимом append, удаляются
+        (остается последняя добавленная строка)"""
+        index_name = cls._quote(f"{table_name}_{cls.KEY_COLUMN}_key")
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name=?",
+                        (f"{table_name}_{cls.KEY_COLUMN}_key",)).fetchone():
+            return
+        safe_table_name, key = cls._quote(table_name), cls._quote(cls.KEY_COLUMN)
+        conn.execute(f"DELETE FROM {safe_table_name} WHERE rowid NOT IN "
+                     f"(SELECT MAX(rowid) FROM {safe_table_name} GROUP BY {key})")
+        conn.execute(f"CREATE UNIQUE INDEX {index_name} ON {safe_table_name} ({key})")
+
+    @classmethod
+    def _record_prices(cls, conn, history: List[tuple]):
+        safe_table_name = cls._quote(cls.PRICE_HISTORY_TABLE)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {safe_table_name} "
+                     f"(component TEXT NOT NULL, href TEXT NOT NULL, price INTEGER, changed_at TEXT NOT NULL)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {cls._quote(cls.PRICE_HISTORY_TABLE + '_href')} "
+                     f"ON {safe_table_name} (href, changed_at)")
+        conn.executemany(f"INSERT INTO {safe_table_name} VALUES (?, ?, ?, ?)",
+                         [(component, href, cls._price_key(price), changed_at)
+                          for component, href, price, changed_at in history])
+
+    @classmethod
+    def _price_key(cls, value):
+        """Цена числом для сравнения: '12 999' и 12999 - одна и та же цена"""
+        if cls._is_missing(value) or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float, np.number)):
+            return int(value)
+        digits = ''.join(ch for ch in str(value) if ch.isdigit())
+        return int(digits) if digits else None
+
+    @classmethod
+    def _ensure_table(cls, conn, table_name, schema: Dict[str, str]):
+        """Создает таблицу или добавляет недостающие столбцы в уже существующую"""
+        safe_table_name = cls._quote(table_name)
+        columns = ', '.join(f"{cls._quote(col)} {col_type}" for col, col_type in schema.items())
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {safe_table_name} ({columns})")
+
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({safe_table_name})")}
+        for col, col_type in schema.items():
+            if col not in existing:
+                conn.execute(f"ALTER TABLE {safe_table_name} ADD COLUMN {cls._quote(col)} {col_type}")
+
+    @classmethod
+    def _column_values(cls, values: List[Any], col_type: str) -> List[Any]:
+        # Текстовые столбцы из одних строк передаются как есть, остальные
+        # преобразования считаются один раз на каждое различное значение
+        if col_type == 'TEXT' and set(map(type, values)) <= {str}:
+            return values
+        convert = {'INTEGER': int, 'REAL': float}.get(col_type, str)
+        converted = {}
+        for value in set(values):
+            missing = cls._is_missing(value) or (convert is not str and value in cls.MISSING_VALUES)
+            converted[value] = None if missing else convert(value)
+        return list(map(converted.__getitem__, values))
+
+    @staticmethod
+    def _kind(value) -> str:
+        if isinstance(value, str):
+            return 'INTEGER' if value.strip().lstrip('+-').isdigit() else 'TEXT'
+        if isinstance(value, (bool, np.bool_)):
+            return 'TEXT'
+        if isinstance(value, (int, np.integer)):
+            return 'INTEGER'
+        if isinstance(value, (float, np.floating)):
+            return 'REAL'
+        return 'TEXT'
+
+    @staticmethod
+    def _is_missing(value) -> bool:
+        return value is None or (isinstance(value, float) and np.isnan(value))
+
+    @staticmethod
+    def _quote(name) -> str:
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @classmethod
+    def clear_database(cls, db_file=None, vacuum=True):
+        """Удаляет все данные из всех таблиц, сохраняя структуру.
+        Для регулярных запусков достаточно режима upsert: очистка и VACUUM не нужны"""
+        conn = cls.connect(db_file)
         cursor = conn.cursor()
 
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = [table[0] for table in cursor.fetchall()]
 
         for table in tables:
-            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(f"DELETE FROM {cls._quote(table)}")
 
-        cursor.execute("VACUUM")
         conn.commit()
-        conn.close()
\ No newline at end of file
+        if vacuum:
+            cursor.execute("VACUUM")
+        conn.close()
+
+
+class ParquetChunkWriter:
+    """Запись одного компонента в файл Parquet по частям: каждый пакет - отдельная группа строк.
+    Схема известного компонента берется из его записи (records.SCHEMA), поэтому не зависит
+    от того, какие поля оказались пустыми в первом пакете: числовые поля хранятся числами
+    (и '220 Вт' - как 220), отсутствующие значения - null. Столбцы вне схемы записи
+    типизируются по первому пакету; непреобразуемые значения записываются как null"""
+
+    ARROW_TYPES = {'INTEGER': pa.int64(), 'REAL': pa.float64(), 'TEXT': pa.string()}
+    KIND_TYPES = {'price': 'INTEGER', 'int': 'INTEGER', 'int_text': 'INTEGER', 'int_unit': 'INTEGER',
+                  'float': 'REAL', 'float_unit': 'REAL', 'text': 'TEXT'}
+
+    def __init__(self, path, compression: str = 'zstd', component: Optional[str] = None):
+        self.path = Path(path)
+        self.compression = compression
+        self.rows = 0
+        self.coerced = 0
+        record = RECORD_TYPES.get(component)
+        # Вид поля записи по ключу словаря парсера: по нему выбираются тип столбца и разбор значения
+        self._kinds: Dict[str, str] = {key: kind for _, key, kind in record.fields()} if record else {}
+        if record:
+            # Оценка компонента (parse_score) - не поле записи, но всегда число
+            self._kinds[SCORE_KEY] = 'float'
+        self._schema: Optional[Dict[str, str]] = None
+        self._writer = None
+
+    def write(self, rows: List[Dict]):
+        rows = [row for row in rows if row]
+        if not rows:
+            return
+        names = list(dict.fromkeys(chain.from_iterable(rows)))
+        columns = ParquetDataSaver.normalize_columns({name: [row.get(name) for row in rows] for name in names})
+
+        if self._schema is None:
+            self._schema = {key: self.KIND_TYPES[kind] for key, kind in self._kinds.items()}
+            extra = {name: values for name, values in columns.items() if name not in self._kinds}
+            self._schema.update(ParquetDataSaver.column_types(extra))
+            arrow_schema = pa.schema([(name, self.ARROW_TYPES[col_type]) for name, col_type in self._schema.items()])
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, arrow_schema, compression=self.compression)
+        elif set(names) - set(self._schema):
+            print(f"⚠️  {self.path.name}: столбцы {sorted(set(names) - set(self._schema))} "
+                  f"отсутствуют в схеме файла и пропущены")
+
+        arrays = [pa.array(self._convert(columns.get(name, [None] * len(rows)), col_type, self._kinds.get(name)),
+                           type=self.ARROW_TYPES[col_type])
+                  for name, col_type in self._schema.items()]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._writer.schema))
+        self.rows += len(rows)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self.coerced:
+            print(f"⚠️  {self.path.name}: {self.coerced} значений не приведены к типу столбца")
+
+    def _convert(self, values: List[Any], col_type: str, kind: Optional[str] = None) -> List[Any]:
+        if kind is not None:
+            # Поле записи: разбор как в records (цена из текста, число из '220 Вт', 'N/A' -> null)
+            parse = parse_price if kind == 'price' else KINDS[kind][0]
+            converted = {}
+            for value in set(values):
+                converted[value] = parse(value)
+                if converted[value] is None and kind in NUMERIC_KINDS + ('price',) \
+                        and not SQLDataSaver._is_missing(value) and value not in SQLDataSaver.MISSING_VALUES:
+                    self.coerced += values.count(value)
+            return list(map(converted.__getitem__, values))
+
+        convert = {'INTEGER': int, 'REAL': float}.get(col_type, str)
+        converted = {}
+        for value in set(values):
+            if SQLDataSaver._is_missing(value) or (convert is not str and value in SQLDataSaver.MISSING_VALUES):
+                converted[value] = None
+                continue
+            try:
+                converted[value] = convert(value)
+            except (TypeError, ValueError):
+                converted[value] = None
+                self.coerced += values.count(value)
+        return list(map(converted.__getitem__, values))
+
+
+class ParquetDataSaver(DataSaver):
+    """Колоночное хранение каталогов: Parquet с разбиением по компоненту и дате обхода
+    (<каталог>/component=<компонент>/crawl_date=<ГГГГ-ММ-ДД>/part-*.parquet).
+    Числовые характеристики хранятся числами, цена - целым числом рублей"""
+
+    DEFAULT_DIRECTORY = 'data/catalog'
+    PRICE_COLUMN = 'Цена'
+
+    @classmethod
+    def normalize_columns(cls, columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """Цена из текста карточки ('12 999 ₽') переводится в целое число рублей"""
+        if cls.PRICE_COLUMN in columns:
+            columns[cls.PRICE_COLUMN] = [SQLDataSaver._price_key(price) for price in columns[cls.PRICE_COLUMN]]
+        return columns
+
+    @classmethod
+    def column_types(cls, columns: Dict[str, List[Any]]) -> Dict[str, str]:
+        """Типы столбцов как в SQLDataSaver.infer_schema; цена всегда целая"""
+        schema = SQLDataSaver.infer_schema(columns)
+        if cls.PRICE_COLUMN in schema:
+            schema[cls.PRICE_COLUMN] = 'INTEGER'
+        return schema
+
+    @classmethod
+    def partition_path(cls, component: str, directory=None, crawl_date=None) -> Path:
+        crawl_date = crawl_date or date.today()
+        if not isinstance(crawl_date, str):
+            crawl_date = crawl_date.isoformat()
+        return Path(directory or cls.DEFAULT_DIRECTORY) / f"component={component}" / f"crawl_date={crawl_date}"
+
+    @classmethod
+    def open_writer(cls, component: str, directory=None, crawl_date=None) -> ParquetChunkWriter:
+        """Потоковая запись нового файла раздела; пакеты передаются через write"""
+        path = cls.partition_path(component, directory, crawl_date) / f"part-{uuid.uuid4().hex}.parquet"
+        return ParquetChunkWriter(path, component=component)
+
+    @classmethod
+    def save_data(cls, params_dict, file_name, directory=None, crawl_date=None,
+                  chunk_size: int = 50000) -> Optional[Path]:
+        """Сохраняет товары компонента file_name в его раздел; возвращает путь к файлу"""
+        rows = [d for d in params_dict or [] if d]
+        if not rows:
+            print(f"Нет данных для сохранения в {file_name}")
+            return None
+
+        writer = cls.open_writer(file_name, directory, crawl_date)
+        try:
+            for start in range(0, len(rows), chunk_size):
+                writer.write(rows[start:start + chunk_size])
+        finally:
+            writer.close()
+        print(f"Данные успешно сохранены в {writer.path}: {writer.rows} строк")
+        return writer.path
+
+    @classmethod
+    def load(cls, component: Optional[str] = None, directory=None, crawl_date=None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Читает каталог с отображением файлов в память и фильтром по компоненту и дате"""
+        filters = []
+        if component is not None:
+            filters.append(('component', '=', component))
+        if crawl_date is not None:
+            filters.append(('crawl_date', '=', crawl_date if isinstance(crawl_date, str) else crawl_date.isoformat()))
+        table = pq.read_table(str(directory or cls.DEFAULT_DIRECTORY), columns=columns,
+                              filters=filters or None, memory_map=True, partitioning='hive')
+        return table.to_pandas()
@@ -0,0 +1,227 @@
+import csv
+import queue
+import threading
+import time
+from abc import abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .saver import ParquetDataSaver, SQLDataSaver
+
+
+class DataSink:
+    """Получатель готовых строк: пишет пакет товаров одного компонента"""
+
+    @abstractmethod
+    def write(self, component: str, rows: List[Dict]):
+        pass
+
+    def close(self):
+        pass
+
+
+class SQLiteSink(DataSink):
+    """Запись пакетов в SQLite через SQLDataSaver: таблица на компонент"""
+
+    def __init__(self, db_path: Optional[str] = None, mode: Optional[str] = None):
+        self.db_path = db_path
+        self.mode = mode
+
+    def write(self, component: str, rows: List[Dict]):
+        # Ошибка пакета передается StreamingWriter: потерянный пакет останавливает запись
+        SQLDataSaver.save_data(rows, component, self.db_path, mode=self.mode, raise_errors=True)
+
+
+class CSVSink(DataSink):
+    """Дописывание пакетов в <каталог>/<компонент>.csv.
+    Набор столбцов берется из первого пакета компонента: парсер всегда отдает одни и те же поля"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._files = {}
+
+    def write(self, component: str, rows: List[Dict]):
+        if component not in self._files:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{component}.csv"
+            exists = path.exists() and path.stat().st_size > 0
+            file = open(path, 'a', newline='', encoding='utf-8')
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+            if not exists:
+                writer.writeheader()
+            self._files[component] = (file, writer)
+
+        file, writer = self._files[component]
+        writer.writerows(rows)
+        file.flush()
+
+    def close(self):
+        for file, _ in self._files.values():
+            file.close()
+        self._files.clear()
+
+
+class ParquetSink(DataSink):
+    """Запись пакетов в разделы Parquet (ParquetDataSaver): один файл на компонент за обход,
+    каждый пакет - группа строк"""
+
+    def __init__(self, directory: Optional[str] = None, crawl_date=None):
+        self.directory = directory
+        self.crawl_date = crawl_date
+        self._writers = {}
+
+    def write(self, component: str, rows: List[Dict]):
+        if component not in self._writers:
+            self._writers[component] = ParquetDataSaver.open_writer(component, self.directory, self.crawl_date)
+        self._writers[component].write(rows)
+
+    def close(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+SINKS = {
+    'sqlite': SQLiteSink,
+    'csv': CSVSink,
+    'parquet': ParquetSink,
+}
+
+
+class StreamingWriter:
+    """Потоковая запись результатов по мере готовности страниц.
+
+    Потоки парсинга кладут товары страницы в ограниченную очередь, единственный поток записи
+    собирает их в пакеты по компонентам и передает получателю. Когда запись не успевает,
+    очередь заполняется и put блокирует парсеры (обратное давление), а не копит данные в памяти.
+    Страницы, переданные с page, после записи их пакета передаются в on_written(component, pages),
+    где pages - список (page, rows): так журнал отмечает только действительно записанные страницы"""
+
+    def __init__(self, sink: DataSink, max_queue: int = 64, batch_rows: int = 5000, flush_interval: float = 5.0):
+        self.sink = sink
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval
+        self.error = None
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._pages: Dict[str, List] = {}
+        self._on_written: Optional[Callable] = None
+        self._thread = None
+        self._metrics = {'pages': 0, 'rows': 0, 'batches': 0, 'blocked': 0, 'blocked_time': 0.0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> Optional['StreamingWriter']:
+        """Создает запись по настройкам ScraperConfig; None, если получатель не задан"""
+        if not config.sink:
+            return None
+        if config.sink not in SINKS:
+            raise ValueError(f"Неизвестный получатель данных: {config.sink}")
+        sink = SINKS[config.sink](config.sink_path) if config.sink_path else SINKS[config.sink]()
+        return cls(sink, max_queue=config.sink_queue_size, batch_rows=config.sink_batch_rows)
+
+    def start(self, on_written: Optional[Callable] = None):
+        self._on_written = on_written
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='streaming-writer', daemon=True)
+            self._thread.start()
+        return self
+
+    def put(self, component: str, rows: List[Dict], page=None):
+        """Передает товары страницы на запись; блокирует, пока в очереди нет места.
+        page (например, URL) возвращается в on_written после записи пакета, даже без товаров"""
+        if not rows and page is None:
+            return
+        if self.error is not None:
+            raise RuntimeError(f"Поток записи остановлен с ошибкой: {self.error}")
+
+        item = (component, rows, page)
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        started = time.monotonic()
+        while True:
+            try:
+                self._queue.put(item, timeout=1.0)
+                break
+            except queue.Full:
+                if self.error is not None:
+                    raise RuntimeError(f"Поток записи остановлен с ошибкой: {self.error}")
+        with self._lock:
+            self._metrics['blocked'] += 1
+            self._metrics['blocked_time'] += time.monotonic() - started
+
+    def close(self):
+        """Дожидается записи всех переданных страниц и закрывает получателя.
+        Если пакет не записался, ошибка передается вызывающему"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self.sink.close()
+        if self.error is not None:
+            print(f"❌ Потоковая запись завершилась с ошибкой: {self.error}")
+            raise RuntimeError(f"Потоковая запись завершилась с ошибкой: {self.error}") from self.error
+
+    def stats(self) -> Dict:
+        with self._lock:
+            metrics = dict(self._metrics)
+        metrics['blocked_time'] = round(metrics['blocked_time'], 2)
+        return metrics
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                self._flush_all()
+                return
+
+            if item:
+                component, rows, page = item
+                buffer = self._buffers.setdefault(component, [])
+                buffer.extend(rows)
+                if page is not None:
+                    self._pages.setdefault(component, []).append((page, rows))
+                with self._lock:
+                    self._metrics['pages'] += 1
+                if len(buffer) >= self.batch_rows:
+                    self._flush(component)
+
+            if time.monotonic() >= deadline:
+                self._flush_all()
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush_all(self):
+        for component in list(self._buffers):
+            self._flush(component)
+
+    def _flush(self, component: str):
+        rows = self._buffers.pop(component, None)
+        pages = self._pages.pop(component, None)
+        if self.error is not None:
+            return
+        if rows:
+            try:
+                self.sink.write(component, rows)
+            except Exception as e:
+                # Запись остановлена: очередь дальше только вычитывается,
+                # а следующие put сообщают об ошибке вместо ожидания
+                self.error = e
+                return
+            with self._lock:
+                self._metrics['rows'] += len(rows)
+                self._metrics['batches'] += 1
+        if pages and self._on_written is not None:
+            try:
+                self._on_written(component, pages)
+            except Exception as e:
+                print(f"⚠️  Не удалось отметить записанные страницы {component}: {e}")
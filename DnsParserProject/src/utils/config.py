@@ -1,13 +1,65 @@
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Optional
+
+import yaml
+
+SETTINGS_PATH = Path(__file__).resolve().parents[2] / 'config' / 'settings.yaml'
 
 
 @dataclass
 class ScraperConfig:
     max_workers: int = 3
+    max_concurrency: int = 8
     requests_per_minute: int = 30
     use_threading: bool = True
     save_to_excel: bool = False
+    browser_pool_size: int = 3
+    max_pages_per_browser: int = 50
+    max_browser_memory_mb: int = 2048
+    extraction_mode: str = 'script'
+    fetch_backend: str = 'selenium'
+    max_page_retries: int = 2
+    proxy_requests_per_minute: int = 20
+    rate_burst: int = 3
+    rate_backoff_factor: float = 0.5
+    min_requests_per_minute: int = 2
+    proxy_check_ttl: int = 300
+    proxy_check_timeout: int = 10
+    wait_timeout: int = 15
+    humanization_budget: float = 3.0
+    parse_cache_size: int = 50000
+    parse_cache_path: Optional[str] = None
+    sink: Optional[str] = None
+    sink_path: Optional[str] = None
+    sink_queue_size: int = 64
+    sink_batch_rows: int = 5000
+    keep_results: bool = True
+    journal_path: Optional[str] = None
+    resume: bool = False
+    page_count_path: Optional[str] = None
+    page_count_ttl: int = 86400
+    lazy_pages: bool = True
+    crawl_mode: str = 'pages'
+    dedup_bloom_path: Optional[str] = None
+    dedup_expected_items: int = 1000000
+    dedup_error_rate: float = 0.001
+    parse_processes: int = 0
+    parse_chunk_size: int = 200
+    parse_score: bool = False
+    queue_backend: str = 'sqlite'
+    queue_path: str = 'data/crawl_queue.sqlite3'
+    queue_lease_seconds: int = 300
+    queue_crawl_timeout: int = 0
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Dict] = None) -> 'ScraperConfig':
+        """Создает конфигурацию из секции scraper файла settings.yaml"""
+        if settings is None:
+            settings = Config.load_settings()
+        section = settings.get('scraper') or {}
+        known = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in section.items() if key in known})
 
 
 class Config:
@@ -22,6 +74,12 @@ class Config:
 
     PROXIES = [0, 1, 2, 3, 4, 5, 6, 7]
 
+    @classmethod
+    def load_settings(cls, path=None) -> Dict:
+        """Читает settings.yaml"""
+        with open(path or SETTINGS_PATH, encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+
     @classmethod
     def get_components(cls):
         return list(cls.URLS.keys())
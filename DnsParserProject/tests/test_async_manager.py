@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.async_manager import AsyncScraper
+from src.core.fetchers import FetchBackend
+from src.core.parse_stage import ParseStage
+from src.core.rate_limiter import RateLimiter
+from src.core.scout import TaskDistributor
+
+BASE_URL = 'https://www.dns-shop.ru/catalog/ram/'
+
+
+class TimedFetcher(FetchBackend):
+    """Движок, замеряющий паузы ограничителя внутри потоков пула"""
+
+    def __init__(self, rate_limiter):
+        self.rate_limiter = rate_limiter
+        self.sleeping = 0.0
+
+    def fetch_page(self, url):
+        started = time.monotonic()
+        self.throttle(url)
+        self.sleeping += time.monotonic() - started
+        number = TaskDistributor.page_number(url)
+        return [[f'n{number}'], ['1'], [f'https://www.dns-shop.ru/product/{number:08x}/']]
+
+
+class OfflineAsyncScraper(AsyncScraper):
+    def _start_session(self, components_urls, proxies):
+        self.fetcher = TimedFetcher(self.rate_limiter)
+
+    def _stop_session(self):
+        pass
+
+    def discover_pages(self, component, base_url):
+        return 4
+
+    def parse_page_data(self, component, data):
+        return [{'Название': name, 'Ссылка': link} for name, link in zip(data[0], data[2])]
+
+
+def test_host_limit_waits_outside_worker_threads():
+    limiter = RateLimiter(requests_per_minute=600, burst=1)
+    scraper = OfflineAsyncScraper(max_concurrency=2, rate_limiter=limiter, max_retries=0)
+
+    started = time.monotonic()
+    results = asyncio.run(scraper.scrape_all({'ram': BASE_URL}))
+
+    assert len(results['ram']) == 4
+    # Три паузы по 0.1 с выдержаны в цикле событий, потоки пула не спали
+    assert time.monotonic() - started >= 0.25
+    assert scraper.fetcher.sleeping < 0.05
+    assert limiter.metrics()['requests'] == 4
+
+
+def test_reserve_without_host_charges_only_proxy():
+    limiter = RateLimiter(requests_per_minute=1, proxy_requests_per_minute=600, burst=1)
+    limiter.reserve(BASE_URL)
+
+    assert limiter.reserve(BASE_URL, 'proxy:1', host=False) < 0.01
+    assert limiter.reserve(BASE_URL, host=False) == 0.0
+    assert limiter.reserve(BASE_URL) > 0
+
+
+def test_parse_stage_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncScraper(parse_stage=ParseStage(processes=1))
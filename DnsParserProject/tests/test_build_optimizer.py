@@ -0,0 +1,181 @@
+import itertools
+import random
+
+import pytest
+
+from src.core.build_optimizer import BUILD_COMPONENTS, BuildOptimizer, leading_number
+from src.core.compatibility import ATTRIBUTES
+from src.core.models import ComponentScorer
+
+PLATFORMS = [('LGA 1700', 'Intel B760', 'DDR4'), ('LGA 1700', 'Intel Z790', 'DDR5'),
+             ('N/A', 'AMD B550', 'DDR4'), ('N/A', 'AMD B650', 'DDR5')]
+
+
+def make_catalogs(rng, cpus=6, boards=6, rams=6, gpus=5, coolers=5, liquid=3):
+    price = lambda low, high: f'{rng.randint(low, high) * 100} ₽'
+    return {
+        'cpu': [{'Название': f'CPU {i}', 'Цена': price(50, 600), 'Ссылка': f'/cpu/{i}/',
+                 'Сокет': rng.choice(['LGA 1700', 'AM4', 'AM5']), 'Количество ядер': rng.choice([4, 6, 8, 16]),
+                 'Частота (ГГц)': rng.choice([2.5, 3.5, 4.2]), 'Кэш L2 (МБ)': rng.choice([1.0, 3.0, 7.5]),
+                 'Кэш L3 (МБ)': rng.choice([8.0, 32.0]), 'Количество каналов памяти': 2,
+                 'Графика': rng.choice(['Нет', 'Intel UHD Graphics 730']), 'TDP (Вт)': rng.choice([65, 125, 170])}
+                for i in range(cpus)],
+        'motherboard': [dict(zip(('Сокет', 'Чипсет', 'Тип слотов памяти'), rng.choice(PLATFORMS)),
+                             **{'Название': f'Board {i}', 'Цена': price(60, 400), 'Ссылка': f'/mb/{i}/',
+                                'Количество слотов памяти': rng.choice([2, 4]),
+                                'Частота слотов памяти': rng.choice(['3200 МГц', '6400 МГц']),
+                                'Форм-фактор': rng.choice(['ATX', 'Micro-ATX']),
+                                'Количество слотов PCI-E': rng.choice([1, 2, 3]), 'Версия слотов PCI-E': 'x16'})
+                        for i in range(boards)],
+        'ram': [{'Название': f'RAM {i}', 'Цена': price(20, 300), 'Ссылка': f'/ram/{i}/',
+                 'Общий объем (ГБ)': rng.choice([8.0, 16.0, 32.0]), 'Тип памяти': rng.choice(['DDR4', 'DDR5']),
+                 'Размер модуля (ГБ)': 8.0, 'Количество модулей': rng.choice([1, 2]),
+                 'Частота (МГц)': rng.choice([3200, 3600, 6000]), 'Тайминги': '16-18-18-36',
+                 'Латентность (CL)': rng.choice(['16', '30'])} for i in range(rams)],
+        'gpu': [{'Название': f'GPU {i}', 'Цена': price(100, 2000), 'Ссылка': f'/gpu/{i}/',
+                 'Объем памяти (ГБ)': rng.choice([4.0, 8.0, 12.0, 16.0]), 'Тип памяти': rng.choice(['GDDR6', 'GDDR6X']),
+                 'Шина памяти (бит)': rng.choice([128, 192, 256]), 'Частота GPU (МГц)': rng.randint(1200, 2600),
+                 'Версия PCIe': rng.choice(['3.0', '4.0']), 'Разъемы': 'HDMI, DisplayPort'} for i in range(gpus)],
+        'cpu_cooler': [{'Название': f'Cooler {i}', 'Цена': price(10, 150), 'Ссылка': f'/cooler/{i}/',
+                        'Материал основания': 'Медь', 'Скорость вращения': f'{rng.randint(1200, 2500)} об/мин',
+                        'Уровень шума': f'{rng.randint(20, 40)} дБ', 'Разъем питания': '4 pin',
+                        'Макс. TDP': rng.choice(['95 Вт', '150 Вт', '220 Вт']), 'Размер вентилятора': '120 мм'}
+                       for i in range(coolers)],
+        'cooling_system': [{'Название': f'AIO {i}', 'Цена': price(30, 400), 'Ссылка': f'/aio/{i}/',
+                            'Размер вентилятора(ов)': '120 мм', 'Количество секций': rng.choice(['1', '2', '3']),
+                            'Количество вентиляторов': rng.choice(['1', '2', '3']), 'Питание': 'PWM',
+                            'TDP': rng.choice(['250 Вт', '300 Вт'])} for i in range(liquid)],
+    }
+
+
+def all_builds(optimizer):
+    """Все совместимые сборки полным перебором: список (сумма оценок, цена)"""
+    frames = optimizer.frames
+    columns = {component: (frames[component]['_price'].tolist(), frames[component]['_score'].tolist(),
+                           [optimizer.index.attributes(int(product_id)) for product_id in frames[component]['_id']])
+               for component in BUILD_COMPONENTS}
+    cpu_tdp, cooler_tdp = frames['cpu']['_tdp'].tolist(), frames['cooler']['_tdp'].tolist()
+
+    builds = []
+    for rows in itertools.product(*(range(len(frames[component])) for component in BUILD_COMPONENTS)):
+        parts = dict(zip(BUILD_COMPONENTS, rows))
+        cpu, board, ram = (columns[component][2][parts[component]] for component in ('cpu', 'motherboard', 'ram'))
+        if cpu.get('socket') is None or cpu.get('socket') != board.get('socket'):
+            continue
+        if ram.get('ddr') is None or ram.get('ddr') != board.get('ddr'):
+            continue
+        if cooler_tdp[parts['cooler']] < cpu_tdp[parts['cpu']]:
+            continue
+        builds.append((sum(columns[component][1][row] for component, row in parts.items()),
+                       sum(columns[component][0][row] for component, row in parts.items())))
+    return builds
+
+
+def brute_force(builds, budget, top_k):
+    """(оценка, цена) лучших top_k сборок перебора в пределах бюджета"""
+    best = sorted((build for build in builds if build[1] <= budget), key=lambda build: (-build[0], build[1]))
+    return [(round(score / len(BUILD_COMPONENTS), 2), price) for score, price in best[:top_k]]
+
+
+def summary(builds):
+    return [(build['total_score'], build['total_price']) for build in builds]
+
+
+def assert_valid(builds, budget):
+    """Сборки в бюджете, с совпадающими сокетом и типом памяти и кулером не слабее TDP процессора"""
+    for build in builds:
+        parts = build['components']
+        assert build['total_price'] <= budget
+        assert ATTRIBUTES['cpu']['socket'](parts['cpu']) == ATTRIBUTES['motherboard']['socket'](parts['motherboard'])
+        assert ATTRIBUTES['ram']['ddr'](parts['ram']) == ATTRIBUTES['motherboard']['ddr'](parts['motherboard'])
+        cooler_tdp = parts['cooler'].get('Макс. TDP') or parts['cooler']['TDP']
+        assert leading_number(cooler_tdp) >= parts['cpu']['TDP (Вт)']
+
+
+class GpuFrequencyScorer(ComponentScorer):
+    """Оценка видеокарты по частоте GPU: почти без совпадений, поэтому top_k зависит от глубоких слоев фронта"""
+
+    def score_frame(self, component, frame):
+        if component == 'gpu':
+            return frame['Частота GPU (МГц)'].to_numpy(dtype=float) / 30
+        return super().score_frame(component, frame)
+
+
+def check(catalogs, budgets, top_ks=(1, 3, 5), scorer=None):
+    optimizer = BuildOptimizer(catalogs, scorer=scorer)
+    builds = all_builds(optimizer)
+    found = 0
+    for budget in budgets:
+        for top_k in top_ks:
+            result = optimizer.best_builds(budget, top_k)
+
+            assert summary(result) == brute_force(builds, budget, top_k)
+            assert_valid(result, budget)
+            found += len(result)
+    return optimizer, found
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_best_builds_match_brute_force(seed):
+    _, found = check(make_catalogs(random.Random(seed)), budgets=(80000, 150000, 250000, 400000))
+    assert found
+
+
+def test_budget_excludes_every_build():
+    catalogs = make_catalogs(random.Random(0))
+    optimizer, _ = check(catalogs, budgets=(0, 1000))
+    cheapest = min(price for _, price in all_builds(optimizer))
+
+    assert optimizer.best_builds(cheapest - 1) == []
+    assert summary(optimizer.best_builds(cheapest, top_k=1))[0][1] == cheapest
+
+
+def test_cooler_must_handle_cpu_tdp():
+    catalogs = make_catalogs(random.Random(1), coolers=4, liquid=0)
+    for cpu in catalogs['cpu']:
+        cpu['TDP (Вт)'] = 170
+    # Дешевые кулеры лучше по оценке, но отводят только 95 Вт
+    for number, cooler in enumerate(catalogs['cpu_cooler']):
+        cooler.update({'Цена': '1000 ₽' if number else '9000 ₽', 'Макс. TDP': '95 Вт' if number else '220 Вт'})
+    optimizer, found = check(catalogs, budgets=(150000, 400000))
+
+    assert found
+    assert {build['components']['cooler']['Ссылка'] for build in optimizer.best_builds(400000)} == {'/cooler/0/'}
+
+
+def test_socket_and_memory_mismatch():
+    catalogs = make_catalogs(random.Random(2))
+    for cpu in catalogs['cpu']:
+        cpu['Сокет'] = 'AM4'
+    for board in catalogs['motherboard']:
+        board.update({'Сокет': 'N/A', 'Чипсет': 'AMD B550', 'Тип слотов памяти': 'DDR4'})
+    for ram in catalogs['ram']:
+        ram['Тип памяти'] = 'DDR5'
+    assert check(catalogs, budgets=(400000,))[1] == 0
+
+    catalogs['ram'][0]['Тип памяти'] = 'DDR4'
+    catalogs['motherboard'][0].update({'Сокет': 'LGA 1700', 'Чипсет': 'Intel B760'})
+    optimizer, found = check(catalogs, budgets=(150000, 400000))
+    assert found
+    assert {build['components']['ram']['Ссылка'] for build in optimizer.best_builds(400000)} == {'/ram/0/'}
+
+
+def test_dominated_filter_on_large_catalog(monkeypatch):
+    calls = []
+    dominated_filter = BuildOptimizer._dominated_filter
+
+    def counted(scores, top_k):
+        calls.append(scores.size)
+        return dominated_filter(scores, top_k)
+
+    monkeypatch.setattr(BuildOptimizer, '_dominated_filter', staticmethod(counted))
+    # Больше 512 видеокарт при единственной платформе: top_k сборок различаются только видеокартой,
+    # и фронт видеокарт строится с предварительным отсечением блоками
+    catalogs = make_catalogs(random.Random(3), cpus=1, boards=1, rams=1, gpus=700, coolers=1, liquid=0)
+    catalogs['cpu'][0].update({'Сокет': 'LGA 1700', 'TDP (Вт)': 65})
+    catalogs['motherboard'][0].update({'Сокет': 'LGA 1700', 'Чипсет': 'Intel B760', 'Тип слотов памяти': 'DDR4'})
+    catalogs['ram'][0]['Тип памяти'] = 'DDR4'
+    _, found = check(catalogs, budgets=(100000, 150000, 400000), top_ks=(3, 5, 20), scorer=GpuFrequencyScorer())
+    assert found
+
+    assert calls and max(calls) > 512
@@ -0,0 +1,84 @@
+import pytest
+
+from src.core.dedup import BloomFilter, Deduplicator, product_key
+from src.core.thread_manager import AdvancedThreadedScraper
+
+
+def href(number):
+    return f'https://www.dns-shop.ru/product/{number:08x}/tovar-{number}/'
+
+
+def page(*numbers):
+    return [[f'n{number}' for number in numbers], ['1'] * len(numbers), [href(number) for number in numbers]]
+
+
+def test_product_key_ignores_query_and_slug():
+    assert product_key(href(10) + '?utm=1') == product_key('https://www.dns-shop.ru/product/0000000a/other/')
+    assert product_key('/catalog/item/') == '/catalog/item'
+    assert product_key('') is None
+
+
+def test_bloom_filter_round_trip(tmp_path):
+    bloom = BloomFilter(expected_items=100, error_rate=0.01)
+    assert not bloom.add('ram:a')
+    assert bloom.add('ram:a')
+
+    bloom.save(tmp_path / 'bloom.bin')
+    loaded = BloomFilter.load(tmp_path / 'bloom.bin')
+
+    assert 'ram:a' in loaded
+    assert 'ram:b' not in loaded
+
+
+def test_check_page_reserves_keys_until_commit():
+    dedup = Deduplicator()
+    first, first_keys = dedup.check_page('ram', page(1, 2))
+    # Страница в работе: ее товары на другой странице уже повторы
+    second, second_keys = dedup.check_page('ram', page(2, 3))
+
+    assert first[2] == [href(1), href(2)]
+    assert second[2] == [href(3)]
+
+    dedup.commit('ram', first_keys)
+    dedup.commit('ram', second_keys)
+    assert dedup.check_page('ram', page(1, 2, 3))[0] == [[], [], []]
+    assert dedup.stats() == {'seen': 7, 'dropped': 4, 'dropped_known': 0}
+
+
+def test_released_page_keeps_products_on_retry():
+    dedup = Deduplicator()
+    _, keys = dedup.check_page('ram', page(1, 2))
+    dedup.release('ram', keys)
+
+    retried, _ = dedup.check_page('ram', page(1, 2))
+    assert retried[2] == [href(1), href(2)]
+
+
+def test_bloom_filter_drops_products_of_previous_crawls(tmp_path):
+    path = str(tmp_path / 'bloom.bin')
+    dedup = Deduplicator(bloom_path=path, expected_items=1000)
+    dedup.filter_page('ram', page(1, 2))
+    dedup.save()
+
+    next_crawl = Deduplicator(bloom_path=path, expected_items=1000)
+    assert next_crawl.filter_page('ram', page(1, 2, 3))[2] == [href(3)]
+    assert next_crawl.filter_page('cpu', page(1))[2] == [href(1)]
+    assert next_crawl.stats()['dropped_known'] == 2
+
+
+def test_failed_page_is_not_deduplicated_on_retry():
+    scraper = AdvancedThreadedScraper()
+    calls = []
+
+    def parse(component, data):
+        calls.append(list(data[2]))
+        if len(calls) == 1:
+            raise RuntimeError('parse failed')
+        return [{'Ссылка': link} for link in data[2]]
+
+    scraper.parse_page_data = parse
+    with pytest.raises(RuntimeError):
+        scraper.process_page('ram', page(1, 2), 'u1')
+
+    assert scraper.process_page('ram', page(1, 2), 'u1') == [{'Ссылка': href(1)}, {'Ссылка': href(2)}]
+    assert scraper.process_page('ram', page(2, 3), 'u2') == [{'Ссылка': href(3)}]
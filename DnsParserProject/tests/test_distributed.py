@@ -0,0 +1,132 @@
+import sqlite3
+import time
+
+from src.core.distributed import CrawlCoordinator, CrawlWorker, SQLiteTaskBackend
+from src.core.scout import TaskDistributor
+from src.core.thread_manager import AdvancedThreadedScraper
+from src.storage.sink import SQLiteSink, StreamingWriter
+
+BASE_URL = 'https://www.dns-shop.ru/catalog/ram/'
+
+
+def make_backend(tmp_path, **kwargs):
+    backend = SQLiteTaskBackend(str(tmp_path / 'queue.sqlite3'), **kwargs)
+    backend.open('test')
+    return backend
+
+
+def page_urls(count):
+    return TaskDistributor.generate_page_urls(BASE_URL, 1, count)
+
+
+def test_lease_gives_each_page_to_one_worker(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.publish('ram', BASE_URL, page_urls(3))
+
+    leased = [backend.lease(f'w{i}', 60) for i in range(3)]
+
+    assert sorted(task.url for task in leased) == sorted(page_urls(3))
+    assert len({task.task_id for task in leased}) == 3
+    assert backend.lease('w3', 60) is None
+    assert backend.progress() == {'ram': {'leased': 3}}
+
+
+def test_expired_lease_is_redelivered_and_stale_worker_is_ignored(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.publish('ram', BASE_URL, page_urls(1))
+
+    stale = backend.lease('stale', 0.01)
+    time.sleep(0.05)
+    fresh = backend.lease('fresh', 60)
+
+    assert fresh.task_id == stale.task_id
+    assert fresh.attempts == 2
+    # Отметка упавшего работника не возвращает в очередь страницу, выданную другому
+    backend.fail(stale, 'timeout')
+    assert backend.progress() == {'ram': {'leased': 1}}
+
+    backend.complete(fresh, [{'Ссылка': '/product/aaaaaaaa/'}], first_key='aaaaaaaa')
+    backend.complete(stale, [{'Ссылка': '/product/bbbbbbbb/'}], first_key='bbbbbbbb')
+    assert backend.results('ram') == [{'Ссылка': '/product/aaaaaaaa/'}]
+
+
+def test_failed_page_returns_to_queue_until_attempts_run_out(tmp_path):
+    backend = make_backend(tmp_path, max_attempts=2)
+    backend.publish('ram', BASE_URL, page_urls(1))
+
+    backend.fail(backend.lease('w', 60), 'boom')
+    assert backend.progress() == {'ram': {'pending': 1}}
+    backend.fail(backend.lease('w', 60), 'boom')
+    assert backend.progress() == {'ram': {'failed': 1}}
+    assert backend.lease('w', 60) is None
+
+
+def test_coordinator_expires_leases_without_attempts(tmp_path):
+    backend = make_backend(tmp_path, max_attempts=1)
+    backend.publish('ram', BASE_URL, page_urls(1))
+    backend.lease('gone', 0.01)
+    time.sleep(0.05)
+
+    coordinator = CrawlCoordinator(backend, scraper=None, poll_interval=0.01, timeout=5)
+
+    assert coordinator.wait()
+    assert backend.progress() == {'ram': {'failed': 1}}
+
+
+def test_wait_stops_at_deadline(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.publish('ram', BASE_URL, page_urls(1))
+
+    started = time.monotonic()
+    assert not CrawlCoordinator(backend, scraper=None, poll_interval=0.01, timeout=0.1).wait()
+    assert time.monotonic() - started < 2
+
+
+def test_lazy_component_stops_on_repeated_page(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.publish('ram', BASE_URL, page_urls(1), lazy=True)
+
+    backend.complete(backend.lease('w', 60), [{'Ссылка': '/product/aaaaaaaa/'}], first_key='aaaaaaaa')
+    second = backend.lease('w', 60)
+    assert TaskDistributor.page_number(second.url) == 2
+
+    # DNS за концом каталога отдает последнюю страницу еще раз
+    backend.complete(second, [], first_key='aaaaaaaa')
+    assert backend.lease('w', 60) is None
+    assert backend.found_pages('ram') == 1
+
+
+def test_worker_waits_for_new_crawl_and_leaves_when_it_closes(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.close_crawl()
+    worker = CrawlWorker(backend, scraper=None)
+
+    assert not worker._crawl_finished()
+    assert backend.lease('w', 60) is None
+
+    backend.open('next')
+    assert not worker._crawl_finished()
+    assert worker.crawl_id == 'next'
+
+    backend.close_crawl()
+    assert worker._crawl_finished()
+
+
+def test_collect_streams_unique_products_to_writer(tmp_path):
+    backend = make_backend(tmp_path)
+    backend.publish('ram', BASE_URL, page_urls(2))
+    first, second = backend.lease('w', 60), backend.lease('w', 60)
+    backend.complete(first, [{'Название': 'A', 'Ссылка': '/product/aaaaaaaa/'},
+                             {'Название': 'B', 'Ссылка': '/product/bbbbbbbb/'}], first_key='aaaaaaaa')
+    backend.complete(second, [{'Название': 'B', 'Ссылка': '/product/bbbbbbbb/?utm=1'},
+                              {'Название': 'C', 'Ссылка': '/product/cccccccc/'}], first_key='bbbbbbbb')
+    db_path = tmp_path / 'out.sqlite3'
+    scraper = AdvancedThreadedScraper(writer=StreamingWriter(SQLiteSink(str(db_path), mode='append')),
+                                      keep_results=False)
+
+    results = CrawlCoordinator(backend, scraper).collect({'ram': BASE_URL})
+
+    assert results == {'ram': []}
+    with sqlite3.connect(db_path) as conn:
+        names = [name for name, in conn.execute('SELECT "Название" FROM ram ORDER BY rowid')]
+    assert names == ['A', 'B', 'C']
@@ -0,0 +1,142 @@
+import sqlite3
+
+import pytest
+
+from src.core.journal import CrawlJournal
+from src.core.scout import PageCountCache, TaskDistributor
+from src.core.thread_manager import AdvancedThreadedScraper
+from src.storage.sink import DataSink, StreamingWriter
+
+BASE_URL = 'https://www.dns-shop.ru/catalog/ram/'
+
+
+class FakeFetcher:
+    """Страницы с одним товаром до last_page; за концом каталога - пустая страница"""
+
+    def __init__(self, last_page=5, failing=()):
+        self.last_page = last_page
+        self.failing = set(failing)
+        self.pages = []
+
+    def fetch_page(self, url):
+        number = TaskDistributor.page_number(url)
+        self.pages.append(number)
+        if number in self.failing:
+            raise RuntimeError('page failed')
+        if number > self.last_page:
+            return [[], [], []]
+        return [[f'n{number}'], ['1'], [f'https://www.dns-shop.ru/product/{number:08x}/']]
+
+    def close(self):
+        pass
+
+
+class JournaledScraper(AdvancedThreadedScraper):
+    """Обход без браузеров: сессия только сбрасывает журнал нового обхода"""
+
+    def _start_session(self, components_urls, proxies):
+        if not self.resume:
+            self.journal.reset(components_urls)
+
+    def _stop_session(self):
+        pass
+
+    def parse_page_data(self, component, data):
+        return [{'Название': name, 'Ссылка': link} for name, link in zip(data[0], data[2])]
+
+
+def crawl(journal, fetcher, resume, total_pages=None, **kwargs):
+    scraper = JournaledScraper(max_workers=1, max_retries=0, journal=journal, resume=resume, **kwargs)
+    scraper.fetcher = fetcher
+    if total_pages is not None:
+        scraper.discover_pages = lambda component, base_url: (
+            journal.total_pages(component, base_url) if resume else None) or total_pages
+    return scraper.scrape_all({'ram': BASE_URL})
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CrawlJournal(str(tmp_path / 'journal.sqlite3'))
+    yield journal
+    journal.close()
+
+
+def test_done_page_is_not_downgraded_by_late_failure(journal):
+    journal.mark_done('ram', 'u1', [{'Название': 'A'}])
+    journal.mark_failed('ram', 'u1', 'late error')
+    journal.mark_failed('ram', 'u2', 'error')
+
+    assert journal.summary() == {'ram': {'done': 1, 'failed': 1}}
+    assert journal.pending_urls('ram', ['u1', 'u2', 'u3']) == ['u2', 'u3']
+    assert journal.results('ram') == [{'Название': 'A'}]
+
+
+def test_resume_fetches_only_unfinished_pages(journal):
+    first = FakeFetcher(failing={3})
+    crawl(journal, first, resume=False, total_pages=5)
+    assert journal.summary() == {'ram': {'done': 4, 'failed': 1}}
+
+    second = FakeFetcher()
+    results = crawl(journal, second, resume=True, total_pages=5)
+
+    assert second.pages == [3]
+    assert len(results['ram']) == 5
+    assert journal.summary() == {'ram': {'done': 5}}
+
+
+def test_lazy_crawl_resumes_from_furthest_page(journal):
+    def lazy_cache():
+        cache = PageCountCache(ttl=10)
+        cache.put(BASE_URL, 2)
+        cache._entries[BASE_URL]['updated'] -= 100
+        return cache
+
+    crawl(journal, FakeFetcher(failing={4}), resume=False, page_counts=lazy_cache(), lazy_pages=True)
+    assert journal.component_state('ram', BASE_URL) == (4, True)
+
+    second = FakeFetcher()
+    crawl(journal, second, resume=True, page_counts=lazy_cache(), lazy_pages=True)
+
+    assert second.pages == [4, 5, 6]
+    assert journal.component_state('ram', BASE_URL) == (6, True)
+
+
+def test_pages_are_journaled_after_the_sink_writes_them(journal):
+    class Sink(DataSink):
+        def __init__(self, fail):
+            self.fail = fail
+
+        def write(self, component, rows):
+            if self.fail:
+                raise OSError('disk full')
+
+    for fail, expected in ((True, set()), (False, {'u1', 'u2'})):
+        journal.reset()
+        writer = StreamingWriter(Sink(fail))
+        scraper = AdvancedThreadedScraper(writer=writer, journal=journal)
+        writer.start(on_written=scraper.pages_written)
+        scraper.finish_page('ram', [{'Название': 'A'}], 'u1')
+        scraper.finish_page('ram', [], 'u2')
+
+        if fail:
+            with pytest.raises(RuntimeError):
+                writer.close()
+        else:
+            writer.close()
+        assert journal.completed_urls('ram') == expected
+
+
+def test_old_journal_gets_lazy_column(tmp_path):
+    path = tmp_path / 'old.sqlite3'
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE components (component TEXT PRIMARY KEY, base_url TEXT NOT NULL, "
+                     "total_pages INTEGER NOT NULL, updated_at TEXT NOT NULL)")
+        conn.execute("INSERT INTO components VALUES ('ram', ?, 7, '2024-01-01')", (BASE_URL,))
+    conn.close()
+
+    journal = CrawlJournal(str(path))
+    assert journal.component_state('ram', BASE_URL) == (7, False)
+    journal.extend_component('ram', 9)
+    assert journal.total_pages('ram', BASE_URL) == 9
+    assert journal.total_pages('ram', 'https://other/') is None
+    journal.close()
@@ -0,0 +1,97 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from src.core.parse_cache import ParseCache
+from src.core.parse_stage import ParseStage
+
+NAME = ('Оперативная память Kingston FURY Beast Black [KF432C16BBK2/16] 16 ГБ '
+        '[DDR4, 8 ГБx2 шт, {} МГц, 16(CL)-18-18-36]')
+
+
+def page(number, size=3):
+    names = [NAME.format(3000 + number * 10 + i) for i in range(size)]
+    return [names, [f'{1000 + i} ₽' for i in range(size)],
+            [f'https://www.dns-shop.ru/product/{number:04x}{i:04x}/' for i in range(size)]]
+
+
+class Collector:
+    def __init__(self):
+        self.pages = {}
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def on_page(self, component, url, products):
+        with self._lock:
+            self.pages[url] = products
+
+    def on_error(self, component, url, error):
+        with self._lock:
+            self.errors.append((url, error))
+
+
+def finishes(action, timeout=60):
+    thread = threading.Thread(target=action, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+@pytest.fixture
+def stage():
+    collector = Collector()
+    stage = ParseStage(processes=1, chunk_size=4, flush_interval=0.05)
+    stage.start(on_page=collector.on_page, on_error=collector.on_error)
+    stage.collector = collector
+    yield stage
+    finishes(stage.close)
+
+
+def test_pages_match_inline_parsing(stage):
+    pages = {f'u{number}': page(number) for number in range(3)}
+    for url, data in pages.items():
+        stage.submit('ram', url, data)
+    assert finishes(stage.join)
+
+    inline = ParseCache()
+    assert stage.collector.errors == []
+    assert all(len(products) == 3 for products in stage.collector.pages.values())
+    for url, data in pages.items():
+        assert stage.collector.pages[url] == [product for product in inline.parse_page('ram', data) if product]
+    assert stage.stats()['pages'] == 3
+
+
+def test_known_names_are_taken_from_cache(stage):
+    stage.submit('ram', 'first', page(1))
+    assert finishes(stage.join)
+    stage.submit('ram', 'again', page(1))
+    assert finishes(stage.join)
+
+    assert stage.stats()['cached_names'] == 3
+    assert stage.collector.pages['again'] == stage.collector.pages['first']
+
+
+def test_broken_pool_is_replaced(stage):
+    stage.submit('ram', 'before', page(1))
+    assert finishes(stage.join)
+    for process in list(stage._executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+    time.sleep(0.5)
+
+    for number in range(2, 4):
+        stage.submit('ram', f'u{number}', page(number))
+
+    assert finishes(stage.close)
+    assert set(stage.collector.pages) == {'before', 'u2', 'u3'}
+
+
+def test_rejected_chunk_is_reported_and_join_returns(stage):
+    stage._executor.shutdown()
+    stage.submit('ram', 'lost', page(1))
+
+    assert finishes(stage.join)
+    assert [url for url, _ in stage.collector.errors] == ['lost']
+    assert stage.stats()['errors'] == 1
@@ -0,0 +1,136 @@
+import contextlib
+import io
+import math
+import random
+
+import pytest
+
+from src.core.models import (
+    RamDataParser, MotherboardDataParser, CpuCoolerDataParser,
+    CoolingSystemDataParser, CpuDataParser, GpuDataParser
+)
+
+# Реальные названия товаров DNS и ожидаемые характеристики
+SPECS = [
+    (RamDataParser,
+     'Оперативная память Kingston FURY Beast Black [KF432C16BBK2/16] 16 ГБ [DDR4, 8 ГБx2 шт, 3200 МГц, 16(CL)-18-18-36]',
+     {'Название': 'Оперативная память Kingston FURY Beast Black', 'Общий объем (ГБ)': 16.0, 'Тип памяти': 'DDR4',
+      'Размер модуля (ГБ)': 8.0, 'Количество модулей': 2, 'Частота (МГц)': 3200, 'Тайминги': '16-18-18-36',
+      'Латентность (CL)': '16'}),
+    (RamDataParser,
+     'Оперативная память Patriot Signature Line [PSD48G320081] 8 ГБ [DDR4, 8 ГБx1 шт, 3200 МГц, CL22-22-22-52]',
+     {'Название': 'Оперативная память Patriot Signature Line', 'Общий объем (ГБ)': 8.0, 'Тип памяти': 'DDR4',
+      'Размер модуля (ГБ)': 8.0, 'Количество модулей': 1, 'Частота (МГц)': 3200, 'Тайминги': '22-22-22-52',
+      'Латентность (CL)': '22'}),
+    (MotherboardDataParser,
+     'Материнская плата MSI PRO B760M-E DDR4 [LGA 1700, Intel B760, 2xDDR4-3200 МГц, 1xPCI-Ex16, 1xM.2, Micro-ATX]',
+     {'Название': 'Материнская плата MSI PRO B760M-E DDR4', 'Сокет': 'LGA 1700', 'Чипсет': 'Intel B760',
+      'Количество слотов памяти': 2, 'Тип слотов памяти': 'DDR4', 'Частота слотов памяти': '3200 МГц',
+      'Форм-фактор': 'Micro-ATX', 'Количество слотов PCI-E': 1, 'Версия слотов PCI-E': 'x16'}),
+    (CpuCoolerDataParser,
+     'Кулер для процессора DEEPCOOL AG400 [R-AG400-BKNNMN-G-1] [основание - медь, 2000 об/мин, 29.4 дБ, 4 pin, '
+     '220 Вт, 120 мм]',
+     {'Название': 'Кулер для процессора DEEPCOOL AG400', 'Материал основания': 'Медь',
+      'Скорость вращения': '2000 об/мин', 'Уровень шума': '29.4 дБ', 'Разъем питания': '4 pin',
+      'Макс. TDP': '220 Вт', 'Размер вентилятора': '120 мм'}),
+    (CoolingSystemDataParser,
+     'Система охлаждения DEEPCOOL LE360 [R-LE360-BKAMMN-G-1] [120 мм, 3 вентилятор, 3 pin, радиатор - алюминий, '
+     'TDP 300 Вт]',
+     {'Название': 'Система охлаждения DEEPCOOL LE360', 'Размер вентилятора(ов)': '120 мм', 'Количество секций': '1',
+      'Количество вентиляторов': '3', 'Питание': '3 pin', 'Материал радиатора': 'Алюминий', 'TDP': '300 Вт',
+      'Тип охлаждения': 'Воздушное'}),
+    (CoolingSystemDataParser,
+     'Система жидкостного охлаждения ARCTIC Liquid Freezer III 240 [ACFRE00134A] [120 мм, 4 pin, '
+     'радиатор - алюминий]',
+     {'Название': 'Система жидкостного охлаждения ARCTIC Liquid Freezer III 240', 'Размер вентилятора(ов)': '120 мм',
+      'Количество секций': '1', 'Количество вентиляторов': '2', 'Питание': '4 pin', 'Материал радиатора': 'Алюминий',
+      'TDP': 'N/A', 'Тип охлаждения': 'Жидкостное'}),
+    (CpuDataParser,
+     'Процессор AMD Ryzen 5 5600 OEM [AM4, 6 x 3.5 ГГц, L2 - 3 МБ, L3 - 32 МБ, 2 х DDR4-3200 МГц, TDP 65 Вт]',
+     {'Название': 'Процессор AMD Ryzen 5 5600 OEM', 'Сокет': 'AM4', 'Количество ядер': 6, 'Частота (ГГц)': 3.5,
+      'Кэш L2 (МБ)': 3.0, 'Кэш L3 (МБ)': 32.0, 'Количество каналов памяти': 2, 'Графика': '-', 'TDP (Вт)': 65}),
+    (GpuDataParser,
+     'Видеокарта MSI GeForce RTX 4060 VENTUS 2X BLACK OC [RTX 4060 VENTUS 2X BLACK 8G OC] [PCIe 4.0 8 ГБ GDDR6, '
+     '128 бит, 3 x DisplayPort, HDMI, GPU 1830 МГц]',
+     {'Название': 'Видеокарта MSI GeForce RTX 4060 VENTUS 2X BLACK OC', 'Объем памяти (ГБ)': 8.0,
+      'Тип памяти': 'GDDR6', 'Шина памяти (бит)': 128, 'Частота GPU (МГц)': 1830, 'Частота памяти (МГц)': 1830,
+      'Версия PCIe': '4.0', 'Разъемы': 'HDMI, DisplayPort'}),
+    (GpuDataParser,
+     'Видеокарта Palit GeForce GT 1030 [NEC103000646-1082F] [PCIe 3.0 2 ГБ GDDR5, 64 бит, DVI-D, HDMI, GPU 1227 МГц]',
+     {'Название': 'Видеокарта Palit GeForce GT 1030', 'Объем памяти (ГБ)': 2.0, 'Тип памяти': 'GDDR5',
+      'Шина памяти (бит)': 64, 'Частота GPU (МГц)': 1227, 'Частота памяти (МГц)': 1227, 'Версия PCIe': '3.0',
+      'Разъемы': 'DVI, HDMI'}),
+]
+
+
+@pytest.mark.parametrize('parser, name, expected', SPECS, ids=lambda value: getattr(value, '__name__', None))
+def test_real_names(parser, name, expected):
+    product = parser.data_dict_creator([name, '12 999 ₽', 'https://www.dns-shop.ru/product/1/'])
+
+    assert product == {'Название': expected['Название'], 'Цена': '12 999 ₽',
+                       'Ссылка': 'https://www.dns-shop.ru/product/1/', **expected}
+    assert parser.parse_specs([name]) == [{key: value for key, value in product.items()
+                                           if key not in ('Цена', 'Ссылка')}]
+
+
+@pytest.mark.parametrize('name, cooling, fans', [
+    ('Система охлаждения', 'Воздушное', '1'),
+    ('Система охлаждения Noctua NH-D15 [140 мм, 2 вентилятор]', 'Воздушное', '2'),
+    ('СЖО be quiet! Pure Loop 2 360 [BW019] [120 мм, 4 pin]', 'Жидкостное', '3'),
+])
+def test_cooling_system_sets_cooling_type(name, cooling, fans):
+    # Раньше тип охлаждения читался до записи, и разбор любого товара падал с KeyError
+    product = CoolingSystemDataParser.data_dict_creator([name, None, None])
+
+    assert (product['Тип охлаждения'], product['Количество вентиляторов']) == (cooling, fans)
+
+
+def test_name_without_specs():
+    assert CpuDataParser.data_dict_creator(['Процессор неизвестный', None, None]) is None
+    assert GpuDataParser.parse_specs(['Видеокарта']) == [{
+        'Название': 'Видеокарта', 'Объем памяти (ГБ)': 'N/A', 'Тип памяти': 'N/A', 'Шина памяти (бит)': 'N/A',
+        'Частота GPU (МГц)': 'N/A', 'Частота памяти (МГц)': 'N/A', 'Версия PCIe': 'N/A', 'Разъемы': 'N/A'}]
+
+
+# Фрагменты характеристик для смешанных названий: корректные, без совпадений и неразбираемые числа
+TOKENS = ['8 ГБ', '3.2.1 ГБ', 'DDR5', 'ddr4', '3200 МГц', '1.5.5 МГц', '16-18-18-36', 'CL16-18-18-36', '8 ГБx2 шт',
+          '1.2.3 ГБx2 шт', 'LGA 1700', 'AM5', 'Intel Z790', '4xDDR5-6000 МГц', '2xDDR4 МГц', 'Mini-ITX', '2xPCI-Ex16',
+          'основание - медь', '2000 об/мин', '29.4 дБ', '4 pin', '220 Вт', '120 мм', '3 секции', 'SATA Power',
+          'радиатор - алюминий', 'TDP 300 Вт', '3 вентилятор', 'liquid', 'СЖО 360', '6 x 3.5 ГГц', 'L2 - 3 МБ',
+          'L3 - 32 МБ', '2 х DDR4-3200 МГц', 'PCIe 4.0', 'GDDR6', '128 бит', 'HDMI', 'DisplayPort', 'DVI-D', 'VGA',
+          'GPU 1830 МГц', '1.2.3 бит', '']
+
+
+def batch_names(parser, count=300):
+    rng = random.Random(parser.__name__)
+    names = [name for spec_parser, name, _ in SPECS if spec_parser is parser]
+    names += ['Товар без характеристик', 'Товар [] []']
+    for _ in range(count):
+        specs = ', '.join(rng.sample(TOKENS, rng.randint(0, 10)))
+        names.append(f"Товар {rng.choice(['X', 'Y 360', 'Z 240'])} [{rng.choice(TOKENS)}] [{specs}]")
+    return names
+
+
+def normalized(product):
+    return {key: ('NaN' if isinstance(value, float) and math.isnan(value) else value, type(value))
+            for key, value in product.items()}
+
+
+@pytest.mark.parametrize('parser', [RamDataParser, MotherboardDataParser, CpuCoolerDataParser,
+                                    CoolingSystemDataParser, CpuDataParser, GpuDataParser],
+                         ids=lambda parser: parser.__name__)
+def test_parse_batch_matches_row_parsing(parser):
+    names = batch_names(parser)
+    prices = [f'{1000 + i} ₽' for i in range(len(names))]
+    hrefs = [f'https://www.dns-shop.ru/product/{i:08x}/' for i in range(len(names))]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = [parser.data_dict_creator(list(row)) for row in zip(names, prices, hrefs)]
+        specs = parser.parse_specs(names)
+    batch = parser.parse_batch(names, prices, hrefs).to_dict('records')
+
+    # Неразобранные построчно товары (None) в таблицу не попадают, остальные совпадают вплоть до типов
+    assert [normalized(row) for row in rows if row is not None] == [normalized(row) for row in batch]
+    assert specs == [None if row is None else {key: value for key, value in row.items()
+                                               if key not in ('Цена', 'Ссылка')} for row in rows]
+    assert any(row is not None and 'N/A' in row.values() for row in rows)
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from src.storage.saver import SQLDataSaver
+
+
+def product(number, price='12 999 ₽', name=None):
+    return {'Название': name or f'Память {number}', 'Цена': price,
+            'Ссылка': f'https://www.dns-shop.ru/product/{number:08x}/'}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'catalog.sqlite3')
+
+
+def history(db_path):
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT href, price FROM price_history ORDER BY rowid").fetchall()
+    conn.close()
+    return rows
+
+
+def test_upsert_writes_only_new_and_changed_rows(db_path):
+    first = SQLDataSaver.upsert_data([product(1), product(2)], 'ram', db_path)
+    again = SQLDataSaver.upsert_data([product(1), product(2)], 'ram', db_path)
+    changed = SQLDataSaver.upsert_data([product(1, price='11 499 ₽'), product(2, name='Память 2 rev.B'),
+                                        product(3)], 'ram', db_path)
+
+    assert first == {'inserted': 2, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'price_changes': 2}
+    assert again == {'inserted': 0, 'updated': 0, 'unchanged': 2, 'skipped': 0, 'price_changes': 0}
+    assert changed == {'inserted': 1, 'updated': 2, 'unchanged': 0, 'skipped': 0, 'price_changes': 2}
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute('SELECT "Название", "Цена" FROM ram ORDER BY "Ссылка"').fetchall()
+    conn.close()
+    assert rows == [('Память 1', '11 499 ₽'), ('Память 2 rev.B', '12 999 ₽'), ('Память 3', '12 999 ₽')]
+
+
+def test_price_history_ignores_formatting_of_same_price(db_path):
+    SQLDataSaver.upsert_data([product(1, price='12 999 ₽')], 'ram', db_path)
+    stats = SQLDataSaver.upsert_data([product(1, price=12999, name='Память 1 OEM')], 'ram', db_path)
+
+    assert stats['updated'] == 1
+    assert stats['price_changes'] == 0
+    assert history(db_path) == [(product(1)['Ссылка'], 12999)]
+
+
+def test_batch_keeps_last_version_and_skips_rows_without_link(db_path):
+    stats = SQLDataSaver.upsert_data([product(1, price='100'), {'Название': 'без ссылки', 'Цена': '1'},
+                                      product(1, price='200')], 'ram', db_path)
+
+    assert stats['inserted'] == 1
+    assert stats['skipped'] == 1
+    assert history(db_path) == [(product(1)['Ссылка'], 200)]
+
+
+def test_known_rows_are_looked_up_in_chunks(db_path, monkeypatch):
+    monkeypatch.setattr(SQLDataSaver, 'KEY_LOOKUP_CHUNK', 2)
+    SQLDataSaver.upsert_data([product(number) for number in range(5)], 'ram', db_path)
+
+    stats = SQLDataSaver.upsert_data([product(number) for number in range(7)], 'ram', db_path)
+
+    assert stats['unchanged'] == 5
+    assert stats['inserted'] == 2
+
+
+def test_save_data_raises_when_asked(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE VIEW ram AS SELECT 1 AS "Название"')
+    conn.close()
+
+    assert SQLDataSaver.save_data([product(1)], 'ram', db_path, mode='append') == 0
+    with pytest.raises(sqlite3.Error):
+        SQLDataSaver.save_data([product(1)], 'ram', db_path, mode='append', raise_errors=True)
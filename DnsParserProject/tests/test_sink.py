@@ -0,0 +1,96 @@
+import csv
+import sqlite3
+
+import pyarrow.parquet as pq
+import pytest
+
+from src.core.parse_stage import SCORE_KEY
+from src.storage.sink import CSVSink, DataSink, ParquetSink, SQLiteSink, StreamingWriter
+
+
+def product(number, frequency=3200):
+    return {'Название': f'Память {number}', 'Цена': f'{12000 + number} ₽',
+            'Ссылка': f'https://www.dns-shop.ru/product/{number:08x}/',
+            'Общий объем (ГБ)': 16.0, 'Тип памяти': 'DDR4', 'Частота (МГц)': frequency}
+
+
+class RecordingSink(DataSink):
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+        self.closed = False
+
+    def write(self, component, rows):
+        if self.fail:
+            raise OSError('disk full')
+        self.batches.append((component, len(rows)))
+
+    def close(self):
+        self.closed = True
+
+
+def test_writer_batches_rows_per_component():
+    sink = RecordingSink()
+    writer = StreamingWriter(sink, batch_rows=4).start()
+    for number in range(5):
+        writer.put('ram', [product(number * 2), product(number * 2 + 1)])
+    writer.put('cpu', [product(100)])
+    writer.close()
+
+    assert [count for component, count in sink.batches if component == 'ram'] == [4, 4, 2]
+    assert ('cpu', 1) in sink.batches
+    assert sink.closed
+    assert writer.stats()['rows'] == 11
+
+
+def test_writer_failure_is_raised_to_producers_and_on_close():
+    writer = StreamingWriter(RecordingSink(fail=True), batch_rows=1).start()
+    writer.put('ram', [product(1)])
+
+    with pytest.raises(RuntimeError):
+        for number in range(2, 1000):
+            writer.put('ram', [product(number)])
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+def test_sqlite_sink_appends_batches(tmp_path):
+    db_path = tmp_path / 'out.sqlite3'
+    writer = StreamingWriter(SQLiteSink(str(db_path), mode='append'), batch_rows=2).start()
+    writer.put('ram', [product(number) for number in range(5)])
+    writer.close()
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM ram').fetchone() == (5,)
+    conn.close()
+
+
+def test_csv_sink_writes_header_once(tmp_path):
+    for start in (0, 3):
+        sink = CSVSink(str(tmp_path))
+        sink.write('ram', [product(start), product(start + 1)])
+        sink.write('ram', [product(start + 2)])
+        sink.close()
+
+    with open(tmp_path / 'ram.csv', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['Название'] for row in rows] == [f'Память {number}' for number in range(6)]
+
+
+def test_parquet_sink_types_columns_from_record(tmp_path):
+    sink = ParquetSink(str(tmp_path), crawl_date='2024-05-01')
+    # В первом пакете частота неизвестна: тип столбца все равно берется из записи компонента
+    sink.write('ram', [product(1, frequency=None)])
+    sink.write('ram', [{**product(2), SCORE_KEY: 46.6}])
+    sink.close()
+
+    files = list((tmp_path / 'component=ram' / 'crawl_date=2024-05-01').glob('*.parquet'))
+    table = pq.read_table(files[0])
+    types = {field.name: str(field.type) for field in table.schema}
+
+    assert table.num_rows == 2
+    assert types['Цена'] == 'int64'
+    assert types['Частота (МГц)'] == 'int64'
+    assert types['Общий объем (ГБ)'] == 'double'
+    assert types[SCORE_KEY] == 'double'
+    assert table.column('Цена').to_pylist() == [12001, 12002]
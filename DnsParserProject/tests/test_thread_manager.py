@@ -0,0 +1,121 @@
+import pytest
+
+from src.core.async_manager import AsyncScraper
+from src.core.journal import CrawlJournal
+from src.core.scout import PageCountCache, PageScout, TaskDistributor
+from src.core.thread_manager import AdvancedThreadedScraper
+from src.storage.sink import CSVSink
+from src.utils.config import Config, ScraperConfig
+
+BASE_URL = 'https://www.dns-shop.ru/catalog/ram/'
+
+
+class FakeFetcher:
+    """Страницы с одним товаром до last_page; за концом каталога DNS повторяет последнюю"""
+
+    def __init__(self, last_page=3):
+        self.last_page = last_page
+        self.pages = []
+
+    def fetch_page(self, url):
+        number = TaskDistributor.page_number(url) or 1
+        self.pages.append(number)
+        number = min(number, self.last_page)
+        return [[f'n{number}'], ['1'], [f'https://www.dns-shop.ru/product/{number:08x}/']]
+
+    def close(self):
+        pass
+
+
+class OfflineScraper(AdvancedThreadedScraper):
+    """Обход без браузеров и сохранения кэшей"""
+
+    def _start_session(self, components_urls, proxies):
+        self.deduplicator.reset(list(components_urls))
+
+    def _stop_session(self):
+        pass
+
+    def parse_page_data(self, component, data):
+        return [{'Название': name, 'Ссылка': link} for name, link in zip(data[0], data[2])]
+
+
+def test_unknown_page_count_is_not_cached_and_crawl_goes_lazy(monkeypatch):
+    monkeypatch.setattr(PageScout, 'get_total_pages', lambda self, url: None)
+    cache = PageCountCache()
+    scraper = OfflineScraper(max_workers=1, max_retries=0, page_counts=cache)
+    scraper.fetcher = FakeFetcher(last_page=3)
+
+    results = scraper.scrape_all({'ram': BASE_URL})
+
+    assert sorted(scraper.fetcher.pages) == [1, 2, 3, 4]
+    assert len(results['ram']) == 3
+    # В кэш попадает только найденное обходом число страниц
+    assert cache.get(BASE_URL) == 3
+
+
+class FlakyStage:
+    """Стадия разбора без процессов: первая передача каждой страницы завершается ошибкой"""
+
+    def __init__(self):
+        self.parse_cache = None
+        self.attempts = {}
+
+    def start(self, on_page, on_error=None):
+        self.on_page = on_page
+        self.on_error = on_error
+
+    def submit(self, component, url, data):
+        self.attempts[url] = self.attempts.get(url, 0) + 1
+        if self.attempts[url] == 1:
+            self.on_error(component, url, RuntimeError('parse worker died'))
+        else:
+            self.on_page(component, url, [{'Название': name, 'Ссылка': link} for name, link in zip(data[0], data[2])])
+
+    def join(self):
+        pass
+
+    def close(self):
+        pass
+
+    def stats(self):
+        return {}
+
+
+def test_page_failed_in_parse_stage_is_fetched_again():
+    scraper = OfflineScraper(max_workers=1, max_retries=1, parse_stage=FlakyStage())
+    scraper.fetcher = FakeFetcher(last_page=3)
+    scraper.discover_pages = lambda component, base_url: 3
+
+    results = scraper.scrape_all({'ram': BASE_URL})
+
+    assert sorted(scraper.fetcher.pages) == [1, 1, 2, 2, 3, 3]
+    assert len(results['ram']) == 3
+    assert scraper.task_queue.progress['ram'] == {'total': 3, 'done': 3, 'failed': 0, 'retried': 3}
+
+
+def test_from_config_wires_settings(tmp_path):
+    config = ScraperConfig(max_workers=2, max_page_retries=4, rate_burst=5, resume=True,
+                           journal_path=str(tmp_path / 'journal.sqlite3'), page_count_path=str(tmp_path / 'pages.json'),
+                           sink='csv', sink_path=str(tmp_path), parse_processes=1)
+    scraper = AdvancedThreadedScraper.from_config(config)
+    scraper.journal.close()
+
+    assert (scraper.max_workers, scraper.max_retries, scraper.rate_limiter.burst) == (2, 4, 5)
+    assert isinstance(scraper.journal, CrawlJournal) and scraper.resume
+    assert isinstance(scraper.writer.sink, CSVSink)
+    assert scraper.page_counts.path == tmp_path / 'pages.json'
+    assert scraper.parse_stage.parse_cache is scraper.parse_cache
+
+    worker = AdvancedThreadedScraper.from_config(config, journal=None, writer=None, parse_stage=None)
+    assert (worker.journal, worker.writer, worker.parse_stage) == (None, None, None)
+    with pytest.raises(ValueError):
+        AsyncScraper.from_config(config)
+    assert AsyncScraper.from_config(ScraperConfig(max_concurrency=5)).max_concurrency == 5
+
+
+def test_lazy_pages_default_matches_settings():
+    lazy_pages = Config.load_settings()['scraper']['lazy_pages']
+
+    assert ScraperConfig().lazy_pages == lazy_pages
+    assert AdvancedThreadedScraper().lazy_pages == lazy_pages